@@ -0,0 +1,159 @@
+"""
+봇 부팅 단계 실행 및 시간 프로파일링
+경로: boot_profile.py
+
+무거운 의존성 없이 import 되도록 표준 라이브러리만 사용합니다.
+(main.py에서 가장 먼저 import 하여 다른 모듈의 import 시간을 측정)
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class BootProfiler:
+    """부팅 단계(phase) 의존성 실행 + import/단계별 소요 시간 기록"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.imports: List[Tuple[str, float]] = []
+        self.phases: Dict[str, dict] = {}  # {name: {'start', 'end', 'deps', 'error', 'background'}}
+        self.ready_at: Optional[float] = None
+
+    # ========================================
+    # import 시간 측정
+    # ========================================
+
+    @contextmanager
+    def measure_import(self, name: str):
+        """import 블록 소요 시간 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.imports.append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def measure(self, name: str):
+        """동기 단계 소요 시간 측정"""
+        record = self._begin(name, deps=[])
+        try:
+            yield
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            record['end'] = time.perf_counter()
+
+    # ========================================
+    # 단계 실행
+    # ========================================
+
+    def _begin(self, name: str, deps: List[str], background: bool = False) -> dict:
+        record = {
+            'start': time.perf_counter(),
+            'end': None,
+            'deps': deps,
+            'error': None,
+            'background': background
+        }
+        self.phases[name] = record
+        return record
+
+    async def _run_phase(self, name: str, factory: Callable[[], Awaitable], deps: List[str], background: bool = False):
+        record = self._begin(name, deps, background)
+        try:
+            return await factory()
+        except Exception as e:
+            record['error'] = str(e)
+            print(f"⚠️ 부팅 단계 실패 [{name}]: {e}")
+            raise
+        finally:
+            record['end'] = time.perf_counter()
+
+    async def run_phases(self, phases: Dict[str, Tuple[Callable[[], Awaitable], List[str]]]) -> Dict[str, object]:
+        """
+        의존성 순서대로 단계 실행 (의존성이 없는 단계끼리는 병렬)
+
+        Args:
+            phases: {단계명: (코루틴 팩토리, [선행 단계명, ...])}
+
+        Returns:
+            {단계명: 결과} - 실패한 단계는 예외 객체
+
+        선행 단계가 실패하면 해당 단계는 실행하지 않고 같은 예외로 실패 처리됩니다.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(name: str):
+            factory, deps = phases[name]
+            for dep in deps:
+                await tasks[dep]
+            return await self._run_phase(name, factory, deps)
+
+        for name, (_, deps) in phases.items():
+            unknown = [d for d in deps if d not in phases]
+            if unknown:
+                raise ValueError(f"알 수 없는 선행 단계: {name} -> {unknown}")
+
+        for name in phases:
+            tasks[name] = asyncio.create_task(run(name))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return dict(zip(tasks.keys(), results))
+
+    def start_background(self, name: str, factory: Callable[[], Awaitable]) -> asyncio.Task:
+        """준비 완료 후 백그라운드 단계 시작 (완료 시 한 줄 보고)"""
+        async def run():
+            try:
+                return await self._run_phase(name, factory, deps=[], background=True)
+            finally:
+                record = self.phases[name]
+                status = "❌" if record['error'] else "✅"
+                print(f"{status} 백그라운드 단계 [{name}] {record['end'] - record['start']:.2f}초")
+
+        return asyncio.create_task(run(), name=f"boot:{name}")
+
+    def mark_ready(self):
+        """봇 사용 가능 시점 기록"""
+        self.ready_at = time.perf_counter()
+
+    # ========================================
+    # 보고서
+    # ========================================
+
+    def report(self) -> str:
+        """import/단계별 소요 시간 보고서"""
+        lines = ["⏱️ 부팅 프로파일"]
+
+        if self.imports:
+            total_import = sum(sec for _, sec in self.imports)
+            lines.append(f"  📦 import ({total_import:.2f}초)")
+            for name, sec in sorted(self.imports, key=lambda x: x[1], reverse=True):
+                lines.append(f"     {sec:7.3f}초  {name}")
+
+        if self.phases:
+            lines.append("  🧩 단계 (시작 시점 +소요 시간)")
+            for name, record in sorted(self.phases.items(), key=lambda x: x[1]['start']):
+                offset = record['start'] - self.started_at
+                if record['end'] is None:
+                    duration = "진행 중"
+                else:
+                    duration = f"{record['end'] - record['start']:.3f}초"
+
+                tags = []
+                if record['deps']:
+                    tags.append(f"after {', '.join(record['deps'])}")
+                if record['background']:
+                    tags.append("백그라운드")
+                if record['error']:
+                    tags.append(f"실패: {record['error']}")
+                tag_text = f"  ({'; '.join(tags)})" if tags else ""
+
+                lines.append(f"     +{offset:6.2f}초  {duration:>9}  {name}{tag_text}")
+
+        if self.ready_at is not None:
+            lines.append(f"  🚀 준비 완료까지: {self.ready_at - self.started_at:.2f}초")
+
+        return "\n".join(lines)
@@ -17,28 +17,30 @@ import os
 
 # GCP 환경 여부 자동 감지
 def detect_gcp_environment() -> bool:
-    """GCP 환경인지 자동 감지"""
+    """GCP 환경인지 자동 감지 (비용이 싼 확인부터)"""
     # 1. .gcp_environment 파일 존재 여부
     gcp_marker = Path(__file__).parent / '.gcp_environment'
     if gcp_marker.exists():
         return True
-    
-    # 2. GCP 메타데이터 서버 확인
+
+    # 2. 환경 변수 확인
+    if os.getenv('GCP_PROJECT') or os.getenv('GOOGLE_CLOUD_PROJECT'):
+        return True
+
+    # 3. GCP 메타데이터 서버 확인
+    # metadata.google.internal 이름 조회는 소켓 타임아웃과 무관하게 수 초간
+    # import를 막을 수 있으므로 메타데이터 서버의 고정 IP로 바로 연결
     try:
         import socket
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(0.1)
-        result = sock.connect_ex(('metadata.google.internal', 80))
+        result = sock.connect_ex(('169.254.169.254', 80))
         sock.close()
         if result == 0:
             return True
     except:
         pass
-    
-    # 3. 환경 변수 확인
-    if os.getenv('GCP_PROJECT') or os.getenv('GOOGLE_CLOUD_PROJECT'):
-        return True
-    
+
     return False
 
 # 환경 감지
@@ -161,6 +163,167 @@ CONTROL_CHANNEL_ID = None
 # 컨트롤러 봇의 Discord ID (런타임에 설정됨)
 CONTROLLER_BOT_ID = None
 
+# ============================================
+# 🔨 Spigot 빌드 설정
+# ============================================
+
+# 동시에 실행할 BuildTools 수 (빌드 1개당 CPU 1코어 이상, 메모리 1~2GB 사용)
+SPIGOT_BUILD_CONCURRENCY = 1
+
+# 플레이어 접속 중에는 빌드 일시정지
+SPIGOT_BUILD_PAUSE_WHEN_PLAYERS = True
+
+# ============================================
+# 🧹 유지보수 작업 설정 (백업, 서버 복사/삭제)
+# ============================================
+
+# 유지보수 작업은 전용 스레드에서 낮은 CPU/IO 우선순위(nice 19, ionice idle)로 실행
+# 복사/압축 쓰기 속도 제한 (MB/s, None이면 제한 없음)
+MAINTENANCE_RATE_MB = None
+
+# 어느 서버든 접속자가 있으면 이 속도로 감속 (MB/s, None이면 감속 안 함)
+MAINTENANCE_BUSY_RATE_MB = 5
+
+# ============================================
+# 📉 자원 압박(PSI) 감시 설정 (Linux 4.20+)
+# ============================================
+
+# /proc/pressure의 커널 트리거로 CPU/메모리/IO 정지 시간을 감시
+# 메모리/IO 압박이 계속되면 서버 시작 보류, 백업/Spigot 빌드 일시정지
+PSI_MONITOR_ENABLED = True
+
+# 자원별 임계값: 최근 10초 중 하나 이상의 프로세스가 자원을 기다리며 멈춘 시간 비율 (%)
+PSI_MEMORY_THRESHOLD = 10
+PSI_IO_THRESHOLD = 30
+PSI_CPU_THRESHOLD = 80
+
+# 임계값을 이 시간(초) 이상 넘어야 압박으로 판단
+PSI_SUSTAIN_SECONDS = 30
+
+# 모든 프로세스가 메모리를 기다리며 멈춘 시간(full)이 이 비율(%) 이상이면
+# OOM killer가 서버를 죽이기 전에 알림 채널로 경고
+PSI_MEMORY_FULL_THRESHOLD = 5
+
+# ============================================
+# ☕ Java 런타임 설정
+# ============================================
+
+# /usr/lib/jvm, JAVA_HOME, PATH 외에 추가로 찾아볼 JDK 폴더 또는 java 실행 파일
+# 서버별로 bot_config.json의 "java": 17 (주 버전) 또는 "/opt/jdk-21/bin/java" (경로)로 지정 가능
+JAVA_PATHS = []
+
+# ============================================
+# 🔥 시작 전 예열 설정
+# ============================================
+
+# 서버 시작 직전 jar/라이브러리/스폰 주변 region 파일을 페이지 캐시에 미리 올림
+# (부팅 직후 등 디스크 캐시가 비어 있을 때 시작/첫 접속 지연 감소)
+# 서버별로 bot_config.json의 "prewarm": {"enabled": true, "budget_mb": 512}로 변경 가능
+PREWARM_ENABLED = True
+
+# 예열할 최대 크기 (MB)
+PREWARM_BUDGET_MB = 512
+
+# 구동기 + Java 버전별 CDS(클래스 데이터 공유) 아카이브로 JVM 시작 시간 단축 (Java 13+)
+# 처음 시작할 때 학습 실행 후 종료 시 아카이브 생성, 다음 시작부터 사용
+# 서버별로 bot_config.json의 "cds": false로 끌 수 있음
+APPCDS_ENABLED = True
+
+# ============================================
+# 🧮 메모리 예산 설정
+# ============================================
+
+# 서버들에 줄 수 있는 총 메모리 (MB, None이면 전체 메모리 - HOST_MEMORY_RESERVE_MB)
+# 서버 시작 시 실행/시작 중인 서버의 예약량(-Xmx + 힙 외 메모리)을 합산해서 넘으면 거절
+HOST_MEMORY_BUDGET_MB = None
+
+# OS/봇용으로 남겨둘 메모리 (MB)
+HOST_MEMORY_RESERVE_MB = 1024
+
+# ============================================
+# 📦 cgroup 격리 설정 (Linux cgroup v2)
+# ============================================
+
+# 서버마다 별도 cgroup에서 실행 (제한 값은 서버별 bot_config.json의 "cgroup")
+# "auto": 사용자 systemd가 있으면 systemd-run --user --scope, 없으면 CGROUP_ROOT 직접 사용
+# "systemd" / "cgroupfs" / "off"
+CGROUP_MODE = "auto"
+
+# cgroupfs 모드에서 서버 cgroup을 만들 위치 (봇 사용자에게 위임된 cgroup, None이면 사용 안 함)
+# 예: "/sys/fs/cgroup/minecraft.slice"
+CGROUP_ROOT = None
+
+# ============================================
+# 🚦 서버 시작 큐 설정
+# ============================================
+
+# 자동 시작(bot_config.json의 "autostart": true) / /전체시작 때 동시에 부팅할 서버 수
+# 앞 서버가 접속 가능해지거나 디스크 I/O가 잠잠해지면 다음 서버 시작
+# 순서는 bot_config.json의 "start_priority" (낮을수록 먼저, 기본 100)
+START_QUEUE_CONCURRENCY = 1
+
+# ============================================
+# 💥 크래시 감지 / 자동 재시작 설정
+# ============================================
+
+# 중지 요청 없이 서버가 종료되면 자동 재시작 (서버별로 bot_config.json의 "auto_restart": false로 끌 수 있음)
+# 재시작 대기는 10초부터 2배씩 (최대 5분)
+AUTO_RESTART_ENABLED = True
+
+# CRASH_LOOP_WINDOW_MINUTES분 안에 이 횟수를 넘게 죽으면 자동 재시작 중단
+CRASH_RESTART_MAX = 3
+CRASH_LOOP_WINDOW_MINUTES = 10
+
+# 장애 알림을 보낼 디스코드 채널 ID (None이면 콘솔에만 출력)
+ALERT_CHANNEL_ID = None
+
+# ============================================
+# 🧊 응답 없음(행) 감지 설정
+# ============================================
+
+# 30초마다 상태 조회(SLP)/RCON 응답 + 틱 진행 확인
+HANG_WATCHDOG_ENABLED = True
+
+# 연속으로 이 횟수만큼 응답이 없고 틱이 멈추면 행으로 판단
+HANG_FAILURES = 3
+
+# 행 감지 시 조치: "restart" (스레드 덤프 후 강제 재시작) / "dump" (스레드 덤프만)
+# 덤프는 서버 폴더의 diagnostics/에 저장 (jcmd 필요 - JDK 설치)
+HANG_ACTION = "restart"
+
+# 스레드 덤프와 함께 힙 정보(GC.heap_info)도 수집
+HANG_HEAP_INFO = False
+
+# ============================================
+# 🎥 프로파일링 설정 (/프로파일)
+# ============================================
+
+# JFR 기록 보관 개수 / 총 용량 (MB) - 넘으면 오래된 것부터 삭제 (logs/profiles/)
+PROFILE_MAX_RECORDINGS = 20
+PROFILE_MAX_TOTAL_MB = 500
+
+# ============================================
+# 🐌 랙 감지 설정
+# ============================================
+
+# 서버 로그의 "Can't keep up!"이 LAG_SPIKE_WINDOW초 안에 LAG_SPIKE_COUNT회 이상이면 랙 장애로 기록
+# 장애 시 spark(설치된 경우) 또는 JFR로 LAG_PROFILE_SECONDS초 프로파일링 후 알림 채널로 요약 전송
+LAG_DETECTION_ENABLED = True
+LAG_SPIKE_COUNT = 3
+LAG_SPIKE_WINDOW = 120
+LAG_PROFILE_SECONDS = 30
+
+# 같은 서버의 랙 장애 최소 간격 (분)
+LAG_INCIDENT_COOLDOWN_MINUTES = 15
+
+# ============================================
+# ⏱️ 시작 시간 회귀 감지 설정
+# ============================================
+
+# 시작(Done 줄까지)이 최근 시작들의 중앙값보다 이 비율 이상 느려지면 알림 채널로 알림
+# 플러그인/모드별 로딩 시간 중 가장 많이 늘어난 항목과 직전 업그레이드/플러그인 추가 내역을 함께 보냄
+STARTUP_REGRESSION_THRESHOLD = 0.25
+
 # ============================================
 # 📋 수동 서버 설정 (선택사항)
 # ============================================
@@ -191,7 +354,7 @@ STATUS_CHECK_INTERVAL = 30
 # 플레이어 활동 로그
 LOG_PLAYER_ACTIVITY = True
 
-# 성능 모니터링 (CPU, 메모리)
+# 성능 모니터링 (CPU, 메모리, JVM 힙/GC - 30초 간격 기록)
 PERFORMANCE_MONITORING = True
 
 # ============================================
@@ -3,52 +3,117 @@
 메인 서버에서 실행
 """
 
-import discord
-from discord.ext import commands, tasks
+from boot_profile import BootProfiler
+
+# 부팅 프로파일러 (다른 모듈 import 시간 측정을 위해 가장 먼저 생성)
+profiler = BootProfiler()
+
+with profiler.measure_import("discord"):
+    import discord
+    from discord.ext import commands, tasks
 import signal
 import sys
 import os
 import asyncio
 from datetime import datetime
+from pathlib import Path
 
 # 설정 파일 import
-from config import (
-    TOKEN,
-    BOT_OWNER_ID,
-    BASE_PATH,
-    SERVERS_DIR,
-    AUTO_SCAN_SERVERS,
-    MINECRAFT_SERVERS,
-    DEFAULT_TERMINAL_MODE,
-    DEFAULT_MIN_MEMORY,
-    DEFAULT_MAX_MEMORY,
-    REQUIRED_PERMISSION,
-    # 자동 종료 설정
-    ENABLE_AUTO_SHUTDOWN,
-    EMPTY_SERVER_TIMEOUT,
-    AUTO_SHUTDOWN_WARNING_TIME,
-    AUTO_STOP_INSTANCE,
-    AUTO_SHUTDOWN_INSTANCE,
-    GCP_CREDENTIALS_FILE,
-    # GCP 환경 설정
-    IS_GCP_ENVIRONMENT,
-    ENABLE_GCP_CONTROL,
-    GCP_INSTANCE_NAME,
-)
+with profiler.measure_import("config"):
+    from config import (
+        TOKEN,
+        BOT_OWNER_ID,
+        BASE_PATH,
+        SERVERS_DIR,
+        AUTO_SCAN_SERVERS,
+        MINECRAFT_SERVERS,
+        DEFAULT_TERMINAL_MODE,
+        DEFAULT_MIN_MEMORY,
+        DEFAULT_MAX_MEMORY,
+        REQUIRED_PERMISSION,
+        # 자동 종료 설정
+        ENABLE_AUTO_SHUTDOWN,
+        EMPTY_SERVER_TIMEOUT,
+        AUTO_SHUTDOWN_WARNING_TIME,
+        AUTO_STOP_INSTANCE,
+        AUTO_SHUTDOWN_INSTANCE,
+        GCP_CREDENTIALS_FILE,
+        # GCP 환경 설정
+        IS_GCP_ENVIRONMENT,
+        ENABLE_GCP_CONTROL,
+        GCP_INSTANCE_NAME,
+        # 모니터링 설정
+        PERFORMANCE_MONITORING,
+    )
+
+    # 이후 추가된 설정 (기존 config.py에 없으면 config.example.py 기본값)
+    import config as bot_config
+    # Spigot 빌드 설정
+    SPIGOT_BUILD_CONCURRENCY = getattr(bot_config, 'SPIGOT_BUILD_CONCURRENCY', 1)
+    SPIGOT_BUILD_PAUSE_WHEN_PLAYERS = getattr(bot_config, 'SPIGOT_BUILD_PAUSE_WHEN_PLAYERS', True)
+    # 유지보수 작업 설정
+    MAINTENANCE_RATE_MB = getattr(bot_config, 'MAINTENANCE_RATE_MB', None)
+    MAINTENANCE_BUSY_RATE_MB = getattr(bot_config, 'MAINTENANCE_BUSY_RATE_MB', 5)
+    # 자원 압박(PSI) 감시 설정
+    PSI_MONITOR_ENABLED = getattr(bot_config, 'PSI_MONITOR_ENABLED', True)
+    PSI_MEMORY_THRESHOLD = getattr(bot_config, 'PSI_MEMORY_THRESHOLD', 10)
+    PSI_IO_THRESHOLD = getattr(bot_config, 'PSI_IO_THRESHOLD', 30)
+    PSI_CPU_THRESHOLD = getattr(bot_config, 'PSI_CPU_THRESHOLD', 80)
+    PSI_SUSTAIN_SECONDS = getattr(bot_config, 'PSI_SUSTAIN_SECONDS', 30)
+    PSI_MEMORY_FULL_THRESHOLD = getattr(bot_config, 'PSI_MEMORY_FULL_THRESHOLD', 5)
+    # 시작 전 예열 설정
+    PREWARM_ENABLED = getattr(bot_config, 'PREWARM_ENABLED', True)
+    PREWARM_BUDGET_MB = getattr(bot_config, 'PREWARM_BUDGET_MB', 512)
+    APPCDS_ENABLED = getattr(bot_config, 'APPCDS_ENABLED', True)
+    # 메모리 예산 설정
+    HOST_MEMORY_BUDGET_MB = getattr(bot_config, 'HOST_MEMORY_BUDGET_MB', None)
+    HOST_MEMORY_RESERVE_MB = getattr(bot_config, 'HOST_MEMORY_RESERVE_MB', 1024)
+    # cgroup 격리 설정
+    CGROUP_MODE = getattr(bot_config, 'CGROUP_MODE', "auto")
+    CGROUP_ROOT = getattr(bot_config, 'CGROUP_ROOT', None)
+    # 서버 시작 큐 설정
+    START_QUEUE_CONCURRENCY = getattr(bot_config, 'START_QUEUE_CONCURRENCY', 1)
+    # 크래시 감지 설정
+    AUTO_RESTART_ENABLED = getattr(bot_config, 'AUTO_RESTART_ENABLED', True)
+    CRASH_RESTART_MAX = getattr(bot_config, 'CRASH_RESTART_MAX', 3)
+    CRASH_LOOP_WINDOW_MINUTES = getattr(bot_config, 'CRASH_LOOP_WINDOW_MINUTES', 10)
+    ALERT_CHANNEL_ID = getattr(bot_config, 'ALERT_CHANNEL_ID', None)
+    # 행 감지 설정
+    HANG_WATCHDOG_ENABLED = getattr(bot_config, 'HANG_WATCHDOG_ENABLED', True)
+    HANG_FAILURES = getattr(bot_config, 'HANG_FAILURES', 3)
+    HANG_ACTION = getattr(bot_config, 'HANG_ACTION', "restart")
+    HANG_HEAP_INFO = getattr(bot_config, 'HANG_HEAP_INFO', False)
+    # 프로파일링 설정
+    PROFILE_MAX_RECORDINGS = getattr(bot_config, 'PROFILE_MAX_RECORDINGS', 20)
+    PROFILE_MAX_TOTAL_MB = getattr(bot_config, 'PROFILE_MAX_TOTAL_MB', 500)
+    # 랙 감지 설정
+    LAG_DETECTION_ENABLED = getattr(bot_config, 'LAG_DETECTION_ENABLED', True)
+    LAG_SPIKE_COUNT = getattr(bot_config, 'LAG_SPIKE_COUNT', 3)
+    LAG_SPIKE_WINDOW = getattr(bot_config, 'LAG_SPIKE_WINDOW', 120)
+    LAG_PROFILE_SECONDS = getattr(bot_config, 'LAG_PROFILE_SECONDS', 30)
+    LAG_INCIDENT_COOLDOWN_MINUTES = getattr(bot_config, 'LAG_INCIDENT_COOLDOWN_MINUTES', 15)
+    # 시작 시간 회귀 감지 설정
+    STARTUP_REGRESSION_THRESHOLD = getattr(bot_config, 'STARTUP_REGRESSION_THRESHOLD', 0.25)
+    # Java 런타임 설정
+    JAVA_PATHS = getattr(bot_config, 'JAVA_PATHS', [])
 
 # 유틸리티 함수 import
-from utils import is_authorized, ConfigManager
+with profiler.measure_import("utils"):
+    from utils import is_authorized, ConfigManager
 
 # 마인크래프트 모듈 import
-from modules.minecraft import (
-    ServerManager,
-    ServerScanner,
-    ServerConfigurator,
-    ServerCoreManager,
-    ServerLifecycleManager,
-    setup_commands as setup_mc_commands,
-    setup_lifecycle_commands
-)
+with profiler.measure_import("modules.minecraft"):
+    from modules.minecraft import (
+        ServerManager,
+        ServerScanner,
+        ServerConfigurator,
+        ServerCoreManager,
+        ServerLifecycleManager,
+        JavaRuntimeManager,
+        PressureMonitor,
+        setup_commands as setup_mc_commands,
+        setup_lifecycle_commands
+    )
 
 
 class MinecraftBot(commands.Bot):
@@ -59,25 +124,48 @@ class MinecraftBot(commands.Bot):
         intents.message_content = True
         super().__init__(command_prefix='!', intents=intents)
         
-        # 구동기 관리자 초기화
-        self.core_manager = ServerCoreManager(BASE_PATH)
-        print("구동기 관리자 초기화")
-        
-        # 서버 생명주기 관리자 초기화
-        self.lifecycle_manager = ServerLifecycleManager(SERVERS_DIR, self.core_manager)
-        print("생명주기 관리자 초기화")
-        
-        # 서버 설정 준비
-        servers_config = self._prepare_servers()
-        
-        # 서버 매니저 초기화
-        self.mc = ServerManager(
-            bot=self,
-            base_path=str(BASE_PATH),
-            servers_config=servers_config,
-            default_server=self._get_default_server(servers_config)
-        )
-        
+        self.profiler = profiler
+
+        with self.profiler.measure("init_managers"):
+            # 구동기 관리자 초기화
+            self.core_manager = ServerCoreManager(BASE_PATH)
+            self.core_manager.spigot_builder.max_concurrent = SPIGOT_BUILD_CONCURRENCY
+            
+            # Java 런타임 (서버 스캔 시 탐색, 사전 설치/빌드도 같은 목록 사용)
+            self.java_runtimes = JavaRuntimeManager(
+                cache_file=self.core_manager.cores_dir / 'java_runtimes.json',
+                extra_paths=JAVA_PATHS
+            )
+            self.core_manager.modded_installer.java_runtimes = self.java_runtimes
+            self.core_manager.spigot_builder.java_runtimes = self.java_runtimes
+            if SPIGOT_BUILD_PAUSE_WHEN_PLAYERS:
+                self.core_manager.spigot_builder.players_online = self.count_online_players
+            print("구동기 관리자 초기화")
+
+            # 서버 생명주기 관리자 초기화
+            self.lifecycle_manager = ServerLifecycleManager(SERVERS_DIR, self.core_manager)
+            self.lifecycle_manager.maintenance.rate_mb = MAINTENANCE_RATE_MB
+            self.lifecycle_manager.maintenance.busy_rate_mb = MAINTENANCE_BUSY_RATE_MB
+            self.lifecycle_manager.maintenance.players_online = self.count_online_players
+            print("생명주기 관리자 초기화")
+
+            # 자원 압박(PSI) 감시 - 시작 승인, 유지보수 작업, Spigot 빌드가 참고
+            self.pressure = PressureMonitor(
+                thresholds={'cpu': PSI_CPU_THRESHOLD, 'memory': PSI_MEMORY_THRESHOLD, 'io': PSI_IO_THRESHOLD},
+                sustain=PSI_SUSTAIN_SECONDS,
+                memory_full_threshold=PSI_MEMORY_FULL_THRESHOLD
+            )
+            self.pressure.enabled = PSI_MONITOR_ENABLED
+            self.pressure.notify = self.post_pressure_warning
+            self.core_manager.spigot_builder.pressure = self.pressure
+            self.lifecycle_manager.maintenance.pressure = self.pressure
+
+        # 서버 매니저 (setup_hook의 scan_servers 단계에서 초기화)
+        self.mc = None
+
+        # 준비 완료 후 실행되는 백그라운드 작업 {이름: asyncio.Task}
+        self.background_tasks = {}
+
         # 전체 유휴 상태 추적 추가
         self.all_servers_idle_since = None  # 모든 서버가 꺼진 시간
 
@@ -139,7 +227,7 @@ class MinecraftBot(commands.Bot):
                 default_max_memory=DEFAULT_MAX_MEMORY
             )
             
-            scanner = ServerScanner(SERVERS_DIR, configurator)
+            scanner = ServerScanner(SERVERS_DIR, configurator, self.java_runtimes)
             servers = scanner.scan_all_servers()
             
             print(scanner.get_server_summary(servers))
@@ -147,6 +235,10 @@ class MinecraftBot(commands.Bot):
             for server_id, config in servers.items():
                 if 'terminal_mode' not in config:
                     config['terminal_mode'] = DEFAULT_TERMINAL_MODE
+                prewarm = config.setdefault('prewarm', {})
+                prewarm.setdefault('enabled', PREWARM_ENABLED)
+                prewarm.setdefault('budget_mb', PREWARM_BUDGET_MB)
+                config.setdefault('cds', APPCDS_ENABLED)
             
             return servers
         else:
@@ -173,36 +265,361 @@ class MinecraftBot(commands.Bot):
     async def cleanup_and_exit(self):
         """정리 작업 후 종료"""
         try:
-            await self.mc.cleanup_on_shutdown()
+            if self.mc:
+                await self.mc.cleanup_on_shutdown()
         except Exception as e:
             print(f"정리 중 오류: {e}")
         finally:
             await self.close()
             sys.exit(0)
-    
+
     async def setup_hook(self):
-        """봇 시작 시 슬래시 명령어 등록 및 동기화"""
-        # 구동기 자동 업데이트
-        print("\n구동기 업데이트 시작...")
-        await self.core_manager.update_all_cores()
-        print("구동기 업데이트 완료\n")
-        
-        setup_mc_commands(self)
-        setup_lifecycle_commands(self)
+        """
+        봇 시작 단계 실행
+
+        서로 의존하지 않는 단계는 병렬로 실행하고,
+        구동기 업데이트/백업 정리는 봇 준비 완료 후 백그라운드로 미룹니다.
+        """
+        phases = {
+            'register_commands': (self._phase_register_commands, []),
+            'scan_servers': (self._phase_scan_servers, []),
+            'tree_sync': (self._phase_tree_sync, ['register_commands']),
+        }
+
+        results = await self.profiler.run_phases(phases)
+
+        # 서버 매니저 없이는 봇이 동작할 수 없음
+        if isinstance(results['scan_servers'], Exception):
+            raise results['scan_servers']
 
-        print(f"등록된 명령어 수: {len(self.tree.get_commands())}")
-        
-        await self.tree.sync()
-        print("슬래시 명령어 동기화 완료")
-        
-        # 백업 정리
-        await self.lifecycle_manager.cleanup_old_backups()
-        
         # 자동 종료 모니터링 시작
         if ENABLE_AUTO_SHUTDOWN:
             self.check_empty_servers.start()
             print(f"자동 종료 모니터링 시작 (대기: {EMPTY_SERVER_TIMEOUT}분)")
+
+        # 리소스(CPU/메모리/GC) 기록 시작
+        if PERFORMANCE_MONITORING:
+            self.sample_resources.start()
+
+        # 비정상 종료 감지 시작 (자동 재시작이 꺼져 있어도 죽은 세션 정리 + 알림)
+        self.supervise_servers.start()
+
+        # 응답 없음(행) 감지 시작
+        if HANG_WATCHDOG_ENABLED:
+            self.watch_hangs.start()
+
+        # 랙 스파이크 감지 시작
+        if LAG_DETECTION_ENABLED:
+            self.watch_lag.start()
+
+        # 자원 압박(PSI) 감시 시작 (커널 트리거, 별도 스레드)
+        self.pressure.start()
+
+    async def _phase_register_commands(self):
+        """슬래시 명령어 등록 (명령어는 실행 시점에 bot.mc를 참조)"""
+        setup_mc_commands(self)
+        setup_lifecycle_commands(self)
+        print(f"등록된 명령어 수: {len(self.tree.get_commands())}")
+
+    async def _phase_tree_sync(self):
+        """슬래시 명령어 동기화"""
+        await self.tree.sync()
+        print("슬래시 명령어 동기화 완료")
+
+    async def _phase_scan_servers(self):
+        """서버 스캔 + 서버 매니저 초기화 (파일/포트/프로세스 확인은 스레드에서)"""
+        def build_server_manager():
+            servers_config = self._prepare_servers()
+            return ServerManager(
+                bot=self,
+                base_path=str(BASE_PATH),
+                servers_config=servers_config,
+                default_server=self._get_default_server(servers_config)
+            )
+
+        self.mc = await asyncio.to_thread(build_server_manager)
+        self.mc.admission.host_budget_mb = HOST_MEMORY_BUDGET_MB
+        self.mc.admission.reserve_mb = HOST_MEMORY_RESERVE_MB
+        self.mc.maintenance = self.lifecycle_manager.maintenance
+        self.mc.admission.pressure = self.pressure
+        self.mc.cgroups.mode = CGROUP_MODE
+        self.mc.cgroups.root = Path(CGROUP_ROOT) if CGROUP_ROOT else None
+        self.mc.start_queue.max_concurrent = START_QUEUE_CONCURRENCY
+        self.mc.supervisor.auto_restart = AUTO_RESTART_ENABLED
+        self.mc.supervisor.max_restarts = CRASH_RESTART_MAX
+        self.mc.supervisor.loop_window = CRASH_LOOP_WINDOW_MINUTES * 60
+        self.mc.supervisor.notify = self.post_crash_incident
+        self.mc.watchdog.failures = HANG_FAILURES
+        self.mc.watchdog.action = HANG_ACTION
+        self.mc.watchdog.heap_info = HANG_HEAP_INFO
+        self.mc.watchdog.notify = self.post_hang_incident
+        self.mc.jfr.max_recordings = PROFILE_MAX_RECORDINGS
+        self.mc.jfr.max_total_mb = PROFILE_MAX_TOTAL_MB
+        self.mc.lag_detector.spike_count = LAG_SPIKE_COUNT
+        self.mc.lag_detector.window = LAG_SPIKE_WINDOW
+        self.mc.lag_detector.profile_seconds = LAG_PROFILE_SECONDS
+        self.mc.lag_detector.cooldown = LAG_INCIDENT_COOLDOWN_MINUTES * 60
+        self.mc.lag_detector.notify = self.post_lag_incident
+        self.mc.startup_analyzer.threshold = STARTUP_REGRESSION_THRESHOLD
+        self.mc.startup_analyzer.notify = self.post_startup_regression
+
+    def _start_background_phases(self):
+        """준비 완료 후 백그라운드 작업 시작 (최초 1회)"""
+        if self.background_tasks:
+            return
+
+        async def update_cores():
+            job, _ = self.core_manager.start_update_job()
+            await job.task
+
+        self.background_tasks['update_cores'] = self.profiler.start_background(
+            'update_cores', update_cores
+        )
+        self.background_tasks['cleanup_backups'] = self.profiler.start_background(
+            'cleanup_backups', self.lifecycle_manager.cleanup_old_backups
+        )
+        self.background_tasks['autostart'] = self.profiler.start_background(
+            'autostart', self._autostart_servers
+        )
+
+        async def report_when_done():
+            await asyncio.gather(*self.background_tasks.values(), return_exceptions=True)
+            print("\n" + self.profiler.report() + "\n")
+
+        asyncio.create_task(report_when_done())
+
+    async def _autostart_servers(self):
+        """bot_config.json에 autostart가 켜진 서버를 시작 큐로 차례대로 시작"""
+        server_ids = [
+            server_id for server_id, config in self.mc.servers_config.items()
+            if config.get('autostart')
+        ]
+        if not server_ids:
+            return
+
+        job = self.mc.start_queue.submit(server_ids, reason="자동 시작")
+        await self.mc.start_queue.wait(job)
+        print("\n" + self.mc.start_queue.format_report(job) + "\n")
     
+    async def count_online_players(self) -> int:
+        """실행 중인 모든 서버의 접속자 수 합계"""
+        if not self.mc:
+            return 0
+
+        # screen -ls/포트 확인은 블로킹 → 스레드에서
+        running = await asyncio.to_thread(
+            lambda: [sid for sid in self.mc.get_all_server_ids() if self.mc.is_server_running(sid)]
+        )
+        statuses = await asyncio.gather(*[self.mc.get_server_status(sid) for sid in running])
+
+        return sum(
+            status['players']['online']
+            for status in statuses
+            if status and status.get('online')
+        )
+
+    @tasks.loop(seconds=30)
+    async def sample_resources(self):
+        """실행 중인 서버의 CPU/메모리/GC 지표 수집 (hsperfdata, 스레드에서)"""
+        try:
+            await asyncio.to_thread(self.mc.sampler.sample_all)
+        except Exception as e:
+            print(f"⚠️ 리소스 수집 오류: {e}")
+
+    @tasks.loop(seconds=5)
+    async def supervise_servers(self):
+        """서버 비정상 종료 감지 (크래시 → 자동 재시작)"""
+        try:
+            await self.mc.supervisor.check()
+        except Exception as e:
+            print(f"⚠️ 크래시 감지 오류: {e}")
+
+    async def send_alert(self, content: str = None, embed: discord.Embed = None):
+        """장애 알림 채널로 전송 (ALERT_CHANNEL_ID 미설정 시 무시)"""
+        if not ALERT_CHANNEL_ID:
+            return
+        channel = self.get_channel(ALERT_CHANNEL_ID)
+        if channel is None:
+            channel = await self.fetch_channel(ALERT_CHANNEL_ID)
+        await channel.send(content=content, embed=embed)
+
+    async def post_crash_incident(self, incident: dict):
+        """크래시 장애 알림 (장애당 한 번)"""
+        actions = {
+            'restart': f"🔁 {incident.get('restart_delay')}초 후 자동 재시작",
+            'circuit_open': "⛔ 반복 크래시로 자동 재시작 중단 - 수동으로 시작해주세요",
+            'none': "자동 재시작 꺼짐"
+        }
+        embed = discord.Embed(
+            title=f"💥 {incident['name']} 서버 비정상 종료",
+            description=f"```\n{incident['signature'][:1000]}\n```",
+            color=discord.Color.red()
+        )
+        embed.add_field(name="시그니처", value=f"`{incident['signature_id']}`", inline=True)
+        embed.add_field(
+            name="실행 시간",
+            value=self.mc.supervisor.format_uptime(incident['uptime_seconds']),
+            inline=True
+        )
+        embed.add_field(
+            name="최근 크래시",
+            value=f"{CRASH_LOOP_WINDOW_MINUTES}분 내 {incident['recent_crashes']}회",
+            inline=True
+        )
+        embed.add_field(name="조치", value=actions[incident['action']], inline=False)
+        if incident['crash_report']:
+            embed.add_field(name="크래시 리포트", value=f"`crash-reports/{incident['crash_report']}`", inline=False)
+        if incident['log_tail']:
+            tail = "\n".join(incident['log_tail'][-8:])[-900:]
+            embed.add_field(name="latest.log", value=f"```\n{tail}\n```", inline=False)
+        embed.set_footer(text=f"기록: {incident['bundle']}")
+
+        await self.send_alert(embed=embed)
+
+    @tasks.loop(seconds=30)
+    async def watch_hangs(self):
+        """서버 응답 없음(행) 감지 (스레드 덤프 → 재시작)"""
+        try:
+            await self.mc.watchdog.check()
+        except Exception as e:
+            print(f"⚠️ 행 감지 오류: {e}")
+
+    async def post_hang_incident(self, incident: dict):
+        """행 장애 알림"""
+        embed = discord.Embed(
+            title=f"🧊 {incident['name']} 서버 응답 없음",
+            description=(
+                f"상태 조회/RCON {incident['failures']}회 연속 무응답, "
+                f"틱 정지 ({'게임 시간' if incident['tick_source'] == 'gametime' else '메인 스레드 CPU'})"
+            ),
+            color=discord.Color.dark_blue()
+        )
+        embed.add_field(
+            name="실행 시간",
+            value=self.mc.supervisor.format_uptime(incident['uptime_seconds']),
+            inline=True
+        )
+        embed.add_field(
+            name="조치",
+            value="🔁 강제 재시작" if incident['action'] == 'restart' else "📄 덤프만 수집",
+            inline=True
+        )
+        if incident['suspect']:
+            embed.add_field(name="🔎 메인 스레드 원인 후보", value=f"`{incident['suspect']}`", inline=False)
+        if incident['files']:
+            embed.add_field(name="진단 파일", value="\n".join(f"`{f}`" for f in incident['files']), inline=False)
+        elif incident['method'] == 'sigquit':
+            embed.add_field(name="진단 파일", value="jcmd 실패 - 스레드 덤프를 서버 콘솔에 출력 (SIGQUIT)", inline=False)
+
+        await self.send_alert(embed=embed)
+
+    @tasks.loop(seconds=10)
+    async def watch_lag(self):
+        """서버 로그의 랙 스파이크 감지"""
+        try:
+            await self.mc.lag_detector.check()
+        except Exception as e:
+            print(f"⚠️ 랙 감지 오류: {e}")
+
+    async def post_lag_incident(self, incident: dict):
+        """랙 장애 요약 알림 (서버별 LAG_INCIDENT_COOLDOWN_MINUTES분에 한 번)"""
+        embed = discord.Embed(
+            title=f"🐌 {incident['name']} 서버 랙 발생",
+            description=(
+                f"{LAG_SPIKE_WINDOW}초 안에 \"Can't keep up!\" {incident['spikes']}회 "
+                f"(최대 {incident['behind_ms_max']}ms, 총 {incident['ticks_skipped']}틱 밀림)"
+            ),
+            color=discord.Color.gold()
+        )
+        players = f"{incident['players']}명" if incident['players'] is not None else "알 수 없음"
+        if incident['player_names']:
+            players += f"\n{', '.join(incident['player_names'][:10])}"
+        embed.add_field(name="👥 접속자", value=players, inline=True)
+        if incident['entities'] is not None:
+            embed.add_field(
+                name="🐄 엔티티",
+                value=f"{incident['entities']}개" + (f" (아이템 {incident['items']}개)" if incident['items'] is not None else ""),
+                inline=True
+            )
+        if incident['recent_commands']:
+            embed.add_field(
+                name="⌨️ 최근 명령어",
+                value="\n".join(f"`{c}`" for c in incident['recent_commands'])[:1024],
+                inline=False
+            )
+        if incident['profile_url']:
+            embed.add_field(name="🔥 spark 프로파일", value=incident['profile_url'], inline=False)
+        elif incident['profile_file']:
+            embed.add_field(name="🎥 JFR 기록", value=f"`{incident['profile_file']}`", inline=False)
+        else:
+            embed.add_field(name="프로파일", value=f"수집 실패 ({incident['profiler'] or '없음'})", inline=False)
+
+        await self.send_alert(embed=embed)
+
+    async def post_startup_regression(self, server_id: str, regression: dict):
+        """시작 시간 회귀 알림 (늘어난 구성 요소 + 직전 변경 내역)"""
+        config = self.mc.get_server_config(server_id) or {}
+        analyzer = self.mc.startup_analyzer
+        embed = discord.Embed(
+            title=f"🐢 {config.get('name', server_id)} 서버 시작이 느려졌습니다",
+            description=(
+                f"최근 시작 중앙값 {regression['baseline']:.1f}초 → 이번 {regression['seconds']:.1f}초 "
+                f"(+{regression['increase_percent']:.0f}%)"
+            ),
+            color=discord.Color.orange()
+        )
+        if regression['grown']:
+            embed.add_field(
+                name="📈 늘어난 항목",
+                value="\n".join(
+                    f"{analyzer.component_label(name)}: +{seconds:.0f}초" for name, seconds in regression['grown']
+                ),
+                inline=False
+            )
+        if regression['changes']:
+            kinds = {'upgrade': '업그레이드', 'plugin': '플러그인 추가'}
+            embed.add_field(
+                name="🔧 직전 변경",
+                value="\n".join(
+                    f"{c['at'][:16].replace('T', ' ')} {kinds.get(c['kind'], c['kind'])}: {c['detail']}"
+                    for c in regression['changes'][-5:]
+                ),
+                inline=False
+            )
+
+        await self.send_alert(embed=embed)
+
+    async def post_pressure_warning(self, warning: dict):
+        """메모리 압박 경고 (OOM killer가 서버를 고르기 전에)"""
+        memory = warning['memory']
+        embed = discord.Embed(
+            title="🧯 메모리 압박 경고",
+            description=(
+                f"메모리 대기로 멈춘 시간: some {memory['some10']:.0f}% / full {memory['full10']:.0f}% (최근 10초)\n"
+                + ("모든 프로세스가 메모리를 기다리며 멈추고 있습니다. 곧 OOM killer가 서버를 종료할 수 있습니다."
+                   if warning['full'] else f"{PSI_SUSTAIN_SECONDS}초 넘게 메모리 회수가 계속되고 있습니다.")
+            ),
+            color=discord.Color.red() if warning['full'] else discord.Color.orange()
+        )
+        if warning['io']:
+            embed.add_field(name="💽 IO", value=f"some {warning['io']['some10']:.0f}%", inline=True)
+
+        if self.mc:
+            usage = []
+            for server_id in self.mc.get_all_server_ids():
+                sample = self.mc.sampler.latest(server_id) if self.mc.is_process_running(server_id) else None
+                if sample:
+                    usage.append((sample['rss_mb'], server_id))
+            if usage:
+                embed.add_field(
+                    name="🖥️ 서버 메모리 (RSS)",
+                    value="\n".join(f"{sid}: {rss:.0f}MB" for rss, sid in sorted(usage, reverse=True)[:8]),
+                    inline=False
+                )
+        embed.set_footer(text="서버 시작은 압박이 풀릴 때까지 보류되고 백업/빌드는 일시정지됩니다")
+
+        await self.send_alert(embed=embed)
+
     @tasks.loop(minutes=1)
     async def check_empty_servers(self):
         """서버 비어있는지 주기적으로 확인 (타임아웃 처리 개선)"""
@@ -475,6 +892,12 @@ class MinecraftBot(commands.Bot):
         print("💡 Discord에서 /서버목록 을 입력하여 서버를 확인하세요")
         print("💡 /서버생성 으로 새 서버를 만들 수 있습니다!")
         print("="*60 + "\n")
+
+        # 최초 준비 완료 시에만 (재연결로 인한 on_ready 재호출 무시)
+        if self.profiler.ready_at is None:
+            self.profiler.mark_ready()
+            print(self.profiler.report() + "\n")
+            self._start_background_phases()
     
     async def on_error(self, event, *args, **kwargs):
         """에러 처리"""
@@ -494,8 +917,25 @@ class MinecraftBot(commands.Bot):
         # 자동 종료 모니터링 중지
         if hasattr(self, 'check_empty_servers') and self.check_empty_servers.is_running():
             self.check_empty_servers.cancel()
-        
-        await self.mc.cleanup_on_shutdown()
+        if self.sample_resources.is_running():
+            self.sample_resources.cancel()
+        if self.supervise_servers.is_running():
+            self.supervise_servers.cancel()
+        if self.watch_hangs.is_running():
+            self.watch_hangs.cancel()
+        if self.watch_lag.is_running():
+            self.watch_lag.cancel()
+        self.pressure.close()
+
+        # 백그라운드 부팅 작업 취소 (구동기 업데이트 등)
+        for task in self.background_tasks.values():
+            if not task.done():
+                task.cancel()
+
+        await self.core_manager.close()
+
+        if self.mc:
+            await self.mc.cleanup_on_shutdown()
         await super().close()
 
 
@@ -0,0 +1,327 @@
+"""
+구동기/플러그인 jar 내용 주소(SHA-256) 저장소
+경로: modules/minecraft/BlobStore.py
+
+- 같은 내용의 jar는 저장소에 한 번만 보관 (.blobs/ab/abcdef...)
+- 저장소 등록은 reflink 또는 복사 (저장소만의 inode, 항상 읽기 전용)
+- 서버 폴더 배포: reflink(FICLONE) → 하드링크 → 복사 순으로 시도 (하드링크는 읽기 전용 blob에서만)
+- 어떤 서버/구동기 목록에서도 참조하지 않는 blob은 정리(GC) 가능
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
+from pathlib import Path
+from typing import Dict, Iterable
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class BlobStore:
+    """SHA-256 기반 jar 저장소"""
+
+    FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # 해시 캐시: {경로: [크기, mtime_ns, inode, sha256]} - 같은 파일 재해시 방지
+        self.index_file = self.root / 'index.json'
+        self._index: Dict[str, list] = self._load_index()
+        self._lock = threading.Lock()
+
+        # 등록/배포/GC 직렬화 (has() 확인 후 배포 전에 GC가 blob을 지우지 않게)
+        self.store_lock = threading.RLock()
+
+        # 배포 방식 통계
+        self.stats = {'reflink': 0, 'hardlink': 0, 'copy': 0}
+
+    # ========================================
+    # 해시 캐시
+    # ========================================
+
+    def _load_index(self) -> Dict[str, list]:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        try:
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"⚠️ blob 해시 캐시 저장 실패: {e}")
+
+    @classmethod
+    def _hash_file(cls, path: Path) -> str:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def digest_of(self, path: Path) -> str:
+        """파일 SHA-256 (크기/mtime/inode가 같으면 캐시 사용)"""
+        st = path.stat()
+        key = str(path.resolve())
+
+        with self._lock:
+            cached = self._index.get(key)
+            if cached and cached[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+                return cached[3]
+
+        digest = self._hash_file(path)
+
+        with self._lock:
+            self._index[key] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+            self._save_index()
+
+        return digest
+
+    # ========================================
+    # 저장 / 배포
+    # ========================================
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def ingest(self, path: Path) -> str:
+        """
+        파일을 저장소에 등록 (이미 있으면 건너뜀)
+
+        Returns:
+            SHA-256
+        """
+        digest = self.digest_of(path)
+        blob = self.blob_path(digest)
+
+        with self.store_lock:
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_name(blob.name + '.tmp')
+                if tmp.exists():
+                    tmp.unlink()
+                # 원본과 inode를 공유하지 않도록 하드링크 없이 등록
+                if not self._reflink(path, tmp):
+                    shutil.copyfile(path, tmp)
+                # 서버 폴더와 하드링크로 공유되므로 실수로 덮어쓰지 않게 읽기 전용
+                os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                os.replace(tmp, blob)
+
+        return digest
+
+    def has(self, digest: str) -> bool:
+        return self.blob_path(digest).exists()
+
+    def add_stream(self, fileobj, digest: str) -> int:
+        """
+        스트림을 저장소에 추가 (SHA-256 검증 후 등록)
+
+        Returns:
+            기록한 바이트 수
+
+        Raises:
+            ValueError: 해시 불일치
+        """
+        blob = self.blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.{threading.get_ident()}.tmp")
+
+        h = hashlib.sha256()
+        size = 0
+        with open(tmp, 'wb') as f:
+            for chunk in iter(lambda: fileobj.read(self.CHUNK_SIZE), b''):
+                h.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if h.hexdigest() != digest.lower():
+            tmp.unlink()
+            raise ValueError(f"SHA-256 불일치 ({digest[:12]}…)")
+
+        os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        with self.store_lock:
+            os.replace(tmp, blob)
+        return size
+
+    def _reflink(self, src: Path, dst: Path) -> bool:
+        """FICLONE ioctl (btrfs/XFS 등 CoW 파일시스템)"""
+        if fcntl is None:
+            return False
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), self.FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            dst.unlink(missing_ok=True)
+            return False
+
+    def _clone(self, src: Path, dst: Path) -> str:
+        """reflink → 하드링크 → 복사, 사용한 방식 반환"""
+        if self._reflink(src, dst):
+            return 'reflink'
+        try:
+            os.link(src, dst)
+            return 'hardlink'
+        except OSError:
+            shutil.copyfile(src, dst)
+            return 'copy'
+
+    def deploy(self, src: Path, dest: Path) -> str:
+        """
+        jar를 저장소에 등록한 뒤 서버 폴더로 배포 (기존 파일은 원자적으로 교체)
+
+        Args:
+            src: 원본 jar (구동기/플러그인 목록의 파일)
+            dest: 서버 폴더 안의 대상 경로
+
+        Returns:
+            배포 방식 ('reflink' | 'hardlink' | 'copy')
+        """
+        with self.store_lock:
+            return self.deploy_blob(self.ingest(src), dest)
+
+    def deploy_blob(self, digest: str, dest: Path) -> str:
+        """저장소의 blob을 대상 경로로 배포 (reflink → 하드링크 → 복사)"""
+        blob = self.blob_path(digest)
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.deploy")
+        if tmp.exists():
+            tmp.unlink()
+
+        with self.store_lock:
+            mode = self._clone(blob, tmp)
+        os.replace(tmp, dest)
+
+        self.stats[mode] += 1
+        return mode
+
+    def clone_tree(self, src_dir: Path, dest_dir: Path, keep_existing: bool = False) -> dict:
+        """
+        사전 설치된 서버 트리 배포 (jar는 저장소를 거쳐 reflink/하드링크, 그 외 파일은 복사)
+
+        설정/스크립트 같은 작은 파일은 서버마다 수정될 수 있으므로 항상 복사합니다.
+
+        Args:
+            keep_existing: 대상에 이미 있는 jar 외 파일은 건너뜀 (업그레이드 시 user_jvm_args.txt 등 보존)
+
+        Returns:
+            배포 방식별 파일 수
+        """
+        counts = {'reflink': 0, 'hardlink': 0, 'copy': 0}
+
+        for src in src_dir.rglob('*'):
+            if src.is_dir():
+                continue
+            dest = dest_dir / src.relative_to(src_dir)
+            if keep_existing and src.suffix != '.jar' and dest.exists():
+                continue
+
+            if src.suffix == '.jar':
+                counts[self.deploy(src, dest)] += 1
+                continue
+
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if dest.exists():
+                dest.unlink()
+            shutil.copy2(src, dest)
+            counts['copy'] += 1
+            self.stats['copy'] += 1
+
+        return counts
+
+    # ========================================
+    # 정리
+    # ========================================
+
+    def _iter_blobs(self):
+        for sub in self.root.iterdir():
+            if sub.is_dir() and len(sub.name) == 2:
+                for blob in sub.iterdir():
+                    if blob.is_file() and not blob.name.endswith('.tmp'):
+                        yield blob
+
+    def collect_garbage(self, referenced_files: Iterable[Path], dry_run: bool = False) -> dict:
+        """
+        참조되지 않는 blob 삭제
+
+        Args:
+            referenced_files: 살아 있는 jar 파일들 (서버 폴더 + 구동기/플러그인 목록)
+            dry_run: True면 삭제하지 않고 집계만
+
+        Returns:
+            {'kept', 'removed', 'freed'}
+        """
+        with self.store_lock:
+            return self._collect_garbage(referenced_files, dry_run)
+
+    def _collect_garbage(self, referenced_files: Iterable[Path], dry_run: bool) -> dict:
+        blobs = list(self._iter_blobs())
+
+        # 하드링크로 배포된 파일은 inode만 비교 (해시 불필요)
+        by_inode = {}
+        for blob in blobs:
+            st = blob.stat()
+            by_inode[(st.st_dev, st.st_ino)] = blob.name
+
+        referenced = set()
+        live_keys = set()
+        for path in referenced_files:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            live_keys.add(str(path.resolve()))
+            digest = by_inode.get((st.st_dev, st.st_ino))
+            if digest is None:
+                digest = self.digest_of(path)
+            referenced.add(digest)
+
+        removed = 0
+        freed = 0
+        for blob in blobs:
+            if blob.name in referenced:
+                continue
+            size = blob.stat().st_size
+            if not dry_run:
+                blob.unlink()
+            removed += 1
+            freed += size
+
+        # 사라진 파일의 해시 캐시 항목 정리
+        if not dry_run:
+            with self._lock:
+                self._index = {k: v for k, v in self._index.items() if k in live_keys}
+                self._save_index()
+
+        return {'kept': len(blobs) - removed, 'removed': removed, 'freed': freed}
+
+    def digests(self) -> set:
+        """보유한 blob 해시 목록"""
+        return {blob.name for blob in self._iter_blobs()}
+
+    def get_usage(self) -> dict:
+        """저장소 사용량 {'blobs', 'bytes'}"""
+        count = 0
+        total = 0
+        for blob in self._iter_blobs():
+            count += 1
+            total += blob.stat().st_size
+        return {'blobs': count, 'bytes': total}
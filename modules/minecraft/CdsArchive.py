@@ -0,0 +1,164 @@
+"""
+AppCDS(클래스 데이터 공유) 아카이브 관리
+경로: modules/minecraft/CdsArchive.py
+
+서버 시작마다 Paper/Forge jar의 클래스 수천 개를 읽고 검증하는 시간을 줄이기 위해
+구동기 jar + Java 버전별로 동적 CDS 아카이브를 한 번 만들어 재사용합니다. (Java 13+)
+
+1. 아카이브가 없으면 학습 실행: -XX:ArchiveClassesAtExit=<임시 파일>
+   (서버가 종료될 때 JVM이 로드한 클래스를 기록)
+2. 다음 시작 때 임시 파일을 아카이브로 승격하고 -XX:SharedArchiveFile=<아카이브>로 실행
+
+아카이브 이름에 jar SHA-256과 Java 버전이 들어가므로 구동기 교체나 Java 변경 시 자동으로 새로 만듭니다.
+클래스패스가 맞지 않는 아카이브는 JVM이 무시하고 일반 시작합니다 (-Xshare:auto).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class CdsArchiveManager:
+    """구동기 + Java 버전별 CDS 아카이브"""
+
+    MIN_JAVA = 13  # 동적 아카이브(ArchiveClassesAtExit) 지원 버전
+    MAX_UNUSED_DAYS = 30
+
+    def __init__(self, cds_dir: Path):
+        # 서버 폴더에서 실행되는 JVM에 넘기므로 절대 경로
+        self.cds_dir = cds_dir.resolve()
+        self.cds_dir.mkdir(parents=True, exist_ok=True)
+
+        # 아카이브 정보: {key: {'source', 'java', 'sha256', 'created_at', 'last_used', 'size'}}
+        self.index_file = self.cds_dir / 'index.json'
+        self.index: Dict[str, dict] = self._load_index()
+
+        # 학습 중인 아카이브: {key: server_id}
+        self.training: Dict[str, str] = {}
+
+        # jar 해시 캐시: {경로: (크기, mtime_ns, sha256)}
+        self._digests: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _load_index(self) -> Dict[str, dict]:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        try:
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"⚠️ CDS 인덱스 저장 실패: {e}")
+
+    def _digest(self, path: Path) -> str:
+        st = path.stat()
+        key = str(path.resolve())
+        cached = self._digests.get(key)
+        if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self._digests[key] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    @staticmethod
+    def _source_file(server_path: Path, config: dict) -> Optional[Path]:
+        """아카이브 기준 파일 (서버 jar, 없으면 Forge 실행 인자 파일)"""
+        if config.get('jar_file'):
+            return server_path / config['jar_file']
+        for arg in config.get('launch_args') or []:
+            if arg.startswith('@'):
+                return server_path / arg[1:]
+        return None
+
+    def _archive_path(self, key: str) -> Path:
+        return self.cds_dir / f"{key}.jsa"
+
+    def _pending_path(self, key: str, server_id: str) -> Path:
+        return self.cds_dir / f"{key}.{server_id}.training"
+
+    def prepare(self, server_id: str, config: dict, java_version: Optional[int]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        시작 전 CDS 옵션 결정 (블로킹 - jar 해시 계산)
+
+        Returns:
+            (모드 'use' | 'train' | None, JVM 옵션, 아카이브 키)
+        """
+        if not java_version or java_version < self.MIN_JAVA:
+            return None, None, None
+
+        server_path = Path(config['path'])
+        source = self._source_file(server_path, config)
+        if not source or not source.exists():
+            return None, None, None
+
+        with self._lock:
+            digest = self._digest(source)
+            key = f"{digest[:16]}-java{java_version}"
+            archive = self._archive_path(key)
+
+            # 지난 학습 실행 결과 승격 (JVM이 종료하면서 기록한 파일)
+            pending = self._pending_path(key, server_id)
+            if pending.exists():
+                if self.training.get(key) == server_id:
+                    del self.training[key]
+                if pending.stat().st_size > 0 and not archive.exists():
+                    os.replace(pending, archive)
+                    self.index[key] = {
+                        'source': source.name,
+                        'core_type': config.get('core_type'),
+                        'java': java_version,
+                        'sha256': digest,
+                        'created_at': time.time(),
+                        'size': archive.stat().st_size
+                    }
+                    print(f"   📦 CDS 아카이브 생성됨: {key} ({archive.stat().st_size / 1024 / 1024:.0f}MB)")
+                else:
+                    pending.unlink()
+
+            if archive.exists():
+                entry = self.index.setdefault(key, {'source': source.name, 'java': java_version, 'sha256': digest})
+                entry['last_used'] = time.time()
+                self._prune(keep=key)
+                self._save_index()
+                return 'use', f"-XX:SharedArchiveFile={archive}", key
+
+            # 같은 구동기를 다른 서버가 학습 중이면 이번에는 CDS 없이 시작
+            if key in self.training and self.training[key] != server_id:
+                return None, None, key
+
+            self.training[key] = server_id
+            return 'train', f"-XX:ArchiveClassesAtExit={pending}", key
+
+    def _prune(self, keep: str):
+        """오래 사용하지 않은 아카이브 삭제 (구동기 교체/Java 변경으로 더 이상 맞지 않는 것)"""
+        cutoff = time.time() - self.MAX_UNUSED_DAYS * 86400
+        for key in list(self.index.keys()):
+            if key == keep:
+                continue
+            entry = self.index[key]
+            if entry.get('last_used', entry.get('created_at', 0)) < cutoff:
+                self._archive_path(key).unlink(missing_ok=True)
+                del self.index[key]
+                print(f"   🧹 CDS 아카이브 삭제 (미사용): {key}")
+
+    def get_usage(self) -> dict:
+        """아카이브 수/용량"""
+        archives = list(self.cds_dir.glob('*.jsa'))
+        return {'archives': len(archives), 'bytes': sum(a.stat().st_size for a in archives)}
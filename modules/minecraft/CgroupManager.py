@@ -0,0 +1,311 @@
+"""
+서버별 cgroup v2 격리
+경로: modules/minecraft/CgroupManager.py
+
+모든 JVM이 같은 VM에서 아무 제한 없이 돌면 서버 하나(또는 백업 압축)가 나머지를 굶길 수 있습니다.
+서버마다 별도 cgroup에서 실행하고 bot_config.json의 "cgroup" 값으로 제한합니다.
+
+    "cgroup": {
+        "cpu_weight": 100,          # cpu.weight (1~10000, 기본 100)
+        "cpu_max_percent": 200,     # cpu.max (코어 1개 = 100)
+        "memory_high_mb": 6144,     # memory.high (넘으면 회수 압박)
+        "memory_max_mb": 7168,      # memory.max (넘으면 OOM)
+        "io_weight": 100,           # io.weight (1~10000)
+        "cpus": "0-1"               # CPU 고정 (taskset)
+    }
+
+- systemd: `systemd-run --user --scope`로 실행 (사용자 systemd가 cgroup 위임)
+- cgroupfs: CGROUP_ROOT 아래 폴더를 직접 만들고 시작된 JVM을 옮김 (쓰기 권한 필요)
+- CPU 고정은 taskset으로 실행 전에 적용 (JVM이 사용 가능한 CPU 수로 GC 스레드 수를 정함)
+- cpu.stat / memory.current / memory.events / io.stat를 ResourceSampler 기록에 포함
+"""
+
+import asyncio
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CGROUP_FS = Path('/sys/fs/cgroup')
+PREFIX = 'minecraft-'
+
+
+class CgroupManager:
+    """서버 cgroup 생성/제한/사용량 조회"""
+
+    def __init__(self, mode: str = 'auto', root: Optional[str] = None):
+        """
+        Args:
+            mode: 'auto' | 'systemd' | 'cgroupfs' | 'off'
+            root: cgroupfs 모드에서 서버 cgroup을 만들 위치 (위임받은 cgroup 경로)
+        """
+        self.mode = mode
+        self.root = Path(root) if root else None
+
+        self._resolved: Optional[str] = None
+        self._previous: Dict[str, tuple] = {}  # {cgroup 경로: (시각, cpu usec, throttled usec, 읽기, 쓰기)}
+
+    # ========================================
+    # 모드 확인
+    # ========================================
+
+    @staticmethod
+    def _unit_name(server_id: str) -> str:
+        return PREFIX + re.sub(r'[^A-Za-z0-9_.-]', '_', server_id)
+
+    def _systemd_available(self) -> bool:
+        """사용자 systemd로 scope를 만들 수 있는지 (한 번 시험 실행)"""
+        if not shutil.which('systemd-run'):
+            return False
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or f'/run/user/{os.getuid()}'
+        if not (Path(runtime_dir) / 'systemd').exists():
+            return False
+        try:
+            completed = subprocess.run(
+                ['systemd-run', '--user', '--scope', '--quiet', 'true'],
+                capture_output=True, timeout=10
+            )
+            return completed.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+
+    def _cgroupfs_available(self) -> bool:
+        return bool(self.root) and self.root.is_dir() and os.access(self.root, os.W_OK)
+
+    def resolve(self) -> str:
+        """실제 사용할 모드 ('systemd' | 'cgroupfs' | 'off', 블로킹 - 처음 한 번 확인)"""
+        if self._resolved is not None:
+            return self._resolved
+
+        resolved = 'off'
+        if self.mode != 'off' and (CGROUP_FS / 'cgroup.controllers').exists():
+            if self.mode in ('auto', 'systemd') and self._systemd_available():
+                resolved = 'systemd'
+            elif self.mode in ('auto', 'cgroupfs') and self._cgroupfs_available():
+                resolved = 'cgroupfs'
+            else:
+                print(f"⚠️ cgroup 격리 사용 불가 (모드: {self.mode}) - 제한 없이 실행합니다")
+
+        self._resolved = resolved
+        return resolved
+
+    # ========================================
+    # 제한
+    # ========================================
+
+    @staticmethod
+    def limits(config: dict) -> dict:
+        """서버 설정의 cgroup 값 (없는 항목은 제한 없음)"""
+        raw = config.get('cgroup') or {}
+        limits = {}
+        for key in ('cpu_weight', 'cpu_max_percent', 'memory_high_mb', 'memory_max_mb', 'io_weight'):
+            if raw.get(key) is not None:
+                limits[key] = int(raw[key])
+        if raw.get('cpus'):
+            limits['cpus'] = str(raw['cpus'])
+        return limits
+
+    @staticmethod
+    def _systemd_properties(limits: dict) -> List[str]:
+        properties = []
+        if 'cpu_weight' in limits:
+            properties.append(f"CPUWeight={limits['cpu_weight']}")
+        if 'cpu_max_percent' in limits:
+            properties.append(f"CPUQuota={limits['cpu_max_percent']}%")
+        if 'memory_high_mb' in limits:
+            properties.append(f"MemoryHigh={limits['memory_high_mb']}M")
+        if 'memory_max_mb' in limits:
+            properties.append(f"MemoryMax={limits['memory_max_mb']}M")
+        if 'io_weight' in limits:
+            properties.append(f"IOWeight={limits['io_weight']}")
+        return properties
+
+    @staticmethod
+    def _cgroup_files(limits: dict) -> Dict[str, str]:
+        files = {}
+        if 'cpu_weight' in limits:
+            files['cpu.weight'] = str(limits['cpu_weight'])
+        if 'cpu_max_percent' in limits:
+            files['cpu.max'] = f"{limits['cpu_max_percent'] * 1000} 100000"
+        if 'memory_high_mb' in limits:
+            files['memory.high'] = str(limits['memory_high_mb'] * 1024 * 1024)
+        if 'memory_max_mb' in limits:
+            files['memory.max'] = str(limits['memory_max_mb'] * 1024 * 1024)
+        if 'io_weight' in limits:
+            files['io.weight'] = f"default {limits['io_weight']}"
+        return files
+
+    def scope_args(self, name: str, limits: dict) -> List[str]:
+        """
+        명령어 앞에 붙일 인자 (systemd scope + CPU 고정, 블로킹)
+
+        서버 외 작업(빌드, 백업 등)도 같은 방식으로 낮은 가중치 scope에서 실행할 수 있음
+        """
+        args = []
+        if self.resolve() == 'systemd':
+            args += ['systemd-run', '--user', '--scope', '--quiet', '--collect', f'--unit={name}']
+            for prop in self._systemd_properties(limits):
+                args += ['-p', prop]
+            args.append('--')
+        if limits.get('cpus') and shutil.which('taskset'):
+            args += ['taskset', '-c', limits['cpus']]
+        return args
+
+    def wrap_command(self, server_id: str, config: dict, command: str) -> str:
+        """서버 시작 명령어를 cgroup scope로 감싸기 (블로킹)"""
+        args = self.scope_args(f"{self._unit_name(server_id)}-{int(time.time())}", self.limits(config))
+        if not args:
+            return command
+        return f"{shlex.join(args)} bash -c {shlex.quote(command)}"
+
+    def _prepare_cgroupfs(self, server_id: str, limits: dict) -> Path:
+        """서버 cgroup 폴더 생성 + 제한 기록"""
+        with open(self.root / 'cgroup.controllers', 'r') as f:
+            available = f.read().split()
+        wanted = [c for c in ('cpu', 'memory', 'io') if c in available]
+        if wanted:
+            with open(self.root / 'cgroup.subtree_control', 'w') as f:
+                f.write(' '.join(f'+{c}' for c in wanted))
+
+        path = self.root / self._unit_name(server_id)
+        path.mkdir(exist_ok=True)
+        for name, value in self._cgroup_files(limits).items():
+            try:
+                (path / name).write_text(value)
+            except OSError as e:
+                print(f"⚠️ [{server_id}] {name} 설정 실패: {e}")
+        return path
+
+    async def attach(self, server_id: str, config: dict, find_process) -> Tuple[bool, str]:
+        """
+        cgroupfs 모드: 시작된 JVM을 서버 cgroup으로 이동 (systemd 모드는 이미 scope 안에서 실행)
+
+        Args:
+            find_process: server_id → psutil.Process | None (JVM이 뜰 때까지 재시도)
+        """
+        if await asyncio.to_thread(self.resolve) != 'cgroupfs':
+            return True, "이동 불필요"
+
+        for _ in range(30):
+            process = await asyncio.to_thread(find_process, server_id)
+            if process:
+                break
+            await asyncio.sleep(1)
+        else:
+            return False, "JVM 프로세스를 찾지 못했습니다"
+
+        try:
+            path = await asyncio.to_thread(self._prepare_cgroupfs, server_id, self.limits(config))
+            await asyncio.to_thread((path / 'cgroup.procs').write_text, str(process.pid))
+        except OSError as e:
+            return False, f"cgroup 이동 실패: {e}"
+
+        print(f"   📦 [{server_id}] cgroup 적용: {path}")
+        return True, str(path)
+
+    # ========================================
+    # 사용량
+    # ========================================
+
+    @staticmethod
+    def cgroup_path(pid: int) -> Optional[Path]:
+        """프로세스가 속한 cgroup v2 경로"""
+        try:
+            with open(f'/proc/{pid}/cgroup', 'r') as f:
+                for line in f:
+                    if line.startswith('0::'):
+                        return CGROUP_FS / line[3:].strip().lstrip('/')
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _read_keyed(path: Path) -> Dict[str, int]:
+        values = {}
+        try:
+            for line in path.read_text().splitlines():
+                key, _, value = line.partition(' ')
+                if value.strip().isdigit():
+                    values[key] = int(value)
+        except OSError:
+            pass
+        return values
+
+    @staticmethod
+    def _read_io(path: Path) -> Tuple[int, int]:
+        """io.stat 전체 장치 합산 (읽기, 쓰기 바이트)"""
+        read = written = 0
+        try:
+            for line in path.read_text().splitlines():
+                fields = dict(item.split('=', 1) for item in line.split()[1:] if '=' in item)
+                read += int(fields.get('rbytes', 0))
+                written += int(fields.get('wbytes', 0))
+        except (OSError, ValueError):
+            pass
+        return read, written
+
+    def stats(self, pid: int) -> Optional[dict]:
+        """
+        서버 cgroup 사용량 (블로킹, 서버 전용 cgroup이 아니면 None)
+
+        Returns:
+            {'path', 'cpu_percent', 'throttled_percent', 'nr_throttled', 'memory_mb', 'memory_high_mb',
+             'memory_max_mb', 'memory_high_events', 'oom_kills', 'io_read_mb_s', 'io_write_mb_s'}
+            (비율/속도는 직전 조회 대비, 첫 조회는 None)
+        """
+        path = self.cgroup_path(pid)
+        if not path or not path.name.startswith(PREFIX):
+            return None
+
+        cpu = self._read_keyed(path / 'cpu.stat')
+        events = self._read_keyed(path / 'memory.events')
+        io_read, io_write = self._read_io(path / 'io.stat')
+
+        def limit_mb(name: str) -> Optional[float]:
+            try:
+                value = (path / name).read_text().strip()
+            except OSError:
+                return None
+            return int(value) / 1024 / 1024 if value.isdigit() else None
+
+        try:
+            memory = int((path / 'memory.current').read_text().strip())
+        except (OSError, ValueError):
+            memory = 0
+
+        now = time.time()
+        current = (now, cpu.get('usage_usec', 0), cpu.get('throttled_usec', 0), io_read, io_write)
+        previous = self._previous.get(str(path))
+        self._previous[str(path)] = current
+
+        result = {
+            'path': str(path),
+            'cpu_percent': None,
+            'throttled_percent': None,
+            'nr_throttled': cpu.get('nr_throttled', 0),
+            'memory_mb': memory / 1024 / 1024,
+            'memory_high_mb': limit_mb('memory.high'),
+            'memory_max_mb': limit_mb('memory.max'),
+            'memory_high_events': events.get('high', 0),
+            'oom_kills': events.get('oom_kill', 0),
+            'io_read_mb_s': None,
+            'io_write_mb_s': None
+        }
+        if previous and now > previous[0]:
+            elapsed = now - previous[0]
+            result['cpu_percent'] = (current[1] - previous[1]) / 1e6 / elapsed * 100
+            result['throttled_percent'] = (current[2] - previous[2]) / 1e6 / elapsed * 100
+            result['io_read_mb_s'] = (io_read - previous[3]) / 1024 / 1024 / elapsed
+            result['io_write_mb_s'] = (io_write - previous[4]) / 1024 / 1024 / elapsed
+        return result
+
+    def forget_missing(self, pids: List[int]):
+        """종료된 서버의 직전 값 정리"""
+        alive = {str(p) for p in (self.cgroup_path(pid) for pid in pids) if p}
+        for key in list(self._previous.keys()):
+            if key not in alive:
+                del self._previous[key]
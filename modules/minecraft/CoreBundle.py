@@ -0,0 +1,283 @@
+"""
+구동기/플러그인 오프라인 번들 (내보내기 / 가져오기)
+경로: modules/minecraft/CoreBundle.py
+
+번들 = tar 파일
+- manifest.json: 카탈로그 항목 + SHA-256
+- blobs/<sha256>: jar 내용 (대상 노드가 이미 가진 blob은 제외 가능)
+
+가져오기는 해시 검증 후 blob 저장소에 중복 없이 넣고 카탈로그에 등록합니다.
+업스트림 접속 없이 새 노드를 미리 채우거나 인터넷이 없는 호스트에 배포할 때 사용합니다.
+"""
+
+import io
+import json
+import os
+import platform
+import re
+import tarfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Iterable, Set
+
+from .BlobStore import BlobStore
+from .CoreCatalog import CoreCatalog
+
+_DIGEST = re.compile(r'^[0-9a-f]{64}$')
+
+
+class CoreBundle:
+    """번들 생성/적용"""
+
+    FORMAT_VERSION = 1
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, catalog: CoreCatalog, blobs: BlobStore, cores_dir: Path, plugins_dir: Path):
+        self.catalog = catalog
+        self.blobs = blobs
+        self.cores_dir = cores_dir
+        self.plugins_dir = plugins_dir
+
+    # ========================================
+    # 내보내기
+    # ========================================
+
+    def _select_entries(self, core_type: Optional[str], version: Optional[str], include_plugins: bool) -> list:
+        selected = []
+
+        for ct, versions in self.catalog.data['cores'].items():
+            if core_type and ct != core_type:
+                continue
+            for ver, entry in versions.items():
+                if version and ver != version:
+                    continue
+                selected.append(('core', ct, ver, entry))
+
+        if include_plugins:
+            for name, entry in self.catalog.data['plugins'].items():
+                selected.append(('plugin', None, name, entry))
+
+        return selected
+
+    def export(
+        self,
+        dest: Path,
+        core_type: Optional[str] = None,
+        version: Optional[str] = None,
+        include_plugins: bool = True,
+        exclude_hashes: Optional[Set[str]] = None
+    ) -> dict:
+        """
+        번들 생성
+
+        Args:
+            dest: 번들 파일 경로 (.tar)
+            core_type: 특정 구동기만 (None이면 전체)
+            version: 특정 버전만
+            include_plugins: 플러그인 포함 여부
+            exclude_hashes: 대상 노드가 이미 가진 blob (manifest에는 남기고 내용은 제외)
+
+        Returns:
+            {'entries', 'blobs', 'skipped', 'bytes'}
+        """
+        exclude_hashes = exclude_hashes or set()
+        entries = []
+        written = set()
+        total_bytes = 0
+
+        tmp = dest.with_name(dest.name + '.tmp')
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        with tarfile.open(tmp, 'w') as tar:
+            for kind, ct, name, entry in self._select_entries(core_type, version, include_plugins):
+                path = self.catalog.path_of(entry)
+                if not path.exists():
+                    continue
+
+                # 디스크 동기화로 등록된 항목은 해시가 없을 수 있음
+                digest = entry.get('sha256') or self.blobs.digest_of(path)
+                record = {k: v for k, v in entry.items() if k not in ('path', 'prebuilt')}
+                record.update({'kind': kind, 'name': name, 'file': path.name, 'sha256': digest})
+                if ct:
+                    record['core_type'] = ct
+                entries.append(record)
+
+                if digest in exclude_hashes or digest in written:
+                    continue
+
+                tar.add(str(path), arcname=f'blobs/{digest}', recursive=False)
+                written.add(digest)
+                total_bytes += path.stat().st_size
+
+            manifest = json.dumps({
+                'format': self.FORMAT_VERSION,
+                'created_at': datetime.now().isoformat(),
+                'node': platform.node(),
+                'entries': entries
+            }, indent=2, ensure_ascii=False).encode('utf-8')
+
+            info = tarfile.TarInfo(self.MANIFEST_NAME)
+            info.size = len(manifest)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(manifest))
+
+        os.replace(tmp, dest)
+
+        return {
+            'entries': len(entries),
+            'blobs': len(written),
+            'skipped': len({e['sha256'] for e in entries} - written),
+            'bytes': total_bytes
+        }
+
+    def local_hashes(self) -> Set[str]:
+        """이 노드가 가진 내용 해시 (blob 저장소 + 카탈로그, 다른 노드에서 내보낼 때 제외용)"""
+        hashes = self.blobs.digests()
+        for versions in self.catalog.data['cores'].values():
+            hashes.update(e['sha256'] for e in versions.values() if e.get('sha256'))
+        hashes.update(e['sha256'] for e in self.catalog.data['plugins'].values() if e.get('sha256'))
+        return hashes
+
+    # ========================================
+    # 가져오기
+    # ========================================
+
+    @staticmethod
+    def _safe_part(value) -> bool:
+        """경로 한 단계로 쓸 수 있는 이름인지 (구분자/'..' 불가)"""
+        return (
+            isinstance(value, str) and value not in ('', '.') and '..' not in value
+            and '/' not in value and '\\' not in value and '\0' not in value
+        )
+
+    def _target_path(self, record: dict) -> Path:
+        """
+        manifest 항목의 설치 경로 (다른 노드에서 온 값이므로 검증)
+
+        Raises:
+            ValueError: 해시 형식 오류, 경로 구분자/'..' 포함, 루트 밖 경로
+        """
+        if not isinstance(record.get('sha256'), str) or not _DIGEST.match(record['sha256']):
+            raise ValueError(f"잘못된 SHA-256: {record.get('sha256')!r}")
+
+        if record.get('kind') == 'core':
+            root = self.cores_dir
+            parts = (record.get('core_type'), record.get('name'), record.get('file'))
+        elif record.get('kind') == 'plugin':
+            root = self.plugins_dir
+            parts = (record.get('name'), record.get('file'))
+        else:
+            raise ValueError(f"알 수 없는 항목 종류: {record.get('kind')!r}")
+
+        if not all(self._safe_part(p) for p in parts):
+            raise ValueError(f"잘못된 항목 경로: {parts}")
+
+        target = root.joinpath(*parts)
+        if not target.resolve().is_relative_to(root.resolve()):
+            raise ValueError(f"설치 경로가 {root.name}/ 밖입니다: {target}")
+        return target
+
+    def import_bundle(self, bundle: Path) -> dict:
+        """
+        번들 적용
+
+        카탈로그는 건드리지 않으므로(스레드에서 실행) 끝난 뒤 이벤트 루프에서 register(result) 호출
+
+        Returns:
+            {'added', 'existing', 'blobs_imported', 'blobs_reused', 'missing', 'bytes', 'records'}
+
+        Raises:
+            ValueError: manifest 없음/형식 불일치/해시 불일치/잘못된 항목
+        """
+        result = {
+            'added': 0, 'existing': 0, 'blobs_imported': 0, 'blobs_reused': 0,
+            'missing': [], 'bytes': 0, 'records': []
+        }
+
+        with tarfile.open(bundle, 'r') as tar:
+            try:
+                manifest = json.load(tar.extractfile(self.MANIFEST_NAME))
+            except KeyError:
+                raise ValueError("manifest.json이 없습니다")
+
+            if manifest.get('format') != self.FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 번들 형식: {manifest.get('format')}")
+
+            members = {m.name: m for m in tar.getmembers() if m.isfile()}
+
+            # blob을 쓰기 전에 모든 항목 검증
+            targets = [self._target_path(record) for record in manifest['entries']]
+
+            for record, target in zip(manifest['entries'], targets):
+                # 확보~배포 사이에 blob 정리(GC)가 끼어들지 않게
+                with self.blobs.store_lock:
+                    if self._import_entry(tar, members, record, target, result):
+                        result['records'].append((record, target))
+
+        return result
+
+    def _import_entry(self, tar, members: dict, record: dict, target: Path, result: dict) -> bool:
+        """blob 확보 + 대상 경로 배포 (번들에 내용이 없으면 False)"""
+        digest = record['sha256']
+
+        # blob 확보 (이미 있으면 번들에서 읽지 않음)
+        if self.blobs.has(digest):
+            result['blobs_reused'] += 1
+        elif target.exists() and self.blobs.digest_of(target) == digest:
+            self.blobs.ingest(target)
+            result['blobs_reused'] += 1
+        else:
+            member = members.get(f'blobs/{digest}')
+            if member is None:
+                result['missing'].append(f"{record.get('core_type', 'plugin')} {record['name']}")
+                return False
+            result['bytes'] += self.blobs.add_stream(tar.extractfile(member), digest)
+            result['blobs_imported'] += 1
+
+        if target.exists() and self.blobs.digest_of(target) == digest:
+            result['existing'] += 1
+        else:
+            self.blobs.deploy_blob(digest, target)
+            result['added'] += 1
+        return True
+
+    def register(self, result: dict):
+        """import_bundle 결과를 카탈로그에 등록 (이벤트 루프에서 호출)"""
+        for record, target in result['records']:
+            self._record(record, target)
+
+    def _record(self, record: dict, target: Path):
+        if record['kind'] == 'core':
+            self.catalog.record_core(
+                record['core_type'], record['name'], target,
+                build=record.get('build'),
+                sha256=record['sha256'],
+                size=record.get('size'),
+                url=record.get('url'),
+                min_java=record.get('min_java'),
+                fetched_at=record.get('fetched_at')
+            )
+        else:
+            self.catalog.record_plugin(
+                record['name'], target,
+                version=record.get('version'),
+                sha256=record['sha256'],
+                size=record.get('size'),
+                url=record.get('url'),
+                fetched_at=record.get('fetched_at')
+            )
+
+    @staticmethod
+    def read_manifest(bundle: Path) -> dict:
+        with tarfile.open(bundle, 'r') as tar:
+            return json.load(tar.extractfile(CoreBundle.MANIFEST_NAME))
+
+    @staticmethod
+    def hashes_from(paths: Iterable[Path]) -> Set[str]:
+        """'보유 목록' 파일(한 줄에 하나의 SHA-256)에서 해시 읽기"""
+        hashes = set()
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                hashes.update(line.strip() for line in f if line.strip())
+        return hashes
@@ -0,0 +1,262 @@
+"""
+구동기/플러그인 카탈로그 (로컬 인덱스)
+경로: modules/minecraft/CoreCatalog.py
+
+- 받은 모든 구동기/플러그인의 버전, 빌드, SHA-256, 크기, 출처 URL, 받은 시각, 최소 Java 버전 기록
+- 버전은 의미 순서로 정렬 (1.21 > 1.9, 1.21 > 1.21-pre1)
+- 목록/자동완성/서버 생성은 디렉토리 탐색 없이 메모리 인덱스 조회
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional, Dict, List
+
+
+def version_key(version: str) -> tuple:
+    """
+    버전 정렬 키 (문자열 비교 대신 숫자 비교)
+
+    "1.21.1" → ((1, 21, 1), True, ('', 0))
+    "1.21-pre1" → ((1, 21), False, ('pre', 1))  # 정식 버전보다 낮음
+    "1.21-pre10" → ((1, 21), False, ('pre', 10))  # pre2보다 높음
+    """
+    main, _, suffix = version.partition('-')
+    numbers = tuple(int(n) for n in re.findall(r'\d+', main))
+    digits = re.findall(r'\d+', suffix)
+    return numbers, suffix == '', (re.sub(r'\d+', '', suffix), int(digits[0]) if digits else 0)
+
+
+def required_java(version: str) -> int:
+    """마인크래프트 버전별 최소 Java 버전"""
+    numbers = version_key(version)[0]
+    if numbers >= (1, 20, 5):
+        return 21
+    if numbers >= (1, 18):
+        return 17
+    if numbers >= (1, 17):
+        return 16
+    return 8
+
+
+class CoreCatalog:
+    """JSON 인덱스 기반 카탈로그"""
+
+    def __init__(self, catalog_file: Path, base_path: Path):
+        """
+        Args:
+            catalog_file: 인덱스 파일 경로
+            base_path: jar 경로를 상대 경로로 저장할 기준 폴더 (봇 폴더 이동 대비)
+        """
+        self.catalog_file = catalog_file
+        self.base_path = base_path
+
+        # {'cores': {core_type: {version: entry}}, 'plugins': {name: entry}}
+        self.data = self._load()
+        self.data.setdefault('cores', {})
+        self.data.setdefault('plugins', {})
+
+        # 정렬된 버전 목록 캐시 {core_type: [version, ...]} (최신순)
+        self._sorted: Dict[str, List[str]] = {}
+
+    # ========================================
+    # 영속화
+    # ========================================
+
+    def _load(self) -> dict:
+        if not self.catalog_file.exists():
+            return {}
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 카탈로그 로드 실패 (디스크에서 재구성): {e}")
+            return {}
+
+    def _save(self):
+        try:
+            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.catalog_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=1, ensure_ascii=False)
+            os.replace(tmp_file, self.catalog_file)
+        except Exception as e:
+            print(f"⚠️ 카탈로그 저장 실패: {e}")
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return str(Path(path).relative_to(self.base_path))
+        except ValueError:
+            return str(path)
+
+    def path_of(self, entry: dict) -> Path:
+        path = Path(entry['path'])
+        return path if path.is_absolute() else self.base_path / path
+
+    # ========================================
+    # 기록
+    # ========================================
+
+    def record_core(
+        self,
+        core_type: str,
+        version: str,
+        path: Path,
+        build: Optional[str] = None,
+        sha256: Optional[str] = None,
+        size: Optional[int] = None,
+        url: Optional[str] = None,
+        min_java: Optional[int] = None,
+        fetched_at: Optional[float] = None
+    ):
+        """구동기 항목 추가/갱신"""
+        self.data['cores'].setdefault(core_type, {})[version] = {
+            'version': version,
+            'build': str(build) if build is not None else None,
+            'sha256': sha256,
+            'size': size if size is not None else Path(path).stat().st_size,
+            'url': url,
+            'fetched_at': fetched_at or time.time(),
+            'min_java': min_java or required_java(version),
+            'path': self._relative(path)
+        }
+        self._sorted.pop(core_type, None)
+        self._save()
+
+    def record_plugin(
+        self,
+        name: str,
+        path: Path,
+        version: Optional[str] = None,
+        sha256: Optional[str] = None,
+        size: Optional[int] = None,
+        url: Optional[str] = None,
+        fetched_at: Optional[float] = None
+    ):
+        """플러그인 항목 추가/갱신"""
+        self.data['plugins'][name] = {
+            'version': version,
+            'file': Path(path).name,
+            'sha256': sha256,
+            'size': size if size is not None else Path(path).stat().st_size,
+            'url': url,
+            'fetched_at': fetched_at or time.time(),
+            'path': self._relative(path)
+        }
+        self._save()
+
+    def set_prebuilt(self, core_type: str, version: str, path: Path, launch: dict):
+        """사전 설치된 서버 트리 기록 (Forge/Fabric)"""
+        entry = self.get_core(core_type, version)
+        if not entry:
+            return
+        entry['prebuilt'] = {
+            'path': self._relative(path),
+            'launch': launch,
+            'built_at': time.time()
+        }
+        self._save()
+
+    def get_prebuilt(self, core_type: str, version: str) -> Optional[dict]:
+        """사전 설치 정보 {'path', 'launch', 'built_at'} (트리가 사라졌으면 None)"""
+        entry = self.get_core(core_type, version)
+        prebuilt = entry.get('prebuilt') if entry else None
+        if prebuilt and self.path_of(prebuilt).exists():
+            return prebuilt
+        return None
+
+    def sync_with_disk(self, cores_dir: Path, core_types, plugins_dir: Path):
+        """
+        카탈로그와 디스크 맞추기 (시작 시 1회)
+
+        - 카탈로그 도입 전에 받았거나 직접 넣은 jar 등록 (해시는 미기록)
+        - 파일이 사라진 항목 제거
+        """
+        changed = False
+
+        for core_type in core_types:
+            entries = self.data['cores'].setdefault(core_type, {})
+
+            for version in list(entries.keys()):
+                if not self.path_of(entries[version]).exists():
+                    del entries[version]
+                    changed = True
+
+            core_dir = cores_dir / core_type
+            if core_dir.exists():
+                # Forge는 설치기(installer.jar)를 보관
+                for jar in list(core_dir.glob('*/server.jar')) + list(core_dir.glob('*/installer.jar')):
+                    version = jar.parent.name
+                    if version not in entries:
+                        st = jar.stat()
+                        entries[version] = {
+                            'version': version, 'build': None, 'sha256': None,
+                            'size': st.st_size, 'url': None, 'fetched_at': st.st_mtime,
+                            'min_java': required_java(version), 'path': self._relative(jar)
+                        }
+                        changed = True
+
+        plugins = self.data['plugins']
+        for name in list(plugins.keys()):
+            if not self.path_of(plugins[name]).exists():
+                del plugins[name]
+                changed = True
+
+        if plugins_dir.exists():
+            for plugin_dir in plugins_dir.iterdir():
+                if not plugin_dir.is_dir() or plugin_dir.name in plugins:
+                    continue
+                jars = sorted(plugin_dir.glob('*.jar'), key=lambda p: p.stat().st_mtime, reverse=True)
+                if jars:
+                    st = jars[0].stat()
+                    plugins[plugin_dir.name] = {
+                        'version': None, 'file': jars[0].name, 'sha256': None,
+                        'size': st.st_size, 'url': None, 'fetched_at': st.st_mtime,
+                        'path': self._relative(jars[0])
+                    }
+                    changed = True
+
+        if changed:
+            self._sorted.clear()
+            self._save()
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def versions(self, core_type: str) -> List[str]:
+        """버전 목록 (최신순)"""
+        if core_type not in self._sorted:
+            self._sorted[core_type] = sorted(
+                self.data['cores'].get(core_type, {}).keys(),
+                key=version_key,
+                reverse=True
+            )
+        return self._sorted[core_type]
+
+    def get_core(self, core_type: str, version: str) -> Optional[dict]:
+        return self.data['cores'].get(core_type, {}).get(version)
+
+    def latest(self, core_type: str, series: Optional[str] = None) -> Optional[dict]:
+        """
+        최신 구동기 항목
+
+        Args:
+            core_type: 구동기 종류
+            series: "1.21" 또는 "1.21.x" → 1.21 계열 중 최신 (None이면 전체 최신)
+        """
+        if series:
+            series = series[:-2] if series.endswith('.x') else series
+
+        for version in self.versions(core_type):
+            if series is None or version == series or version.startswith(series + '.'):
+                return self.get_core(core_type, version)
+        return None
+
+    def get_plugin(self, name: str) -> Optional[dict]:
+        return self.data['plugins'].get(name)
+
+    def plugin_names(self) -> List[str]:
+        return sorted(self.data['plugins'].keys())
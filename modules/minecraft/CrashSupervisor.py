@@ -0,0 +1,294 @@
+"""
+서버 비정상 종료 감지 + 자동 재시작
+경로: modules/minecraft/CrashSupervisor.py
+
+- 중지 요청(stop_server) 없이 JVM/Screen 세션이 사라지면 몇 초 안에 감지
+- 가장 최근 crash-reports/*.txt + logs/latest.log 끝부분을 logs/crashes/에 보관
+- 크래시 시그니처 (크래시 리포트 Description / 첫 예외 + 첫 스택 프레임)
+- 지수 백오프로 재시작, 짧은 시간에 반복되면 재시작 중단 (crash loop 차단)
+- 장애마다 알림 한 번 (notify 콜백 - main.py에서 디스코드 채널로 전송)
+"""
+
+import asyncio
+import hashlib
+import re
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+try:
+    from .ScreenManager import ScreenManager
+    SCREEN_AVAILABLE = True
+except ImportError:
+    SCREEN_AVAILABLE = False
+
+
+class CrashSupervisor:
+    """실행 중인 서버 감시 (주기적으로 check() 호출)"""
+
+    BACKOFF_BASE = 10  # 첫 재시작 대기 (초), 이후 2배씩
+    BACKOFF_MAX = 300
+    LOG_TAIL_LINES = 80
+    STABLE_UPTIME = 600  # 이 시간 이상 실행되면 연속 크래시 횟수 초기화 (초)
+
+    def __init__(self, server_manager, max_restarts: int = 3, loop_window: int = 600):
+        """
+        Args:
+            server_manager: ServerManager
+            max_restarts: loop_window 안에 이 횟수를 넘게 죽으면 자동 재시작 중단
+            loop_window: crash loop 판단 구간 (초)
+        """
+        self.server_manager = server_manager
+        self.max_restarts = max_restarts
+        self.loop_window = loop_window
+
+        # 자동 재시작 여부 (꺼져 있어도 감지/세션 정리/알림은 항상 수행)
+        self.auto_restart = True
+
+        # 장애 알림 (incident dict → 디스코드 전송, None이면 콘솔만)
+        self.notify: Optional[Callable[[dict], Awaitable]] = None
+
+        self.crashes_dir = server_manager.logs_dir / 'crashes'
+
+        # {server_id: [크래시 시각 (monotonic)]}
+        self.crash_times: Dict[str, List[float]] = {}
+        # 재시작 대기 중인 작업 {server_id: asyncio.Task}
+        self.restart_tasks: Dict[str, asyncio.Task] = {}
+        # 최근 장애 기록
+        self.incidents: List[dict] = []
+
+    # ========================================
+    # 감지
+    # ========================================
+
+    def _dead_servers(self) -> List[str]:
+        """등록되어 있지만 프로세스/세션이 사라진 서버 (블로킹 - screen -ls 한 번)"""
+        manager = self.server_manager
+        alive_sessions = set(ScreenManager.list_screens(filter_prefix="minecraft_")) if SCREEN_AVAILABLE else set()
+
+        dead = []
+        for server_id, obj in list(manager.running_servers.items()):
+            if isinstance(obj, str):
+                if obj not in alive_sessions:
+                    dead.append(server_id)
+            elif isinstance(obj, subprocess.Popen):
+                if obj.poll() is not None:
+                    dead.append(server_id)
+        return dead
+
+    async def check(self):
+        """비정상 종료 확인 (수 초 간격으로 호출)"""
+        manager = self.server_manager
+        dead = await asyncio.to_thread(self._dead_servers)
+
+        for server_id in dead:
+            # 시작/중지 진행 중 (Lock 보유)이거나 중지 요청으로 종료 중이면 정상
+            lock = manager.server_locks.get(server_id)
+            if server_id in manager.stopping_servers or (lock and lock.locked()):
+                continue
+            if server_id not in manager.running_servers:
+                continue
+
+            await self._handle_exit(server_id)
+
+    async def _handle_exit(self, server_id: str):
+        manager = self.server_manager
+        config = manager.get_server_config(server_id) or {}
+
+        # 죽은 세션 정리 (다시 시작할 수 있도록)
+        manager.running_servers.pop(server_id, None)
+        manager.server_screen_sessions.pop(server_id, None)
+        manager.java_processes.pop(server_id, None)
+        started_at = manager.started_at.pop(server_id, None)
+        uptime = time.time() - started_at if started_at else None
+
+        incident = await asyncio.to_thread(self._collect, server_id, config, started_at)
+        incident['uptime_seconds'] = uptime
+
+        # 콘솔에서 stop 명령으로 정상 종료한 경우
+        if incident['clean_stop']:
+            print(f"ℹ️ [{server_id}] 서버가 콘솔 명령으로 정상 종료되었습니다 (자동 재시작 안 함)")
+            return
+
+        now = time.monotonic()
+        history = self.crash_times.setdefault(server_id, [])
+        if uptime is not None and uptime >= self.STABLE_UPTIME:
+            history.clear()
+        history[:] = [t for t in history if now - t < self.loop_window]
+        history.append(now)
+        incident['recent_crashes'] = len(history)
+
+        auto_restart = self.auto_restart and config.get('auto_restart', True)
+        if not auto_restart:
+            incident['action'] = 'none'
+        elif len(history) > self.max_restarts:
+            incident['action'] = 'circuit_open'
+        else:
+            incident['action'] = 'restart'
+            incident['restart_delay'] = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (len(history) - 1))
+
+        self.incidents.append(incident)
+        self.incidents = self.incidents[-50:]
+
+        print(
+            f"💥 [{server_id}] 서버 비정상 종료 감지 - {incident['signature']} "
+            f"(실행 {self.format_uptime(uptime)}, {self.loop_window // 60}분 내 {len(history)}회)"
+        )
+        if incident['action'] == 'restart':
+            print(f"   🔁 {incident['restart_delay']}초 후 자동 재시작")
+            self._schedule_restart(server_id, incident['restart_delay'])
+        elif incident['action'] == 'circuit_open':
+            print(f"   ⛔ 반복 크래시로 자동 재시작 중단 - 원인 확인 후 수동으로 시작해주세요")
+
+        if self.notify:
+            try:
+                await self.notify(incident)
+            except Exception as e:
+                print(f"⚠️ 장애 알림 전송 실패: {e}")
+
+    def _schedule_restart(self, server_id: str, delay: float):
+        previous = self.restart_tasks.get(server_id)
+        if previous and not previous.done():
+            previous.cancel()
+        self.restart_tasks[server_id] = asyncio.create_task(self._restart_later(server_id, delay))
+
+    async def _restart_later(self, server_id: str, delay: float):
+        await asyncio.sleep(delay)
+
+        # 그 사이 수동으로 시작한 경우
+        if self.server_manager.is_process_running(server_id):
+            return
+
+        success, message = await self.server_manager.start_server(server_id)
+        print(f"   {'✅' if success else '❌'} [{server_id}] 자동 재시작 {'성공' if success else '실패'}: {message.splitlines()[0] if message else ''}")
+
+    # ========================================
+    # 원인 수집
+    # ========================================
+
+    def _collect(self, server_id: str, config: dict, started_at: Optional[float]) -> dict:
+        """크래시 리포트 + 로그 끝부분 수집 (블로킹)"""
+        server_path = Path(config.get('path', '.'))
+
+        crash_report = None
+        reports_dir = server_path / 'crash-reports'
+        if reports_dir.is_dir():
+            reports = sorted(reports_dir.glob('*.txt'), key=lambda p: p.stat().st_mtime, reverse=True)
+            # 이번 실행 중에 생긴 리포트만 (시작 시각을 모르면 최근 10분)
+            since = started_at or time.time() - 600
+            if reports and reports[0].stat().st_mtime >= since:
+                crash_report = reports[0]
+
+        log_tail = self._tail(server_path / 'logs' / 'latest.log', self.LOG_TAIL_LINES)
+        report_text = crash_report.read_text(encoding='utf-8', errors='replace') if crash_report else ''
+
+        signature = self._signature(report_text, log_tail)
+        clean_stop = not crash_report and any(
+            'Stopping server' in line or 'Stopping the server' in line
+            for line in log_tail[-15:]
+        )
+
+        incident = {
+            'server_id': server_id,
+            'name': config.get('name', server_id),
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'signature': signature,
+            'signature_id': hashlib.sha1(re.sub(r'\d+', '#', signature).encode()).hexdigest()[:8],
+            'crash_report': crash_report.name if crash_report else None,
+            'log_tail': log_tail[-15:],
+            'clean_stop': clean_stop,
+            'bundle': None
+        }
+
+        if not clean_stop:
+            incident['bundle'] = str(self._save_bundle(incident, report_text, log_tail))
+        return incident
+
+    @staticmethod
+    def _tail(path: Path, lines: int) -> List[str]:
+        if not path.exists():
+            return []
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - 64 * 1024))
+            data = f.read().decode('utf-8', errors='replace')
+        return data.splitlines()[-lines:]
+
+    @staticmethod
+    def _signature(report_text: str, log_tail: List[str]) -> str:
+        """
+        크래시 시그니처
+
+        1. 크래시 리포트: "Description: ..." + 첫 예외 줄 + 첫 스택 프레임
+        2. 로그: 마지막 예외/에러 줄
+        3. 아무 흔적이 없으면 외부 종료 (OOM killer 등)
+        """
+        exception = re.compile(r'^\s*((?:[\w$]+\.)+[\w$]*(?:Exception|Error|Throwable))(?::\s*(.*))?$')
+
+        if report_text:
+            description = re.search(r'^Description: (.+)$', report_text, re.MULTILINE)
+            parts = [description.group(1).strip()] if description else []
+            lines = report_text.splitlines()
+            for i, line in enumerate(lines):
+                match = exception.match(line)
+                if match:
+                    parts.append(match.group(1).rsplit('.', 1)[-1] + (f": {match.group(2)[:80]}" if match.group(2) else ""))
+                    frame = next((l.strip() for l in lines[i + 1:i + 3] if l.strip().startswith('at ')), None)
+                    if frame:
+                        parts.append(frame[:120])
+                    break
+            if parts:
+                return " | ".join(parts)
+
+        for line in reversed(log_tail):
+            if 'OutOfMemoryError' in line:
+                return "java.lang.OutOfMemoryError"
+            message = line.split(']: ', 1)[-1]
+            match = exception.match(message)
+            if match:
+                return match.group(1) + (f": {match.group(2)[:80]}" if match.group(2) else "")
+
+        return "로그 없이 종료 (OOM killer/외부 종료 가능성)"
+
+    def _save_bundle(self, incident: dict, report_text: str, log_tail: List[str]) -> Path:
+        """장애 기록 파일 (logs/crashes/<서버>_<시각>.txt)"""
+        self.crashes_dir.mkdir(parents=True, exist_ok=True)
+        bundle = self.crashes_dir / f"{incident['server_id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+
+        with open(bundle, 'w', encoding='utf-8') as f:
+            f.write(f"서버: {incident['name']} ({incident['server_id']})\n")
+            f.write(f"시각: {incident['at']}\n")
+            f.write(f"시그니처: {incident['signature']} [{incident['signature_id']}]\n")
+            f.write(f"\n===== logs/latest.log (마지막 {len(log_tail)}줄) =====\n")
+            f.write("\n".join(log_tail))
+            if report_text:
+                f.write(f"\n\n===== crash-reports/{incident['crash_report']} =====\n")
+                f.write(report_text)
+        return bundle
+
+    @staticmethod
+    def format_uptime(seconds: Optional[float]) -> str:
+        if seconds is None:
+            return "알 수 없음"
+        hours, rest = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rest, 60)
+        if hours:
+            return f"{hours}시간 {minutes}분"
+        if minutes:
+            return f"{minutes}분 {secs}초"
+        return f"{secs}초"
+
+    def reset(self, server_id: str):
+        """수동 시작 시 crash loop 상태 초기화"""
+        self.crash_times.pop(server_id, None)
+        task = self.restart_tasks.pop(server_id, None)
+        if task and not task.done():
+            task.cancel()
+
+    def close(self):
+        for task in self.restart_tasks.values():
+            if not task.done():
+                task.cancel()
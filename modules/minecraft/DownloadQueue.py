@@ -0,0 +1,106 @@
+"""
+제한된 병렬 다운로드 작업 큐
+경로: modules/minecraft/DownloadQueue.py
+
+고정 개수의 워커가 큐에서 다운로드를 꺼내 실행하고,
+호스트별 세마포어로 한 호스트에 몰리는 동시 전송 수를 제한합니다.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Dict, Optional
+
+from .HttpClient import HttpClient
+from .JarDownloader import JarDownloader
+
+
+class DownloadQueue:
+    """워커 풀 기반 다운로드 큐"""
+
+    def __init__(self, http: HttpClient, downloader: JarDownloader, workers: int = 4, per_host: int = 2):
+        """
+        Args:
+            http: 공유 HTTP 클라이언트 (세션 + 통계)
+            downloader: 스트리밍/검증 다운로더
+            workers: 전체 동시 다운로드 수
+            per_host: 호스트별 동시 다운로드 수
+        """
+        self.http = http
+        self.downloader = downloader
+        self.worker_count = workers
+        self.per_host = per_host
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _ensure_workers(self):
+        """이벤트 루프 안에서 처음 사용할 때 워커 시작"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = self.http.host_of(url)
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    def submit(self, url: str, dest: Path, **kwargs) -> asyncio.Future:
+        """
+        다운로드 예약
+
+        Args:
+            url: 다운로드 URL
+            dest: 최종 저장 경로
+            **kwargs: JarDownloader.download 옵션 (sha256, sha1, label, headers)
+
+        Returns:
+            결과 dict 또는 예외로 완료되는 Future
+        """
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((url, dest, kwargs, future))
+        return future
+
+    async def _worker(self):
+        while True:
+            url, dest, kwargs, future = await self._queue.get()
+            try:
+                if future.cancelled():
+                    continue
+
+                async with self._host_limit(url):
+                    try:
+                        result = await self.downloader.download(self.http.session, url, dest, **kwargs)
+                    except Exception as e:
+                        self.http.record_failure(url, retries=self.downloader.retries - 1)
+                        if not future.done():
+                            future.set_exception(e)
+                        continue
+
+                self.http.record_transfer(url, result['size'], result['seconds'], retries=result['attempts'] - 1)
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            finally:
+                self._queue.task_done()
+
+    async def close(self):
+        """워커 종료 (대기 중인 다운로드 취소)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
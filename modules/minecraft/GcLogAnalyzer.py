@@ -0,0 +1,236 @@
+"""
+GC 로그 분석 + 힙 크기 추천
+경로: modules/minecraft/GcLogAnalyzer.py
+
+서버 폴더의 logs/gc.log (Java 9+ 통합 로깅, JvmProfiles.gc_log_args)를 이어서 읽어
+- 라이브 셋: Full/Mixed/Major GC 직후 힙 크기 (실제로 살아 있는 데이터)
+- 정지 시간 백분위수 (p50/p95/p99/최대)
+- 할당 속도: GC 사이에 늘어난 힙 / 경과 시간
+을 계산하고, 이를 바탕으로 -Xms/-Xmx 추천값과 근거를 만듭니다.
+
+예시 줄:
+[2024-05-01T12:00:00.123+0900][12.345s][info][gc] GC(12) Pause Young (Normal) (G1 Evacuation Pause) 512M->128M(4096M) 12.345ms
+[...][88.100s][info][gc] GC(40) Major Collection (Allocation Rate) 1024M(25%)->256M(6%) 1.234s   (세대별 ZGC)
+"""
+
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+from .JvmProfiles import pins_heap
+
+_EVENT = re.compile(
+    r'\[(?P<uptime>[\d.]+)s\].*?\[gc\s*\] GC\((?P<id>\d+)\) (?P<name>.+?) '
+    r'(?P<before>\d+)(?P<bu>[KMG])(?:\(\d+%\))?->(?P<after>\d+)(?P<au>[KMG])(?:\(\d+%\))?'
+    r'(?:\((?P<cap>\d+)(?P<cu>[KMG])\))?'
+    r'(?: (?P<duration>[\d.]+)(?P<du>ms|s))?'
+)
+
+_UNITS_MB = {'K': 1 / 1024, 'M': 1, 'G': 1024}
+
+
+class _LogState:
+    """서버별 읽기 위치 + 최근 이벤트"""
+
+    def __init__(self, max_events: int):
+        self.inode = None
+        self.offset = 0
+        self.partial = ''
+        self.events = deque(maxlen=max_events)
+
+
+class GcLogAnalyzer:
+    """gc.log 증분 분석"""
+
+    MAX_EVENTS = 5000
+
+    def __init__(self):
+        self._states: Dict[str, _LogState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_line(line: str) -> Optional[dict]:
+        """GC 이벤트 한 줄 → {'uptime', 'name', 'before', 'after', 'capacity', 'pause_ms'} (MB/ms)"""
+        match = _EVENT.search(line)
+        if not match:
+            return None
+
+        name = match.group('name').strip()
+        duration = match.group('duration')
+        duration_ms = None
+        if duration:
+            duration_ms = float(duration) * (1000 if match.group('du') == 's' else 1)
+
+        return {
+            'uptime': float(match.group('uptime')),
+            'name': name,
+            'before': int(match.group('before')) * _UNITS_MB[match.group('bu')],
+            'after': int(match.group('after')) * _UNITS_MB[match.group('au')],
+            'capacity': int(match.group('cap')) * _UNITS_MB[match.group('cu')] if match.group('cap') else None,
+            # 'Pause ...' 이벤트만 애플리케이션 정지 (ZGC Collection 시간은 동시 실행)
+            'pause_ms': duration_ms if name.startswith('Pause') else None
+        }
+
+    def _read_new(self, server_id: str, log_file: Path) -> _LogState:
+        state = self._states.setdefault(server_id, _LogState(self.MAX_EVENTS))
+
+        try:
+            st = log_file.stat()
+        except FileNotFoundError:
+            return state
+
+        # 파일 회전/서버 재시작으로 새 파일이면 처음부터
+        if state.inode != st.st_ino or st.st_size < state.offset:
+            if state.inode is not None:
+                state.events.append(None)  # 구간 경계 (uptime이 0부터 다시 시작)
+            state.inode = st.st_ino
+            state.offset = 0
+            state.partial = ''
+
+        if st.st_size == state.offset:
+            return state
+
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            f.seek(state.offset)
+            chunk = f.read()
+            state.offset = f.tell()
+
+        lines = (state.partial + chunk).split('\n')
+        state.partial = lines.pop()  # 아직 다 쓰지 않은 줄
+
+        for line in lines:
+            event = self.parse_line(line)
+            if event:
+                state.events.append(event)
+
+        return state
+
+    @staticmethod
+    def _percentile(values: list, p: float) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def analyze(self, server_id: str, server_path: Path) -> Optional[dict]:
+        """
+        GC 로그 분석 (블로킹 - asyncio.to_thread로 호출)
+
+        Returns:
+            {
+                'events', 'pauses', 'span_seconds',
+                'live_set_mb', 'live_set_source',
+                'pause_p50_ms', 'pause_p95_ms', 'pause_p99_ms', 'pause_max_ms',
+                'gc_time_percent', 'alloc_rate_mb_s', 'full_gcs', 'heap_capacity_mb'
+            }
+            (통합 GC 로그가 없으면 None)
+        """
+        with self._lock:
+            state = self._read_new(server_id, server_path / 'logs' / 'gc.log')
+            events = list(state.events)
+
+        parsed = [e for e in events if e]
+        if not parsed:
+            return None
+
+        pauses = [e['pause_ms'] for e in parsed if e['pause_ms'] is not None]
+
+        # 라이브 셋: 전체/혼합/Major GC 직후 크기 (없으면 영 GC 직후 최소값 - 상한 추정)
+        full_like = [
+            e['after'] for e in parsed
+            if any(key in e['name'] for key in ('Full', 'Mixed', 'Major', 'Garbage Collection'))
+        ]
+        if full_like:
+            recent = full_like[-20:]
+            live_set = self._percentile(recent, 90)
+            live_source = f"Full/Mixed GC {len(recent)}회 직후 (p90)"
+        else:
+            live_set = min(e['after'] for e in parsed)
+            live_source = "영 GC 직후 최소값 (Full/Mixed GC 기록 없음, 상한 추정)"
+
+        # 할당 속도 / 측정 구간 (재시작 경계는 건너뜀)
+        allocated = 0.0
+        span = 0.0
+        previous = None
+        for event in events:
+            if event is None:
+                previous = None
+                continue
+            if previous and event['uptime'] > previous['uptime']:
+                allocated += max(0.0, event['before'] - previous['after'])
+                span += event['uptime'] - previous['uptime']
+            previous = event
+
+        capacities = [e['capacity'] for e in parsed if e['capacity']]
+
+        return {
+            'events': len(parsed),
+            'pauses': len(pauses),
+            'span_seconds': span,
+            'live_set_mb': live_set,
+            'live_set_source': live_source,
+            'pause_p50_ms': self._percentile(pauses, 50) if pauses else None,
+            'pause_p95_ms': self._percentile(pauses, 95) if pauses else None,
+            'pause_p99_ms': self._percentile(pauses, 99) if pauses else None,
+            'pause_max_ms': max(pauses) if pauses else None,
+            'gc_time_percent': (sum(pauses) / 1000 / span * 100) if span and pauses else None,
+            'alloc_rate_mb_s': allocated / span if span else None,
+            'full_gcs': sum(1 for e in parsed if 'Full' in e['name']),
+            'heap_capacity_mb': capacities[-1] if capacities else None
+        }
+
+    @staticmethod
+    def recommend(stats: dict, memory: dict, jvm_profile: Optional[str] = None,
+                  host_total_mb: Optional[float] = None) -> dict:
+        """
+        힙 크기 추천
+
+        - 목표 최대 힙 ≈ 라이브 셋 × 3 (G1이 여유 있게 동작하는 일반적인 비율)
+        - Full GC가 있거나 GC 시간 비율이 5%를 넘으면 현재 값에서 25% 이상 증가
+        - 256MB 단위 반올림, 1GB ~ 호스트 메모리 75% 범위
+        - aikar-g1/zgc 프로필은 -Xms == -Xmx
+
+        Returns:
+            {'min', 'max', 'reasons': [...], 'changed': bool}
+        """
+        current_max = memory.get('max', 4096)
+        current_min = memory.get('min', 1024)
+        reasons = []
+
+        target = stats['live_set_mb'] * 3
+        reasons.append(f"라이브 셋 {stats['live_set_mb']:.0f}MB × 3 = {target:.0f}MB ({stats['live_set_source']})")
+
+        gc_percent = stats.get('gc_time_percent')
+        if stats['full_gcs'] or (gc_percent is not None and gc_percent > 5):
+            pressure = max(target, current_max * 1.25)
+            if pressure > target:
+                reasons.append(
+                    f"Full GC {stats['full_gcs']}회"
+                    + (f", GC 시간 {gc_percent:.1f}%" if gc_percent is not None else "")
+                    + f" → 현재 {current_max}MB에서 25% 증가"
+                )
+            target = pressure
+        elif gc_percent is not None and gc_percent < 2 and target < current_max:
+            reasons.append(f"GC 시간 {gc_percent:.1f}%로 여유 → 축소 가능")
+
+        if stats.get('alloc_rate_mb_s'):
+            reasons.append(f"할당 속도 {stats['alloc_rate_mb_s']:.0f}MB/s")
+
+        ceiling = host_total_mb * 0.75 if host_total_mb else None
+        recommended = max(1024, int(-(-target // 256) * 256))
+        if ceiling and recommended > ceiling:
+            recommended = int(ceiling // 256 * 256)
+            reasons.append(f"호스트 메모리 75% ({ceiling:.0f}MB)로 제한")
+
+        if pins_heap(jvm_profile):
+            recommended_min = recommended
+        else:
+            recommended_min = min(recommended, max(512, int(stats['live_set_mb'] * 1.5 // 256 * 256) or 512))
+
+        # 10% 미만 변화는 유지
+        if abs(recommended - current_max) < current_max * 0.1:
+            reasons.append(f"현재 최대 {current_max}MB와 차이가 작아 유지")
+            return {'min': current_min, 'max': current_max, 'reasons': reasons, 'changed': False}
+
+        return {'min': recommended_min, 'max': recommended, 'reasons': reasons, 'changed': True}
@@ -0,0 +1,306 @@
+"""
+서버 응답 없음(행) 감지 + 스레드 덤프 수집
+경로: modules/minecraft/HangWatchdog.py
+
+프로세스는 살아 있지만 메인 스레드가 멈추면(데드락/무한 루프) 상태 조회와 RCON이 모두 응답하지 않고
+is_server_running은 계속 실행 중으로 보고합니다.
+
+- 상태 조회(SLP) + RCON 타임아웃이 연속으로 쌓이고
+- 틱 카운터(RCON `time query gametime`, RCON이 없으면 메인 스레드 CPU 시간)가 멈추면 행으로 판단
+- jcmd <pid> Thread.print (+ 선택적으로 GC.heap_info)를 서버 폴더의 diagnostics/에 저장
+- 정책에 따라 강제 재시작 (restart) 또는 덤프만 수집 (dump)
+"""
+
+import asyncio
+import re
+import shutil
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import psutil
+
+
+class HangWatchdog:
+    """서버별 응답 확인 (주기적으로 check() 호출)"""
+
+    PROBE_TIMEOUT = 5  # SLP/RCON 응답 대기 (초)
+    STARTUP_GRACE = 300  # 시작 직후 판단 제외 (초)
+    JCMD_TIMEOUT = 30
+
+    # 스레드 덤프에서 건너뛸 패키지 (원인 플러그인/모드 추정용)
+    CORE_PACKAGES = (
+        'java.', 'javax.', 'jdk.', 'sun.', 'com.sun.', 'net.minecraft.', 'com.mojang.', 'org.bukkit.',
+        'org.spigotmc.', 'io.papermc.', 'com.destroystokyo.', 'net.minecraftforge.', 'net.fabricmc.',
+        'it.unimi.', 'com.google.', 'io.netty.', 'org.apache.', 'org.slf4j.'
+    )
+
+    def __init__(self, server_manager, failures: int = 3, action: str = 'restart', heap_info: bool = False):
+        """
+        Args:
+            server_manager: ServerManager
+            failures: 행으로 판단할 연속 실패 횟수
+            action: 'restart' (덤프 후 강제 재시작) | 'dump' (덤프만)
+            heap_info: GC.heap_info도 수집
+        """
+        self.server_manager = server_manager
+        self.failures = failures
+        self.action = action
+        self.heap_info = heap_info
+        self.enabled = True
+
+        # 행 알림 (incident dict → 디스코드 전송)
+        self.notify: Optional[Callable[[dict], Awaitable]] = None
+
+        # {server_id: {'failures', 'ticks', 'tick_source', 'checked', 'stalled', 'handled'}}
+        self.state: Dict[str, dict] = {}
+        self.incidents: List[dict] = []
+
+    # ========================================
+    # 확인
+    # ========================================
+
+    async def check(self):
+        """실행 중인 모든 서버 응답 확인"""
+        if not self.enabled:
+            return
+
+        manager = self.server_manager
+        for server_id in list(manager.running_servers.keys()):
+            lock = manager.server_locks.get(server_id)
+            started_at = manager.started_at.get(server_id)
+            if (lock and lock.locked()) or server_id in manager.stopping_servers:
+                continue
+            if started_at and time.time() - started_at < self.STARTUP_GRACE:
+                continue
+            startup = manager.startup_tasks.get(server_id)
+            if startup and not startup.done():
+                continue
+
+            try:
+                await self._check_server(server_id)
+            except Exception as e:
+                print(f"⚠️ [{server_id}] 응답 확인 오류: {e}")
+
+    async def _probe_slp(self, server_id: str) -> bool:
+        status = await self.server_manager.get_server_status(server_id)
+        return bool(status and status.get('online'))
+
+    async def _probe_rcon(self, server_id: str) -> Optional[int]:
+        """RCON 응답 + 게임 시간 (틱 카운터) - 응답 없으면 None"""
+        rcon = self.server_manager.rcon_clients.get(server_id)
+        try:
+            success, response = await asyncio.wait_for(
+                rcon.execute_command("time query gametime"), timeout=self.PROBE_TIMEOUT + 1
+            )
+        except asyncio.TimeoutError:
+            return None
+        if not success:
+            return None
+        match = re.search(r'(\d+)', response or '')
+        return int(match.group(1)) if match else 0
+
+    def _main_thread_cpu(self, server_id: str) -> Optional[float]:
+        """메인 스레드("Server thread") CPU 시간 (Linux /proc, 블로킹)"""
+        process = self.server_manager.find_java_process(server_id)
+        if not process:
+            return None
+        task_dir = Path(f'/proc/{process.pid}/task')
+        if not task_dir.is_dir():
+            return None
+        for task in task_dir.iterdir():
+            try:
+                if (task / 'comm').read_text().strip() != 'Server thread':
+                    continue
+                fields = (task / 'stat').read_text().rsplit(')', 1)[1].split()
+                return (int(fields[11]) + int(fields[12])) / 100  # utime + stime (clock tick)
+            except (OSError, IndexError, ValueError):
+                continue
+        return None
+
+    async def _check_server(self, server_id: str):
+        state = self.state.setdefault(server_id, {
+            'failures': 0, 'ticks': None, 'tick_source': None, 'checked': None, 'stalled': 0, 'handled': False
+        })
+
+        slp_ok = await self._probe_slp(server_id)
+
+        if self.server_manager.has_rcon(server_id):
+            ticks = await self._probe_rcon(server_id)
+            rcon_ok = ticks is not None
+            tick_source = 'gametime'
+        else:
+            ticks = await asyncio.to_thread(self._main_thread_cpu, server_id)
+            rcon_ok = False
+            tick_source = 'cpu'
+
+        # 틱 카운터가 직전 확인 이후 늘지 않음 (RCON 무응답도 정지로 간주)
+        # CPU 시간은 늘지 않거나(대기/데드락) 한 코어를 계속 쓰면(무한 루프) 정지
+        now = time.monotonic()
+        previous = state['ticks'] if state['tick_source'] == tick_source else None
+        if ticks is None:
+            stalled = True
+        elif previous is None:
+            stalled = False
+        elif tick_source == 'cpu':
+            busy = (ticks - previous) / max(1e-6, now - state['checked'])
+            stalled = ticks <= previous or busy >= 0.9
+        else:
+            stalled = ticks <= previous
+        state['stalled'] = state['stalled'] + 1 if stalled else 0
+        if ticks is not None:
+            state['ticks'] = ticks
+            state['tick_source'] = tick_source
+        state['checked'] = now
+
+        if slp_ok or rcon_ok:
+            if state['failures'] >= 1:
+                print(f"✅ [{server_id}] 응답 회복")
+            state['failures'] = 0
+            state['handled'] = False
+            return
+
+        state['failures'] += 1
+        print(f"⚠️ [{server_id}] 응답 없음 ({state['failures']}/{self.failures}, 틱 정지 {state['stalled']}회)")
+
+        if state['failures'] >= self.failures and state['stalled'] >= self.failures - 1 and not state['handled']:
+            state['handled'] = True
+            await self._handle_hang(server_id, state)
+
+    # ========================================
+    # 행 처리
+    # ========================================
+
+    def _jcmd(self, server_id: str) -> Optional[str]:
+        """서버를 실행한 Java와 같은 JDK의 jcmd (없으면 PATH)"""
+        config = self.server_manager.get_server_config(server_id) or {}
+        runtime = config.get('java_runtime')
+        if runtime:
+            candidate = Path(runtime['path']).parent / 'jcmd'
+            if candidate.exists():
+                return str(candidate)
+        return shutil.which('jcmd')
+
+    def _capture(self, server_id: str, pid: int) -> dict:
+        """
+        스레드 덤프 (+ 힙 정보) 저장 (블로킹)
+
+        Returns:
+            {'files': [...], 'suspect': 원인 추정 패키지 | None, 'method': 'jcmd' | 'sigquit' | None}
+        """
+        config = self.server_manager.get_server_config(server_id) or {}
+        diagnostics = Path(config.get('path', '.')) / 'diagnostics'
+        diagnostics.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        result = {'files': [], 'suspect': None, 'method': None}
+        jcmd = self._jcmd(server_id)
+
+        commands = [('threads', ['Thread.print', '-l'])]
+        if self.heap_info:
+            commands.append(('heap', ['GC.heap_info']))
+
+        for name, args in commands:
+            if not jcmd:
+                break
+            output_file = diagnostics / f'hang_{stamp}_{name}.txt'
+            try:
+                completed = subprocess.run(
+                    [jcmd, str(pid)] + args,
+                    capture_output=True, text=True, timeout=self.JCMD_TIMEOUT
+                )
+            except (subprocess.TimeoutExpired, OSError) as e:
+                print(f"⚠️ [{server_id}] jcmd {args[0]} 실패: {e}")
+                continue
+            if completed.returncode != 0 or not completed.stdout.strip():
+                print(f"⚠️ [{server_id}] jcmd {args[0]} 실패: {completed.stderr.strip()[:200]}")
+                continue
+
+            output_file.write_text(completed.stdout, encoding='utf-8')
+            result['files'].append(str(output_file))
+            result['method'] = 'jcmd'
+            if name == 'threads':
+                result['suspect'] = self.find_suspect(completed.stdout)
+
+        # attach 실패 시 SIGQUIT - JVM이 표준 출력(Screen 콘솔)에 스레드 덤프 출력
+        if not result['files']:
+            try:
+                psutil.Process(pid).send_signal(3)
+                result['method'] = 'sigquit'
+            except (psutil.Error, ValueError):
+                pass
+
+        return result
+
+    @classmethod
+    def find_suspect(cls, thread_dump: str) -> Optional[str]:
+        """메인 스레드 스택에서 처음 나오는 서버/자바 외 패키지 (원인 플러그인 후보)"""
+        match = re.search(r'^"Server thread".*?(?=^\s*$)', thread_dump, re.MULTILINE | re.DOTALL)
+        if not match:
+            return None
+
+        for frame in re.findall(r'^\s+at ([\w$.]+)\.[\w$<>]+\(', match.group(0), re.MULTILINE):
+            if not frame.startswith(cls.CORE_PACKAGES):
+                return frame
+        return None
+
+    async def _handle_hang(self, server_id: str, state: dict):
+        manager = self.server_manager
+        config = manager.get_server_config(server_id) or {}
+
+        process = await asyncio.to_thread(manager.find_java_process, server_id)
+        started_at = manager.started_at.get(server_id)
+
+        print(f"🧊 [{server_id}] 서버 응답 없음 (행) - 스레드 덤프 수집")
+        capture = await asyncio.to_thread(self._capture, server_id, process.pid) if process else {
+            'files': [], 'suspect': None, 'method': None
+        }
+
+        incident = {
+            'server_id': server_id,
+            'name': config.get('name', server_id),
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'failures': state['failures'],
+            'tick_source': state['tick_source'],
+            'uptime_seconds': time.time() - started_at if started_at else None,
+            'files': capture['files'],
+            'suspect': capture['suspect'],
+            'method': capture['method'],
+            'action': self.action if config.get('auto_restart', True) else 'dump'
+        }
+        self.incidents.append(incident)
+        self.incidents = self.incidents[-50:]
+
+        if incident['suspect']:
+            print(f"   🔎 메인 스레드 원인 후보: {incident['suspect']}")
+
+        if self.notify:
+            try:
+                await self.notify(incident)
+            except Exception as e:
+                print(f"⚠️ 행 알림 전송 실패: {e}")
+
+        if incident['action'] == 'restart':
+            await self._force_restart(server_id, process)
+
+    async def _force_restart(self, server_id: str, process: Optional[psutil.Process]):
+        """강제 종료 후 재시작 (멈춘 서버는 stop 명령을 처리하지 못함)"""
+        manager = self.server_manager
+        print(f"   🔁 [{server_id}] 강제 재시작")
+
+        await manager.stop_server(server_id, force=True)
+
+        # 종료 훅에서 멈춘 JVM은 SIGKILL
+        if process:
+            try:
+                await asyncio.to_thread(process.wait, 15)
+            except psutil.TimeoutExpired:
+                process.kill()
+            except psutil.Error:
+                pass
+
+        self.state.pop(server_id, None)
+        success, message = await manager.start_server(server_id)
+        print(f"   {'✅' if success else '❌'} [{server_id}] 재시작 {'성공' if success else '실패'}")
@@ -0,0 +1,225 @@
+"""
+HotSpot 성능 카운터(hsperfdata) 읽기
+경로: modules/minecraft/HsperfReader.py
+
+JVM은 GC 횟수/시간, 세대별 힙 크기, 클래스 로딩, safepoint 통계를
+/tmp/hsperfdata_<사용자>/<pid> 파일에 메모리 매핑으로 공개합니다.
+JMX/attach/추가 프로세스 없이 이 파일을 mmap으로 읽어 게임 서버에 부담을 주지 않습니다.
+
+※ -XX:+PerfDisableSharedMem 옵션으로 실행한 JVM은 파일이 없어 읽을 수 없습니다.
+"""
+
+import mmap
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+class HsperfData:
+    """hsperfdata 파일 하나 (mmap 유지, 읽을 때마다 현재 값 해석)"""
+
+    MAGIC = 0xcafec0c0
+    PROLOGUE_SIZE = 32
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic = struct.unpack_from('>I', self._map, 0)[0]
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"hsperfdata 형식이 아닙니다: {path}")
+
+        # 0 = big endian, 1 = little endian
+        self._order = '<' if self._map[4] == 1 else '>'
+        self.major_version = self._map[5]
+
+        # 카운터 위치 캐시 {이름: (data 위치, 타입, 길이)} - 항목 구성은 JVM 시작 후 거의 변하지 않음
+        self._layout: Dict[str, tuple] = {}
+        self._num_entries = 0
+
+    def close(self):
+        try:
+            self._map.close()
+        finally:
+            self._file.close()
+
+    def _scan_entries(self):
+        order = self._order
+        entry_offset, num_entries = struct.unpack_from(order + 'ii', self._map, 24)
+        if num_entries == self._num_entries:
+            return
+
+        layout = {}
+        offset = entry_offset
+        for _ in range(num_entries):
+            entry_length, name_offset, vector_length, data_type, _flags, _units, _variability, data_offset = \
+                struct.unpack_from(order + 'iiiBBBBi', self._map, offset)
+            if entry_length <= 0:
+                break
+
+            name_start = offset + name_offset
+            name_end = self._map.find(b'\0', name_start, offset + entry_length)
+            name = self._map[name_start:name_end].decode('ascii', errors='replace')
+
+            layout[name] = (offset + data_offset, chr(data_type), vector_length)
+            offset += entry_length
+
+        self._layout = layout
+        self._num_entries = num_entries
+
+    def read(self) -> Dict[str, Union[int, str]]:
+        """모든 카운터 {이름: 값} (long 또는 문자열)"""
+        self._scan_entries()
+
+        values = {}
+        for name, (position, data_type, vector_length) in self._layout.items():
+            if vector_length == 0 and data_type == 'J':
+                values[name] = struct.unpack_from(self._order + 'q', self._map, position)[0]
+            elif data_type == 'B':
+                raw = self._map[position:position + vector_length]
+                values[name] = raw.split(b'\0', 1)[0].decode('utf-8', errors='replace')
+        return values
+
+
+class HsperfReader:
+    """관리 중인 JVM들의 hsperfdata 요약 (pid별 mmap 유지)"""
+
+    def __init__(self):
+        self._files: Dict[int, HsperfData] = {}
+
+        # 비율 계산용 직전 값 {pid: (시각, 영 GC 횟수, 올드 GC 횟수, 정지 시간)}
+        self._previous: Dict[int, tuple] = {}
+
+    @staticmethod
+    def find_file(pid: int, user: Optional[str] = None) -> Optional[Path]:
+        """/tmp/hsperfdata_<user>/<pid> 찾기 (사용자를 모르면 모든 hsperfdata_* 폴더 확인)"""
+        tmp = Path(tempfile.gettempdir())
+        if user:
+            candidate = tmp / f'hsperfdata_{user}' / str(pid)
+            return candidate if candidate.exists() else None
+
+        for directory in tmp.glob('hsperfdata_*'):
+            candidate = directory / str(pid)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _open(self, pid: int, user: Optional[str]) -> Optional[HsperfData]:
+        data = self._files.get(pid)
+        if data:
+            return data
+
+        path = self.find_file(pid, user)
+        if not path:
+            return None
+        try:
+            data = HsperfData(path)
+        except (OSError, ValueError):
+            return None
+
+        self._files[pid] = data
+        return data
+
+    def release(self, pid: int):
+        """종료된 JVM의 mmap 해제"""
+        data = self._files.pop(pid, None)
+        if data:
+            data.close()
+        self._previous.pop(pid, None)
+
+    def release_missing(self, live_pids):
+        for pid in list(self._files.keys()):
+            if pid not in live_pids:
+                self.release(pid)
+
+    def sample(self, pid: int, user: Optional[str] = None) -> Optional[dict]:
+        """
+        JVM 메모리/GC 요약
+
+        Returns:
+            {
+                'heap_used_mb', 'heap_committed_mb', 'heap_max_mb',
+                'metaspace_used_mb',
+                'young_gc_count', 'old_gc_count',
+                'young_gc_per_min', 'old_gc_per_min',
+                'gc_pause_seconds',       # 누적 GC 시간
+                'gc_pause_percent',       # 직전 샘플 이후 GC에 쓴 시간 비율
+                'safepoint_seconds', 'loaded_classes'
+            }
+            (파일이 없으면 None)
+        """
+        data = self._open(pid, user)
+        if not data:
+            return None
+
+        try:
+            counters = data.read()
+        except Exception:
+            self.release(pid)
+            return None
+
+        frequency = counters.get('sun.os.hrt.frequency') or 1_000_000_000
+
+        def total(prefix: str, suffix: str) -> int:
+            return sum(
+                value for name, value in counters.items()
+                if name.startswith(prefix) and name.endswith(suffix) and isinstance(value, int)
+            )
+
+        # 세대별 공간 사용량 합 / 세대별 확보(committed) 크기 합
+        heap_used = total('sun.gc.generation.', '.used')
+        heap_committed = sum(
+            value for name, value in counters.items()
+            if name.startswith('sun.gc.generation.') and name.count('.') == 4
+            and name.endswith('.capacity') and isinstance(value, int)
+        )
+        heap_max = sum(
+            value for name, value in counters.items()
+            if name.startswith('sun.gc.generation.') and name.count('.') == 4
+            and name.endswith('.maxCapacity') and isinstance(value, int)
+        )
+
+        # collector.0 = 영(young) GC, collector.1 = 올드/전체 GC (G1/Parallel/Serial 공통)
+        young_count = counters.get('sun.gc.collector.0.invocations', 0)
+        old_count = counters.get('sun.gc.collector.1.invocations', 0)
+        pause_ticks = counters.get('sun.gc.collector.0.time', 0) + counters.get('sun.gc.collector.1.time', 0)
+        pause_seconds = pause_ticks / frequency
+
+        now = time.monotonic()
+        young_rate = old_rate = pause_percent = None
+        previous = self._previous.get(pid)
+        if previous:
+            elapsed = now - previous[0]
+            if elapsed > 0:
+                young_rate = (young_count - previous[1]) / elapsed * 60
+                old_rate = (old_count - previous[2]) / elapsed * 60
+                pause_percent = (pause_seconds - previous[3]) / elapsed * 100
+        self._previous[pid] = (now, young_count, old_count, pause_seconds)
+
+        mb = 1024 * 1024
+        return {
+            'heap_used_mb': heap_used / mb,
+            'heap_committed_mb': heap_committed / mb,
+            'heap_max_mb': heap_max / mb,
+            'metaspace_used_mb': counters.get('sun.gc.metaspace.used', 0) / mb,
+            'young_gc_count': young_count,
+            'old_gc_count': old_count,
+            'young_gc_per_min': young_rate,
+            'old_gc_per_min': old_rate,
+            'gc_pause_seconds': pause_seconds,
+            'gc_pause_percent': pause_percent,
+            'safepoint_seconds': counters.get('sun.rt.safepointTime', 0) / frequency,
+            'loaded_classes': counters.get('java.cls.loadedClasses', 0)
+        }
+
+    def close(self):
+        for pid in list(self._files.keys()):
+            self.release(pid)
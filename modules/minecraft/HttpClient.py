@@ -0,0 +1,93 @@
+"""
+구동기 관리자가 소유하는 공유 HTTP 클라이언트
+경로: modules/minecraft/HttpClient.py
+
+- 하나의 aiohttp 세션 + 커넥션 풀 (호스트별 연결 수 제한, keep-alive로 TLS 핸드셰이크 재사용)
+- 호스트별 전송량/처리량/재시도/실패 통계
+"""
+
+import aiohttp
+from typing import Optional, Dict
+from urllib.parse import urlparse
+
+
+class HttpClient:
+    """커넥션 풀링 공유 세션 + 호스트별 통계"""
+
+    USER_AGENT = 'MinecraftBot/1.0 (Discord Server Manager)'
+
+    def __init__(self, limit: int = 16, limit_per_host: int = 4):
+        """
+        Args:
+            limit: 전체 동시 연결 수
+            limit_per_host: 호스트별 동시 연결 수
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # {host: {'requests', 'bytes', 'seconds', 'retries', 'failures'}}
+        self.host_stats: Dict[str, dict] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공유 세션 (이벤트 루프 안에서 처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.USER_AGENT}
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ========================================
+    # 통계
+    # ========================================
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).hostname or url
+
+    def _stats_for(self, url: str) -> dict:
+        host = self.host_of(url)
+        if host not in self.host_stats:
+            self.host_stats[host] = {'requests': 0, 'bytes': 0, 'seconds': 0.0, 'retries': 0, 'failures': 0}
+        return self.host_stats[host]
+
+    def record_transfer(self, url: str, size: int, seconds: float, retries: int = 0):
+        """완료된 전송 기록"""
+        stats = self._stats_for(url)
+        stats['requests'] += 1
+        stats['bytes'] += size
+        stats['seconds'] += seconds
+        stats['retries'] += retries
+
+    def record_failure(self, url: str, retries: int = 0):
+        """실패한 전송 기록"""
+        stats = self._stats_for(url)
+        stats['requests'] += 1
+        stats['failures'] += 1
+        stats['retries'] += retries
+
+    def get_stats_text(self) -> str:
+        """호스트별 통계 텍스트"""
+        if not self.host_stats:
+            return "다운로드 없음"
+
+        lines = []
+        for host, s in sorted(self.host_stats.items(), key=lambda x: x[1]['bytes'], reverse=True):
+            speed = s['bytes'] / s['seconds'] / 1048576 if s['seconds'] > 0 else 0.0
+            lines.append(
+                f"  {host}: {s['requests']}건, {s['bytes'] / 1048576:.1f}MB, "
+                f"평균 {speed:.1f}MB/s, 재시도 {s['retries']}, 실패 {s['failures']}"
+            )
+        return "\n".join(lines)
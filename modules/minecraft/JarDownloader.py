@@ -0,0 +1,238 @@
+"""
+스트리밍 + 해시 검증 + 이어받기 JAR 다운로더
+경로: modules/minecraft/JarDownloader.py
+
+- 청크 단위로 임시 파일(.part)에 기록 (메모리에 전체 jar를 올리지 않음)
+- 다운로드 중 SHA-256 (필요 시 SHA-1) 계산 후 게시된 해시와 비교
+- 검증이 끝난 파일만 최종 경로로 원자적 rename → 잘린 jar가 server.jar로 보이지 않음
+- 중단 시 HTTP Range + If-Range 로 이어받기 (봇 재시작 후에도 .part 유지)
+"""
+
+import aiohttp
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, Callable
+
+
+class JarDownloader:
+    """모든 구동기/플러그인 업데이터가 공유하는 다운로더"""
+
+    CHUNK_SIZE = 1024 * 1024  # 1MB
+    PROGRESS_INTERVAL = 5.0  # 진행 상황 출력 간격 (초)
+
+    def __init__(self, retries: int = 3):
+        self.retries = retries
+
+    @staticmethod
+    def _part_paths(dest: Path):
+        part_file = dest.with_name(dest.name + '.part')
+        meta_file = dest.with_name(dest.name + '.part.json')
+        return part_file, meta_file
+
+    @staticmethod
+    def _hash_existing(path: Path, hashers: list):
+        """이어받기 전 기존 .part 내용을 해시에 반영"""
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(JarDownloader.CHUNK_SIZE)
+                if not chunk:
+                    break
+                for h in hashers:
+                    h.update(chunk)
+
+    @staticmethod
+    def _write_chunk(f, data: bytearray, hashers: list):
+        """청크 기록 + 해시 갱신 (작업 스레드)"""
+        f.write(data)
+        for h in hashers:
+            h.update(data)
+
+    @staticmethod
+    def _sync(f):
+        f.flush()
+        os.fsync(f.fileno())
+
+    @staticmethod
+    def _default_progress(label: str, done: int, total: Optional[int], speed: float):
+        if total:
+            print(f"   ⬇️ {label}: {done / total * 100:5.1f}% ({done / 1048576:.1f}/{total / 1048576:.1f}MB, {speed / 1048576:.1f}MB/s)")
+        else:
+            print(f"   ⬇️ {label}: {done / 1048576:.1f}MB ({speed / 1048576:.1f}MB/s)")
+
+    async def download(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        dest: Path,
+        sha256: Optional[str] = None,
+        sha1: Optional[str] = None,
+        label: Optional[str] = None,
+        progress: Optional[Callable[[str, int, Optional[int], float], None]] = None,
+        headers: Optional[dict] = None
+    ) -> dict:
+        """
+        파일 다운로드 (검증 후 원자적 교체)
+
+        Args:
+            session: aiohttp 세션
+            url: 다운로드 URL
+            dest: 최종 저장 경로
+            sha256: 게시된 SHA-256 (있으면 검증)
+            sha1: 게시된 SHA-1 (Mojang 등, 있으면 검증)
+            label: 로그에 표시할 이름
+            progress: 진행 콜백 (label, 받은 바이트, 전체 바이트, 초당 바이트)
+            headers: 추가 요청 헤더
+
+        Returns:
+            {'path', 'size', 'sha256', 'seconds', 'speed', 'resumed', 'attempts'}
+
+        Raises:
+            RuntimeError: 재시도 후에도 실패 / 해시 불일치
+        """
+        label = label or dest.name
+        progress = progress or self._default_progress
+        last_error = None
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                result = await self._download_once(session, url, dest, sha256, sha1, label, progress, headers)
+                result['attempts'] = attempt
+                return result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_error = e
+                if attempt < self.retries:
+                    wait = 2 ** attempt
+                    print(f"   ⚠️ {label} 다운로드 실패 ({attempt}/{self.retries}): {e} - {wait}초 후 이어받기")
+                    await asyncio.sleep(wait)
+
+        raise RuntimeError(f"{label} 다운로드 실패: {last_error}")
+
+    async def _download_once(self, session, url, dest, sha256, sha1, label, progress, headers) -> dict:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part_file, meta_file = self._part_paths(dest)
+
+        # 이전 .part 정보 (같은 URL일 때만 이어받기)
+        part_meta = {}
+        if part_file.exists() and meta_file.exists():
+            try:
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    part_meta = json.load(f)
+            except Exception:
+                part_meta = {}
+
+        offset = 0
+        if part_meta.get('url') == url and part_file.exists():
+            offset = part_file.stat().st_size
+        elif part_file.exists():
+            part_file.unlink()
+
+        request_headers = dict(headers or {})
+        if offset:
+            request_headers['Range'] = f'bytes={offset}-'
+            etag = part_meta.get('etag')
+            # If-Range에는 약한 ETag(W/)를 쓸 수 없음
+            validator = etag if etag and not etag.startswith('W/') else part_meta.get('last_modified')
+            if validator:
+                # 원본이 바뀌었으면 서버가 206 대신 200(전체)으로 응답
+                request_headers['If-Range'] = validator
+
+        hash256 = hashlib.sha256()
+        hash1 = hashlib.sha1() if sha1 else None
+        hashers = [h for h in (hash256, hash1) if h]
+
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=15, sock_read=60)
+        started = time.monotonic()
+
+        async with session.get(url, headers=request_headers, timeout=timeout) as resp:
+            if resp.status == 416 and offset:
+                # .part가 원본보다 크거나 같음 - 처음부터 다시 받기
+                part_file.unlink()
+                raise RuntimeError("Range 범위 오류 - .part 초기화")
+
+            if resp.status == 206 and offset:
+                mode = 'ab'
+                await asyncio.to_thread(self._hash_existing, part_file, hashers)
+            elif resp.status == 200:
+                mode = 'wb'
+                offset = 0
+            else:
+                raise RuntimeError(f"HTTP {resp.status}")
+
+            content_length = resp.content_length
+            total = offset + content_length if content_length is not None else None
+
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': url,
+                    'etag': resp.headers.get('ETag'),
+                    'last_modified': resp.headers.get('Last-Modified'),
+                    'total': total
+                }, f)
+
+            if offset:
+                print(f"   ↪️ {label}: {offset / 1048576:.1f}MB 지점부터 이어받기")
+
+            done = offset
+            received = 0
+            last_report = started
+
+            # 디스크 쓰기/해시/fsync는 이벤트 루프 밖에서 (작은 청크는 모아서 1MB 단위로)
+            buffer = bytearray()
+            with open(part_file, mode) as f:
+                async for chunk in resp.content.iter_chunked(self.CHUNK_SIZE):
+                    buffer += chunk
+                    if len(buffer) >= self.CHUNK_SIZE:
+                        data, buffer = buffer, bytearray()
+                        await asyncio.to_thread(self._write_chunk, f, data, hashers)
+                    done += len(chunk)
+                    received += len(chunk)
+
+                    now = time.monotonic()
+                    if now - last_report >= self.PROGRESS_INTERVAL:
+                        progress(label, done, total, received / max(now - started, 1e-6))
+                        last_report = now
+
+                if buffer:
+                    await asyncio.to_thread(self._write_chunk, f, buffer, hashers)
+                await asyncio.to_thread(self._sync, f)
+
+        if total is not None and done != total:
+            raise RuntimeError(f"크기 불일치 ({done}/{total} bytes)")
+
+        digest256 = hash256.hexdigest()
+
+        # 해시 검증 (불일치 시 .part 폐기 → 다음 시도는 처음부터)
+        mismatch = None
+        if sha256 and digest256.lower() != sha256.lower():
+            mismatch = f"SHA-256 불일치 (기대 {sha256[:12]}…, 실제 {digest256[:12]}…)"
+        elif sha1 and hash1.hexdigest().lower() != sha1.lower():
+            mismatch = f"SHA-1 불일치 (기대 {sha1[:12]}…, 실제 {hash1.hexdigest()[:12]}…)"
+
+        if mismatch:
+            part_file.unlink(missing_ok=True)
+            meta_file.unlink(missing_ok=True)
+            raise RuntimeError(mismatch)
+
+        # 원자적 교체
+        os.replace(part_file, dest)
+        meta_file.unlink(missing_ok=True)
+
+        seconds = time.monotonic() - started
+        speed = received / max(seconds, 1e-6)
+        verified = "검증됨" if (sha256 or sha1) else "해시 미게시"
+        print(f"   ✅ {label}: {done / 1048576:.1f}MB, {seconds:.1f}초, {speed / 1048576:.1f}MB/s ({verified})")
+
+        return {
+            'path': dest,
+            'size': done,
+            'sha256': digest256,
+            'seconds': seconds,
+            'speed': speed,
+            'resumed': offset
+        }
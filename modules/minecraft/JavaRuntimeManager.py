@@ -0,0 +1,228 @@
+"""
+설치된 Java 런타임 목록 + 서버별 Java 선택
+경로: modules/minecraft/JavaRuntimeManager.py
+
+- /usr/lib/jvm, JAVA_HOME, PATH의 java, 설정의 JAVA_PATHS에서 JDK/JRE 탐색
+- 버전/벤더는 실행 파일 mtime 기준으로 캐시 (java_runtimes.json)
+- 구동기의 최소 Java 버전(min_java)에 맞춰 서버별 런타임 선택
+  · Vanilla/Paper 1.17 이상(Java 16+): 조건을 만족하는 가장 최신 런타임
+  · 그 외(Forge/Fabric/Spigot, 구버전): 조건을 만족하는 가장 가까운 버전
+    (구버전 Forge/ASM은 새 Java에서 "Unsupported class file major version"으로 실패)
+- bot_config.json의 "java"로 서버별 지정 (주 버전 숫자 또는 java 실행 파일 경로)
+"""
+
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+class JavaRuntimeManager:
+    """Java 런타임 탐색/선택"""
+
+    NEWEST_OK = ('vanilla', 'paper')  # 최신 Java에서도 문제없는 구동기
+
+    def __init__(self, cache_file: Path, extra_paths: Optional[List[str]] = None):
+        """
+        Args:
+            cache_file: 버전/벤더 캐시 파일
+            extra_paths: 추가 탐색 경로 (JDK 폴더 또는 java 실행 파일)
+        """
+        self.cache_file = cache_file
+        self.extra_paths = extra_paths or []
+
+        # {실제 경로: {'path', 'version', 'full_version', 'vendor', 'mtime'}}
+        self._cache: Dict[str, dict] = self._load_cache()
+        self.runtimes: List[dict] = []
+
+    # ========================================
+    # 캐시
+    # ========================================
+
+    def _load_cache(self) -> Dict[str, dict]:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_cache(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"⚠️ Java 런타임 캐시 저장 실패: {e}")
+
+    # ========================================
+    # 탐색
+    # ========================================
+
+    @staticmethod
+    def _java_in(home: Path) -> Optional[Path]:
+        """JDK 폴더 또는 실행 파일 경로 → java 실행 파일"""
+        exe = 'java.exe' if platform.system() == "Windows" else 'java'
+        for candidate in (home, home / 'bin' / exe, home / 'Contents' / 'Home' / 'bin' / exe):
+            if candidate.is_file() and os.access(candidate, os.X_OK):
+                return candidate
+        return None
+
+    def _candidates(self) -> List[Path]:
+        homes = []
+
+        for root in ('/usr/lib/jvm', '/usr/java', '/opt/java', '/Library/Java/JavaVirtualMachines',
+                     'C:/Program Files/Java', 'C:/Program Files/Eclipse Adoptium'):
+            root_path = Path(root)
+            if root_path.is_dir():
+                homes.extend(sorted(root_path.iterdir()))
+
+        if os.environ.get('JAVA_HOME'):
+            homes.append(Path(os.environ['JAVA_HOME']))
+
+        on_path = shutil.which('java')
+        if on_path:
+            homes.append(Path(on_path))
+
+        homes.extend(Path(p) for p in self.extra_paths)
+
+        found = []
+        seen = set()
+        for home in homes:
+            java = self._java_in(home)
+            if not java:
+                continue
+            real = java.resolve()
+            if real in seen:
+                continue
+            seen.add(real)
+            found.append(real)
+        return found
+
+    @staticmethod
+    def _probe(java: Path) -> Optional[dict]:
+        """java -XshowSettings:properties -version 출력에서 버전/벤더 읽기"""
+        try:
+            result = subprocess.run(
+                [str(java), '-XshowSettings:properties', '-version'],
+                capture_output=True, text=True, timeout=15
+            )
+        except Exception:
+            return None
+
+        output = result.stderr + result.stdout
+        props = dict(re.findall(r'^\s+([\w.]+) = (.*)$', output, re.MULTILINE))
+
+        full_version = props.get('java.version')
+        if not full_version:
+            match = re.search(r'version "([^"]+)"', output)
+            if not match:
+                return None
+            full_version = match.group(1)
+
+        parts = re.findall(r'\d+', full_version)
+        if not parts:
+            return None
+        major = int(parts[1]) if parts[0] == '1' and len(parts) > 1 else int(parts[0])
+
+        return {
+            'path': str(java),
+            'version': major,
+            'full_version': full_version,
+            'vendor': props.get('java.vendor', '알 수 없음')
+        }
+
+    def scan(self) -> List[dict]:
+        """
+        런타임 탐색 (바뀐 실행 파일만 다시 확인)
+
+        Returns:
+            [{'path', 'version', 'full_version', 'vendor'}, ...] (버전 높은 순)
+        """
+        runtimes = []
+        changed = False
+        live = set()
+
+        for java in self._candidates():
+            key = str(java)
+            live.add(key)
+            mtime = java.stat().st_mtime
+
+            info = self._cache.get(key)
+            if not info or info.get('mtime') != mtime:
+                info = self._probe(java)
+                if not info:
+                    continue
+                info['mtime'] = mtime
+                self._cache[key] = info
+                changed = True
+
+            runtimes.append(info)
+
+        for key in list(self._cache.keys()):
+            if key not in live:
+                del self._cache[key]
+                changed = True
+
+        if changed:
+            self._save_cache()
+
+        runtimes.sort(key=lambda r: (r['version'], [int(n) for n in re.findall(r'\d+', r['full_version'])]), reverse=True)
+        self.runtimes = runtimes
+        return runtimes
+
+    # ========================================
+    # 선택
+    # ========================================
+
+    def select(self, min_java: int, override: Union[int, str, None] = None,
+               core_type: Optional[str] = None) -> Optional[dict]:
+        """
+        서버에 사용할 런타임
+
+        Args:
+            min_java: 구동기의 최소 Java 버전
+            override: bot_config.json의 "java" (주 버전 또는 실행 파일 경로)
+            core_type: 구동기 종류 (vanilla/paper만 최신 런타임, 그 외/미상은 가장 가까운 버전)
+
+        Returns:
+            런타임 정보 (맞는 것이 없으면 None)
+        """
+        if override is not None:
+            if isinstance(override, int) or str(override).isdigit():
+                matches = [r for r in self.runtimes if r['version'] == int(override)]
+                if matches:
+                    return matches[0]
+                print(f"⚠️ 지정한 Java {override}을(를) 찾을 수 없습니다 - 자동 선택")
+            else:
+                java = self._java_in(Path(override))
+                if java:
+                    real = str(java.resolve())
+                    known = next((r for r in self.runtimes if r['path'] == real), None)
+                    return known or self._probe(java.resolve())
+                print(f"⚠️ 지정한 Java 경로가 없습니다: {override} - 자동 선택")
+
+        candidates = [r for r in self.runtimes if r['version'] >= min_java]
+        if not candidates:
+            return None
+
+        if min_java < 16 or core_type not in self.NEWEST_OK:
+            # 요구 버전과 가장 가까운 것 (Forge 1.17~1.20.4를 Java 21로 돌리면 ASM이 깨짐)
+            return min(candidates, key=lambda r: r['version'])
+
+        return candidates[0]
+
+    def get_summary_text(self) -> str:
+        if not self.runtimes:
+            return "Java 런타임을 찾을 수 없습니다"
+        return "\n".join(
+            f"  Java {r['version']} ({r['full_version']}, {r['vendor']}) - {r['path']}"
+            for r in self.runtimes
+        )
@@ -0,0 +1,257 @@
+"""
+Java Flight Recorder 프로파일링
+경로: modules/minecraft/JfrProfiler.py
+
+- jcmd <pid> JFR.start (profile 설정) → 지정 시간 후 JFR.dump + JFR.stop
+- .jfr 파일은 별도 작업 프로세스에서 JDK의 `jfr print --json`으로 읽어 요약
+  (실행 샘플/할당 이벤트가 수만 개라 봇 이벤트 루프와 분리)
+  · 핫 메서드 (실행 샘플 최상단 프레임)
+  · 할당이 많은 프레임
+  · GC / safepoint 정지
+  · CPU를 많이 쓴 스레드
+- 원본 기록은 logs/profiles/에 보관 (개수/총 용량 제한)
+"""
+
+import asyncio
+import json
+import multiprocessing
+import re
+import shutil
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SUMMARY_EVENTS = [
+    'jdk.ExecutionSample',
+    'jdk.ObjectAllocationSample',
+    'jdk.ObjectAllocationInNewTLAB',
+    'jdk.GarbageCollection',
+    'jdk.SafepointBegin',
+]
+
+# jcmd가 실패를 알리는 출력 (줄 시작 - 파일 경로 등 다른 줄의 "error"는 무시)
+JCMD_ERROR_PREFIXES = ('Error', 'Exception', 'Could not', 'java.', 'jdk.', 'com.sun.')
+
+
+def _duration_ms(value) -> float:
+    """JFR 시간 값 → ms ("PT0.0123S" 형식 또는 나노초 숫자)"""
+    if isinstance(value, (int, float)):
+        return value / 1_000_000
+    if isinstance(value, str):
+        match = re.fullmatch(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:([\d.]+)S)?', value)
+        if match:
+            hours, minutes, seconds = match.groups()
+            return ((int(hours or 0) * 60 + int(minutes or 0)) * 60 + float(seconds or 0)) * 1000
+    return 0.0
+
+
+def _frame_name(frame: dict) -> str:
+    method = frame.get('method') or {}
+    owner = ((method.get('type') or {}).get('name') or '?').replace('/', '.')
+    return f"{owner}.{method.get('name', '?')}"
+
+
+def _percentiles(values: List[float]) -> dict:
+    if not values:
+        return {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'p99_ms': 0.0}
+    ordered = sorted(values)
+    return {
+        'count': len(ordered),
+        'total_ms': sum(ordered),
+        'max_ms': ordered[-1],
+        'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    }
+
+
+def summarize_recording(jfr_tool: str, recording: str, top: int = 10) -> dict:
+    """
+    .jfr 요약 (작업 프로세스에서 실행 - 모듈 최상위 함수여야 함)
+
+    Returns:
+        {
+            'samples', 'hot_methods': [(메서드, 비율%)], 'hot_threads': [(스레드, 비율%)],
+            'alloc_frames': [(프레임, MB)], 'alloc_source',
+            'gc': {'count', 'total_ms', 'max_ms', 'p99_ms'}, 'safepoint': {...}
+        }
+    """
+    completed = subprocess.run(
+        [jfr_tool, 'print', '--json', '--events', ','.join(SUMMARY_EVENTS), recording],
+        capture_output=True, text=True, timeout=300
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip()[:300] or f"jfr 종료 코드 {completed.returncode}")
+
+    events = json.loads(completed.stdout).get('recording', {}).get('events', [])
+
+    methods = Counter()
+    threads = Counter()
+    alloc_sampled = Counter()
+    alloc_tlab = Counter()
+    gc_pauses = []
+    safepoints = []
+
+    for event in events:
+        kind = event.get('type')
+        values = event.get('values', {})
+        frames = (values.get('stackTrace') or {}).get('frames') or []
+
+        if kind == 'jdk.ExecutionSample':
+            if frames:
+                methods[_frame_name(frames[0])] += 1
+            thread = values.get('sampledThread') or {}
+            threads[thread.get('javaName') or thread.get('osName') or '?'] += 1
+
+        elif kind in ('jdk.ObjectAllocationSample', 'jdk.ObjectAllocationInNewTLAB'):
+            # 할당 위치: 최상단 프레임 (Java 16+ 샘플 이벤트는 weight, 이전 버전은 TLAB 크기)
+            weight = values.get('weight') or values.get('tlabSize') or values.get('allocationSize') or 0
+            if frames:
+                target = alloc_sampled if kind == 'jdk.ObjectAllocationSample' else alloc_tlab
+                target[_frame_name(frames[0])] += weight
+
+        elif kind == 'jdk.GarbageCollection':
+            gc_pauses.append(_duration_ms(values.get('sumOfPauses', values.get('duration'))))
+
+        elif kind == 'jdk.SafepointBegin':
+            safepoints.append(_duration_ms(values.get('duration')))
+
+    sample_count = sum(methods.values())
+    thread_count = sum(threads.values())
+    allocations = alloc_sampled or alloc_tlab
+
+    return {
+        'samples': sample_count,
+        'hot_methods': [(name, count / sample_count * 100) for name, count in methods.most_common(top)],
+        'hot_threads': [(name, count / thread_count * 100) for name, count in threads.most_common(5)],
+        'alloc_frames': [(name, size / 1024 / 1024) for name, size in allocations.most_common(top)],
+        'alloc_source': 'ObjectAllocationSample' if alloc_sampled else 'TLAB',
+        'gc': _percentiles(gc_pauses),
+        'safepoint': _percentiles(safepoints)
+    }
+
+
+class JfrProfiler:
+    """서버 JVM 프로파일링 (jcmd + jfr)"""
+
+    MIN_SECONDS = 10
+    MAX_SECONDS = 300
+
+    def __init__(self, server_manager, profiles_dir: Path, max_recordings: int = 20, max_total_mb: int = 500):
+        """
+        Args:
+            server_manager: ServerManager
+            profiles_dir: 기록 보관 폴더
+            max_recordings: 보관할 최대 기록 수
+            max_total_mb: 보관할 최대 총 용량 (MB)
+        """
+        self.server_manager = server_manager
+        self.profiles_dir = profiles_dir.resolve()
+        self.max_recordings = max_recordings
+        self.max_total_mb = max_total_mb
+
+        self.active: Dict[str, float] = {}  # 기록 중인 서버 {server_id: 시작 시각}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _tool(self, server_id: str, name: str) -> Optional[str]:
+        """서버를 실행한 JDK의 도구 (jcmd/jfr, 없으면 PATH)"""
+        config = self.server_manager.get_server_config(server_id) or {}
+        runtime = config.get('java_runtime')
+        if runtime:
+            candidate = Path(runtime['path']).parent / name
+            if candidate.exists():
+                return str(candidate)
+        return shutil.which(name)
+
+    async def _jcmd(self, jcmd: str, pid: int, *args: str) -> Tuple[bool, str]:
+        process = await asyncio.create_subprocess_exec(
+            jcmd, str(pid), *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            process.kill()
+            return False, "jcmd 응답 시간 초과"
+        text = output.decode('utf-8', errors='replace').strip()
+        failed = any(line.strip().startswith(JCMD_ERROR_PREFIXES) for line in text.splitlines())
+        return process.returncode == 0 and not failed, text
+
+    async def profile(self, server_id: str, seconds: int) -> Tuple[bool, str, Optional[dict], Optional[Path]]:
+        """
+        JFR 기록 + 요약
+
+        Returns:
+            (성공 여부, 메시지, 요약, 기록 파일)
+        """
+        seconds = max(self.MIN_SECONDS, min(self.MAX_SECONDS, seconds))
+
+        if server_id in self.active:
+            return False, "이미 이 서버를 프로파일링 중입니다.", None, None
+
+        jcmd = self._tool(server_id, 'jcmd')
+        jfr_tool = self._tool(server_id, 'jfr')
+        if not jcmd or not jfr_tool:
+            return False, "jcmd/jfr를 찾을 수 없습니다. (JRE가 아닌 JDK 11 이상 필요)", None, None
+
+        process = await asyncio.to_thread(self.server_manager.find_java_process, server_id)
+        if not process:
+            return False, "실행 중인 서버의 JVM 프로세스를 찾을 수 없습니다.", None, None
+
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        recording = self.profiles_dir / f"{server_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jfr"
+        name = f"bot-{server_id}-{int(time.time())}"
+
+        self.active[server_id] = time.time()
+        try:
+            success, output = await self._jcmd(jcmd, process.pid, 'JFR.start', f'name={name}', 'settings=profile')
+            if not success:
+                return False, f"JFR 시작 실패: {output[:300]}", None, None
+            print(f"🎥 [{server_id}] JFR 기록 시작 ({seconds}초)")
+
+            try:
+                await asyncio.sleep(seconds)
+                success, output = await self._jcmd(jcmd, process.pid, 'JFR.dump', f'name={name}', f'filename={recording}')
+            finally:
+                await self._jcmd(jcmd, process.pid, 'JFR.stop', f'name={name}')
+
+            if not success or not recording.exists():
+                return False, f"JFR 저장 실패: {output[:300]}", None, None
+        finally:
+            self.active.pop(server_id, None)
+
+        await asyncio.to_thread(self._prune)
+
+        try:
+            if self._executor is None:
+                # 스레드가 여럿 도는 봇 프로세스를 fork하면 교착 가능 → spawn
+                self._executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context('spawn')
+                )
+            loop = asyncio.get_running_loop()
+            summary = await loop.run_in_executor(self._executor, summarize_recording, jfr_tool, str(recording))
+        except Exception as e:
+            return False, f"기록 분석 실패 (원본 보관: {recording.name}): {e}", None, recording
+
+        summary['seconds'] = seconds
+        return True, "프로파일링 완료", summary, recording
+
+    def _prune(self):
+        """오래된 기록 삭제 (개수/총 용량 제한)"""
+        recordings = sorted(self.profiles_dir.glob('*.jfr'), key=lambda p: p.stat().st_mtime, reverse=True)
+        total = 0
+        for index, path in enumerate(recordings):
+            size = path.stat().st_size
+            total += size
+            # 가장 최근 기록은 용량과 관계없이 유지
+            if index > 0 and (index >= self.max_recordings or total > self.max_total_mb * 1024 * 1024):
+                path.unlink(missing_ok=True)
+                print(f"🗑️ 오래된 JFR 기록 삭제: {path.name}")
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,190 @@
+"""
+JVM 튜닝 프로필
+경로: modules/minecraft/JvmProfiles.py
+
+bot_config.json의 "jvm_profile"로 서버별 JVM 인자 프로필 선택
+- "aikar-g1": G1GC + Aikar 플래그 (Paper 권장, -Xms == -Xmx, AlwaysPreTouch)
+- "zgc": ZGC (Java 17+, Java 21+는 세대별 ZGC), 큰 힙에서 짧은 정지 시간
+- "low-mem": SerialGC + 작은 스택/코드 캐시, 메모리가 적은 소형 서버용
+
+힙 크기, 구동기 종류, Java 버전에 맞춰 인자를 만들고
+GC 로그는 서버 폴더의 logs/gc.log에 기록합니다 (파일 회전).
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+PROFILES = ('aikar-g1', 'zgc', 'low-mem')
+
+# Java 실행 파일별 버전 캐시
+_java_versions: Dict[str, Optional[int]] = {}
+
+
+def detect_java_version(java: str = 'java') -> Optional[int]:
+    """
+    Java 주 버전 (java -version 출력 파싱)
+
+    "1.8.0_402" → 8, "17.0.10" → 17, "21" → 21
+    """
+    if java in _java_versions:
+        return _java_versions[java]
+
+    version = None
+    try:
+        result = subprocess.run([java, '-version'], capture_output=True, text=True, timeout=10)
+        match = re.search(r'version "(\d+)(?:\.(\d+))?', result.stderr + result.stdout)
+        if match:
+            major = int(match.group(1))
+            version = int(match.group(2)) if major == 1 and match.group(2) else major
+    except Exception:
+        pass
+
+    _java_versions[java] = version
+    return version
+
+
+def pins_heap(profile: Optional[str]) -> bool:
+    """
+    프로필이 -Xms == -Xmx로 힙을 고정하는지
+
+    low-mem과 프로필 없음만 min/max를 따로 쓰고, 알 수 없는 프로필은 aikar-g1로 처리되므로 고정
+    """
+    return profile is not None and profile != 'low-mem'
+
+
+def large_pages_flag() -> Optional[str]:
+    """호스트가 지원하는 큰 페이지 옵션 (미지원이면 None)"""
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('HugePages_Total:') and int(line.split()[1]) > 0:
+                    return '-XX:+UseLargePages'
+    except Exception:
+        pass
+
+    thp = Path('/sys/kernel/mm/transparent_hugepage/enabled')
+    try:
+        mode = thp.read_text()
+        if '[always]' in mode or '[madvise]' in mode:
+            return '-XX:+UseTransparentHugePages'
+    except Exception:
+        pass
+
+    return None
+
+
+def gc_log_args(java_version: Optional[int], log_file: str = 'logs/gc.log') -> List[str]:
+    """GC 로그 인자 (Java 9+ 통합 로깅, Java 8 구식 옵션)"""
+    if java_version and java_version >= 9:
+        return [f'-Xlog:gc*:file={log_file}:time,uptime,level,tags:filecount=5,filesize=10M']
+    return [
+        f'-Xloggc:{log_file}',
+        '-XX:+PrintGCDetails',
+        '-XX:+PrintGCDateStamps',
+        '-XX:+UseGCLogFileRotation',
+        '-XX:NumberOfGCLogFiles=5',
+        '-XX:GCLogFileSize=10M'
+    ]
+
+
+def _aikar_g1(max_mb: int) -> List[str]:
+    # https://docs.papermc.io/paper/aikars-flags (12GB 초과 힙은 신세대 비율 상향)
+    large = max_mb > 12 * 1024
+    return [
+        '-XX:+UseG1GC',
+        '-XX:+ParallelRefProcEnabled',
+        '-XX:MaxGCPauseMillis=200',
+        '-XX:+UnlockExperimentalVMOptions',
+        '-XX:+DisableExplicitGC',
+        '-XX:+AlwaysPreTouch',
+        f'-XX:G1NewSizePercent={40 if large else 30}',
+        f'-XX:G1MaxNewSizePercent={50 if large else 40}',
+        f'-XX:G1HeapRegionSize={16 if large else 8}M',
+        f'-XX:G1ReservePercent={15 if large else 20}',
+        '-XX:G1HeapWastePercent=5',
+        '-XX:G1MixedGCCountTarget=4',
+        f'-XX:InitiatingHeapOccupancyPercent={20 if large else 15}',
+        '-XX:G1MixedGCLiveThresholdPercent=90',
+        '-XX:G1RSetUpdatingPauseTimePercent=5',
+        '-XX:SurvivorRatio=32',
+        # -XX:+PerfDisableSharedMem은 쓰지 않음 (hsperfdata로 GC/힙 수집)
+        '-XX:MaxTenuringThreshold=1',
+        '-Dusing.aikars.flags=https://mcflags.emc.gs',
+        '-Daikars.new.flags=true'
+    ]
+
+
+def _zgc(java_version: int) -> List[str]:
+    args = ['-XX:+UseZGC', '-XX:+AlwaysPreTouch', '-XX:+DisableExplicitGC']
+    if java_version >= 21:
+        args.append('-XX:+ZGenerational')
+    return args
+
+
+def _low_mem() -> List[str]:
+    return [
+        '-XX:+UseSerialGC',
+        '-Xss512k',
+        '-XX:ReservedCodeCacheSize=64m',
+        '-XX:TieredStopAtLevel=1',
+        '-XX:+DisableExplicitGC'
+    ]
+
+
+def render_jvm_args(
+    profile: Optional[str],
+    min_mb: int,
+    max_mb: int,
+    core_type: Optional[str] = None,
+    java_version: Optional[int] = None
+) -> List[str]:
+    """
+    프로필 → JVM 인자 목록
+
+    Args:
+        profile: 'aikar-g1' | 'zgc' | 'low-mem' | None (힙 크기 + GC 로그만 지정)
+        min_mb / max_mb: bot_config.json의 memory.min / memory.max
+        core_type: 구동기 종류 (Forge/Fabric은 코드 캐시 확대)
+        java_version: Java 주 버전 (모르면 GC 옵션은 8 기준, GC 로그는 생략)
+    """
+    if profile is None:
+        # GC 로그 분석(/메모리분석)용 로그는 Java 9+ 통합 로깅일 때만
+        args = [f'-Xms{min_mb}M', f'-Xmx{max_mb}M']
+        if java_version and java_version >= 9:
+            args += gc_log_args(java_version)
+        return args
+
+    if profile not in PROFILES:
+        print(f"⚠️ 알 수 없는 JVM 프로필: {profile} (aikar-g1 사용)")
+        profile = 'aikar-g1'
+
+    # 버전을 모르면 GC 로그 생략 (Java 8 옵션은 9+에서, 통합 로깅은 8에서 시작 실패)
+    version_known = java_version is not None
+    java_version = java_version or 8
+
+    # ZGC는 Java 15부터 정식 지원
+    if profile == 'zgc' and java_version < 15:
+        print(f"⚠️ ZGC는 Java 15 이상 필요 (현재 {java_version}) - aikar-g1 사용")
+        profile = 'aikar-g1'
+
+    if not pins_heap(profile):
+        args = [f'-Xms{min_mb}M', f'-Xmx{max_mb}M'] + _low_mem()
+    else:
+        # 힙을 미리 확보해 실행 중 확장/축소로 인한 정지 방지
+        args = [f'-Xms{max_mb}M', f'-Xmx{max_mb}M']
+        args += _zgc(java_version) if profile == 'zgc' else _aikar_g1(max_mb)
+
+        large_pages = large_pages_flag()
+        if large_pages:
+            args.append(large_pages)
+
+    if core_type in ('forge', 'fabric') and profile != 'low-mem':
+        # 모드 서버는 JIT 코드 양이 많음
+        args.append('-XX:ReservedCodeCacheSize=256m')
+
+    if version_known:
+        args += gc_log_args(java_version)
+    return args
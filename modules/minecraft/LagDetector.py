@@ -0,0 +1,239 @@
+"""
+랙 스파이크 감지 + 자동 프로파일링
+경로: modules/minecraft/LagDetector.py
+
+서버 로그의 "Can't keep up! Is the server overloaded? Running 2345ms or 46 ticks behind"가
+짧은 시간에 몰리면 랙 장애를 열고
+- 접속자 수, 엔티티 수(RCON), 최근 실행된 명령어를 기록
+- spark 플러그인/모드가 있으면 spark 프로파일러, 없으면 JFR 기록을 잠깐 실행
+- 서버별 재발 대기시간(cooldown)으로 장애 수를 제한하고 요약을 알림 채널로 전송
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+_CANT_KEEP_UP = re.compile(r"Can't keep up!.*?Running (\d+)ms or (\d+) ticks behind")
+_COMMAND = re.compile(r'(\w+) issued server command: (/.+)$')
+_SPARK_URL = re.compile(r'(https://spark\.lucko\.me/\w+)')
+_COUNT = re.compile(r'count:?\s*(\d+)', re.IGNORECASE)
+
+
+class _LogTail:
+    """latest.log 이어 읽기 (처음 볼 때는 끝에서부터)"""
+
+    def __init__(self):
+        self.inode = None
+        self.offset = 0
+        self.partial = ''
+
+    def read(self, path: Path) -> List[str]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return []
+
+        if self.inode is None:
+            self.inode, self.offset = st.st_ino, st.st_size
+            return []
+        if self.inode != st.st_ino or st.st_size < self.offset:
+            # 서버 재시작으로 새 로그
+            self.inode, self.offset, self.partial = st.st_ino, 0, ''
+        if st.st_size == self.offset:
+            return []
+
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            f.seek(self.offset)
+            chunk = f.read(4 * 1024 * 1024)
+            self.offset = f.tell()
+
+        lines = (self.partial + chunk).split('\n')
+        self.partial = lines.pop()
+        return lines
+
+
+class LagDetector:
+    """서버 로그 기반 랙 장애 감지 (주기적으로 check() 호출)"""
+
+    def __init__(self, server_manager, spike_count: int = 3, window: int = 120,
+                 cooldown: int = 900, profile_seconds: int = 30):
+        """
+        Args:
+            server_manager: ServerManager
+            spike_count: window초 안에 이 횟수 이상 "Can't keep up!"이면 장애
+            window: 스파이크 묶음 판단 구간 (초)
+            cooldown: 같은 서버의 다음 장애까지 최소 간격 (초)
+            profile_seconds: 자동 프로파일링 시간 (초)
+        """
+        self.server_manager = server_manager
+        self.spike_count = spike_count
+        self.window = window
+        self.cooldown = cooldown
+        self.profile_seconds = profile_seconds
+        self.enabled = True
+
+        # 장애 요약 알림 (incident dict → 디스코드 전송)
+        self.notify: Optional[Callable[[dict], Awaitable]] = None
+
+        self._tails: Dict[str, _LogTail] = {}
+        self.spikes: Dict[str, deque] = {}  # {server_id: deque[(시각, ms, 틱)]}
+        self.commands: Dict[str, deque] = {}  # {server_id: deque[(시각, 플레이어, 명령어)]}
+        self.last_incident: Dict[str, float] = {}
+        self.open_incidents: Dict[str, dict] = {}
+        self.incidents: List[dict] = []
+        self._tasks: set = set()
+
+    # ========================================
+    # 로그 감시
+    # ========================================
+
+    def _read_logs(self) -> Dict[str, List[str]]:
+        """실행 중인 서버의 새 로그 줄 (블로킹)"""
+        new_lines = {}
+        for server_id in list(self.server_manager.running_servers.keys()):
+            config = self.server_manager.get_server_config(server_id)
+            if not config:
+                continue
+            tail = self._tails.setdefault(server_id, _LogTail())
+            lines = tail.read(Path(config['path']) / 'logs' / 'latest.log')
+            if lines:
+                new_lines[server_id] = lines
+        return new_lines
+
+    async def check(self):
+        if not self.enabled:
+            return
+
+        now = time.time()
+        for server_id, lines in (await asyncio.to_thread(self._read_logs)).items():
+            spikes = self.spikes.setdefault(server_id, deque(maxlen=100))
+            commands = self.commands.setdefault(server_id, deque(maxlen=20))
+            incident = self.open_incidents.get(server_id)
+
+            for line in lines:
+                match = _CANT_KEEP_UP.search(line)
+                if match:
+                    spikes.append((now, int(match.group(1)), int(match.group(2))))
+                    continue
+                match = _COMMAND.search(line)
+                if match:
+                    commands.append((now, match.group(1), match.group(2).strip()[:100]))
+                    continue
+                if incident:
+                    match = _SPARK_URL.search(line)
+                    if match:
+                        incident['profile_url'] = match.group(1)
+
+            recent = [s for s in spikes if now - s[0] <= self.window]
+            if len(recent) < self.spike_count or server_id in self.open_incidents:
+                continue
+            if now - self.last_incident.get(server_id, 0) < self.cooldown:
+                continue
+
+            self.last_incident[server_id] = now
+            task = asyncio.create_task(self._open_incident(server_id, recent))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    # ========================================
+    # 장애 처리
+    # ========================================
+
+    def _spark_installed(self, server_id: str) -> bool:
+        config = self.server_manager.get_server_config(server_id) or {}
+        server_path = Path(config.get('path', '.'))
+        return any(
+            jar.name.lower().startswith('spark')
+            for folder in ('plugins', 'mods') if (server_path / folder).is_dir()
+            for jar in (server_path / folder).glob('*.jar')
+        )
+
+    async def _rcon_count(self, server_id: str, selector: str) -> Optional[int]:
+        rcon = self.server_manager.rcon_clients.get(server_id)
+        if not rcon:
+            return None
+        try:
+            success, response = await asyncio.wait_for(
+                rcon.execute_command(f"execute if entity {selector}"), timeout=10
+            )
+        except asyncio.TimeoutError:
+            return None
+        match = _COUNT.search(response or '') if success else None
+        return int(match.group(1)) if match else None
+
+    async def _open_incident(self, server_id: str, spikes: list):
+        manager = self.server_manager
+        config = manager.get_server_config(server_id) or {}
+
+        status = await manager.get_server_status(server_id)
+        players = status.get('players', {}) if status and status.get('online') else {}
+
+        incident = {
+            'server_id': server_id,
+            'name': config.get('name', server_id),
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'spikes': len(spikes),
+            'behind_ms_total': sum(s[1] for s in spikes),
+            'behind_ms_max': max(s[1] for s in spikes),
+            'ticks_skipped': sum(s[2] for s in spikes),
+            'players': players.get('online'),
+            'player_names': players.get('names', []),
+            'entities': await self._rcon_count(server_id, '@e'),
+            'items': await self._rcon_count(server_id, '@e[type=item]'),
+            'recent_commands': [
+                f"{player}: {command}" for at, player, command in self.commands.get(server_id, [])
+                if time.time() - at <= self.window * 2
+            ][-8:],
+            'profiler': None,
+            'profile_url': None,
+            'profile_file': None
+        }
+        self.open_incidents[server_id] = incident
+        print(
+            f"🐌 [{server_id}] 랙 장애: {self.window}초 안에 스파이크 {len(spikes)}회 "
+            f"(최대 {incident['behind_ms_max']}ms 지연, 접속자 {incident['players']})"
+        )
+
+        try:
+            await self._capture_profile(server_id, incident)
+        finally:
+            self.open_incidents.pop(server_id, None)
+            self.incidents.append(incident)
+            self.incidents = self.incidents[-50:]
+
+        if self.notify:
+            try:
+                await self.notify(incident)
+            except Exception as e:
+                print(f"⚠️ 랙 알림 전송 실패: {e}")
+
+    async def _capture_profile(self, server_id: str, incident: dict):
+        """spark가 있으면 spark, 없으면 JFR로 짧게 프로파일링"""
+        manager = self.server_manager
+
+        if await asyncio.to_thread(self._spark_installed, server_id):
+            incident['profiler'] = 'spark'
+            success, _ = await manager.send_command(
+                server_id, f"spark profiler start --timeout {self.profile_seconds}"
+            )
+            if success:
+                # spark가 업로드 후 로그에 남기는 링크를 기다림 (check()에서 수집)
+                deadline = time.monotonic() + self.profile_seconds + 60
+                while time.monotonic() < deadline and not incident['profile_url']:
+                    await asyncio.sleep(5)
+                return
+
+        incident['profiler'] = 'jfr'
+        success, message, _, recording = await manager.jfr.profile(server_id, self.profile_seconds)
+        if recording:
+            incident['profile_file'] = str(recording)
+        if not success:
+            print(f"⚠️ [{server_id}] 랙 프로파일링 실패: {message}")
+
+    def close(self):
+        for task in list(self._tasks):
+            task.cancel()
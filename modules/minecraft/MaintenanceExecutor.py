@@ -0,0 +1,234 @@
+"""
+백업/복사/삭제 같은 유지보수 작업용 저우선순위 실행기
+경로: modules/minecraft/MaintenanceExecutor.py
+
+월드 압축이나 서버 폴더 복사를 기본 스레드 풀(또는 이벤트 루프)에서 돌리면
+게임 서버와 디스크/CPU를 똑같이 나눠 씁니다.
+
+- 전용 작업 스레드: nice 19 + ionice idle (Linux는 스레드 단위로 적용됨)
+- 복사/압축 쓰기 속도 제한 (MB/s, 모든 작업 합산)
+- 접속자가 있는 동안은 더 낮은 속도로 자동 감속
+- 메모리/IO 압박(PSI)이 계속되는 동안은 일시정지
+"""
+
+import asyncio
+import os
+import platform
+import shutil
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+
+import psutil
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class MaintenanceExecutor:
+    """유지보수 작업 실행 (run()으로 블로킹 함수 실행)"""
+
+    PLAYER_CHECK_INTERVAL = 30  # 접속자 확인 간격 (초)
+    MAX_PAUSE = 10 * 60  # 자원 압박으로 한 번에 일시정지하는 최대 시간 (초, 넘으면 감속 상태로 계속)
+
+    def __init__(self, max_workers: int = 1, rate_mb: Optional[float] = None, busy_rate_mb: Optional[float] = 5):
+        """
+        Args:
+            max_workers: 동시 작업 수
+            rate_mb: 평소 복사/압축 속도 제한 (MB/s, None이면 제한 없음)
+            busy_rate_mb: 접속자가 있을 때 속도 제한 (MB/s, None이면 감속 안 함)
+        """
+        self.max_workers = max_workers
+        self.rate_mb = rate_mb
+        self.busy_rate_mb = busy_rate_mb
+
+        # 접속 중인 플레이어 수 조회 (None이면 감속 안 함)
+        self.players_online: Optional[Callable[[], Awaitable[int]]] = None
+
+        # PSI 감시 (PressureMonitor, 압박 중에는 일시정지)
+        self.pressure = None
+
+        self.busy = False  # 접속자 있음 → busy_rate_mb 적용
+        self.jobs: Dict[int, dict] = {}  # 실행/대기 중인 작업 {id: {'name', 'queued_at', 'started_at', 'bytes'}}
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._next_free = 0.0  # 속도 제한: 다음 청크를 쓸 수 있는 시각 (monotonic)
+        self._job_ids = 0
+        self._local = threading.local()
+
+    # ========================================
+    # 작업 스레드
+    # ========================================
+
+    @staticmethod
+    def _lower_priority():
+        """작업 스레드 우선순위 낮추기 (Linux: nice/ionice는 스레드 단위)"""
+        if platform.system() != "Linux":
+            return
+        tid = threading.get_native_id()
+        try:
+            os.setpriority(os.PRIO_PROCESS, tid, 19)
+        except OSError:
+            pass
+        try:
+            psutil.Process(tid).ionice(psutil.IOPRIO_CLASS_IDLE)
+        except (psutil.Error, OSError, AttributeError):
+            pass
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='maintenance',
+                initializer=self._lower_priority
+            )
+        return self._executor
+
+    def _call(self, job_id: int, func: Callable, args: tuple, kwargs: dict):
+        job = self.jobs[job_id]
+        job['started_at'] = time.time()
+        self._local.job = job
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.job = None
+
+    async def run(self, name: str, func: Callable, *args, **kwargs):
+        """
+        블로킹 함수를 저우선순위 작업 스레드에서 실행 (완료까지 접속자 확인하며 대기)
+
+        Args:
+            name: 작업 이름 (상태 표시용)
+        """
+        self._job_ids += 1
+        job_id = self._job_ids
+        self.jobs[job_id] = {'name': name, 'queued_at': time.time(), 'started_at': None, 'bytes': 0}
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), self._call, job_id, func, args, kwargs)
+        try:
+            while True:
+                await self._update_busy()
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), timeout=self.PLAYER_CHECK_INTERVAL)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            self.jobs.pop(job_id, None)
+
+    async def _update_busy(self):
+        if self.players_online is None or self.busy_rate_mb is None:
+            self.busy = False
+            return
+        try:
+            busy = await self.players_online() > 0
+        except Exception:
+            busy = False
+        if busy != self.busy:
+            print(f"🧹 유지보수 작업 {'감속 (접속자 있음)' if busy else '정상 속도'}")
+        self.busy = busy
+
+    # ========================================
+    # 속도 제한
+    # ========================================
+
+    def _throttle(self, size: int):
+        """size 바이트를 쓰기 전에 호출 (작업 스레드, 필요하면 대기)"""
+        job = getattr(self._local, 'job', None)
+        if job is not None:
+            job['bytes'] += size
+
+        if self.pressure and self.pressure.under_pressure('memory', 'io'):
+            print(f"⏸️ 유지보수 작업 일시정지 ({self.pressure.describe('memory', 'io')})")
+            deadline = time.monotonic() + self.MAX_PAUSE
+            while self.pressure.under_pressure('memory', 'io'):
+                if time.monotonic() >= deadline:
+                    print(f"▶️ 유지보수 작업 재개 (압박 지속, 최대 일시정지 {self.MAX_PAUSE // 60}분 초과)")
+                    break
+                time.sleep(2)
+            else:
+                print("▶️ 유지보수 작업 재개")
+
+        rate = self.busy_rate_mb if self.busy else self.rate_mb
+        if not rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._next_free = max(self._next_free, now) + size / (rate * 1024 * 1024)
+            delay = self._next_free - now - 0.05  # 짧은 지연은 모아서 대기
+        if delay > 0:
+            time.sleep(delay)
+
+    def _copy_file(self, src, dst, *, follow_symlinks: bool = True):
+        """shutil.copy2 대신 사용 (청크 단위 속도 제한)"""
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        if not follow_symlinks and os.path.islink(src):
+            os.symlink(os.readlink(src), dst)
+            return dst
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            while True:
+                chunk = fsrc.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._throttle(len(chunk))
+                fdst.write(chunk)
+        shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+        return dst
+
+    # ========================================
+    # 작업 (작업 스레드에서 실행되는 블로킹 함수)
+    # ========================================
+
+    def copytree(self, src: Path, dst: Path) -> Path:
+        """폴더 복사 (속도 제한)"""
+        return Path(shutil.copytree(src, dst, copy_function=self._copy_file))
+
+    def make_archive(self, base_name: str, root_dir: Path) -> Path:
+        """
+        폴더 zip 압축 (shutil.make_archive(base_name, 'zip', root_dir)와 같은 구성, 속도 제한)
+
+        Returns:
+            생성된 zip 경로
+        """
+        archive = Path(f"{base_name}.zip")
+        tmp_file = archive.with_suffix('.zip.tmp')
+        root_dir = Path(root_dir)
+
+        try:
+            with zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for dirpath, dirnames, filenames in os.walk(root_dir):
+                    dirnames.sort()
+                    folder = Path(dirpath)
+                    if folder != root_dir:
+                        zf.write(folder, folder.relative_to(root_dir).as_posix())
+                    for name in sorted(filenames):
+                        path = folder / name
+                        try:
+                            info = zipfile.ZipInfo.from_file(path, path.relative_to(root_dir).as_posix())
+                            info.compress_type = zipfile.ZIP_DEFLATED
+                            with open(path, 'rb') as src, zf.open(info, 'w', force_zip64=True) as dst:
+                                while True:
+                                    chunk = src.read(CHUNK_SIZE)
+                                    if not chunk:
+                                        break
+                                    self._throttle(len(chunk))
+                                    dst.write(chunk)
+                        except FileNotFoundError:
+                            continue  # 압축 중 서버가 지운 파일
+            os.replace(tmp_file, archive)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+        return archive
+
+    @staticmethod
+    def rmtree(path: Path):
+        shutil.rmtree(path)
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,211 @@
+"""
+서버 시작 메모리 승인 (admission control)
+경로: modules/minecraft/MemoryAdmission.py
+
+시작 시점의 여유 메모리만 보면, 방금 시작해 아직 힙을 다 쓰지 않은 서버의 몫이 빠져
+연달아 시작한 두 서버가 모두 통과한 뒤 나중에 OOM killer가 하나를 죽입니다.
+
+서버별 예약량 = -Xmx + 힙 외 메모리(메타스페이스, 코드 캐시, 스레드 스택, 다이렉트 버퍼) 추정치
+(실행 기록이 있으면 최대 RSS로 보정)을 실행/시작 중인 모든 서버에 대해 합산하고,
+호스트 예산을 넘으면 시작을 보류(다른 서버가 종료 중일 때)하거나 거절합니다.
+예산 안이라도 메모리/IO 압박(PSI)이 계속되는 동안에는 시작을 보류합니다.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+
+class MemoryAdmissionController:
+    """호스트 메모리 예산 대비 서버 예약량 관리"""
+
+    QUEUE_TIMEOUT = 90  # 종료 중인 서버를 기다리는 최대 시간 (초)
+    RSS_LOOKBACK = 6 * 3600  # 최대 RSS를 참고할 기간 (초)
+
+    def __init__(self, server_manager, host_budget_mb: Optional[int] = None, reserve_mb: int = 1024):
+        """
+        Args:
+            server_manager: ServerManager
+            host_budget_mb: 서버들에 줄 수 있는 총 메모리 (None이면 전체 메모리 - reserve_mb)
+            reserve_mb: OS/봇용으로 남겨둘 메모리
+        """
+        self.server_manager = server_manager
+        self.host_budget_mb = host_budget_mb
+        self.reserve_mb = reserve_mb
+
+        # 승인했지만 아직 프로세스가 확인되지 않은 서버 {server_id: 예약량 MB}
+        self.reserved: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+        # PSI 감시 (PressureMonitor, main.py에서 설정)
+        self.pressure = None
+
+    # ========================================
+    # 예약량 계산
+    # ========================================
+
+    def estimate(self, server_id: str) -> dict:
+        """
+        서버 예약량 추정
+
+        Returns:
+            {'heap', 'off_heap', 'total', 'source'} (MB)
+        """
+        config = self.server_manager.get_server_config(server_id) or {}
+        heap = config.get('memory', {}).get('max', 4096)
+
+        # 힙 외 메모리: 메타스페이스/코드 캐시/스레드 스택 (모드 서버는 클래스가 훨씬 많음)
+        off_heap = max(512, heap * 0.15)
+        if config.get('core_type') in ('forge', 'fabric'):
+            off_heap += 256
+        source = "추정"
+
+        # 실행 기록 보정: 최대 RSS - 확보한 힙 = 실측 힙 외 메모리
+        history = self.server_manager.sampler.get_history(server_id, self.RSS_LOOKBACK)
+        if history:
+            peak = max(history, key=lambda s: s['rss_mb'])
+            jvm = peak.get('jvm')
+            measured = peak['rss_mb'] - jvm['heap_committed_mb'] if jvm else peak['rss_mb'] - heap
+            if measured > off_heap:
+                off_heap = measured
+                source = f"실측 (최대 RSS {peak['rss_mb']:.0f}MB)"
+
+        return {'heap': heap, 'off_heap': off_heap, 'total': heap + off_heap, 'source': source}
+
+    def host_budget(self) -> float:
+        if self.host_budget_mb:
+            return self.host_budget_mb
+        return psutil.virtual_memory().total / 1024 / 1024 - self.reserve_mb
+
+    def committed(self, exclude: Optional[str] = None) -> List[tuple]:
+        """예약 중인 서버 [(server_id, 예약량 MB)] (실행 중 + 승인 후 시작 중)"""
+        result = []
+        for server_id in self.server_manager.get_all_server_ids():
+            if server_id == exclude:
+                continue
+            if server_id in self.reserved:
+                result.append((server_id, self.reserved[server_id]))
+            elif self.server_manager.is_process_running(server_id):
+                result.append((server_id, self.estimate(server_id)['total']))
+        return result
+
+    def idle_candidates(self, exclude: Optional[str] = None) -> List[dict]:
+        """
+        정지해서 자리를 만들 수 있는 유휴 서버 (접속자 0명, 오래 비어 있던 순)
+        """
+        empty_since = getattr(self.server_manager.bot, 'empty_since', {}) or {}
+        candidates = []
+        for server_id, since in empty_since.items():
+            if server_id == exclude or not self.server_manager.is_process_running(server_id):
+                continue
+            candidates.append({
+                'server_id': server_id,
+                'idle_minutes': (time.time() - since.timestamp()) / 60,
+                'frees_mb': self.estimate(server_id)['total']
+            })
+        candidates.sort(key=lambda c: c['idle_minutes'], reverse=True)
+        return candidates
+
+    # ========================================
+    # 승인
+    # ========================================
+
+    def check(self, server_id: str) -> dict:
+        """
+        시작 가능 여부 판단
+
+        Returns:
+            {'decision': 'admit' | 'queue' | 'reject', 'needed', 'committed', 'budget',
+             'available', 'servers', 'idle', 'message'}
+        """
+        needed = self.estimate(server_id)
+        servers = self.committed(exclude=server_id)
+        committed = sum(amount for _, amount in servers)
+        budget = self.host_budget()
+        available = psutil.virtual_memory().available / 1024 / 1024
+
+        # 다른 프로세스가 쓰는 메모리도 있으므로 실제 가용 메모리도 확인 (힙은 점진적으로 사용)
+        fits_budget = committed + needed['total'] <= budget
+        fits_now = available >= needed['off_heap'] + needed['heap'] * 0.5
+
+        result = {
+            'needed': needed,
+            'committed': committed,
+            'budget': budget,
+            'available': available,
+            'servers': servers,
+            'idle': [],
+        }
+
+        if fits_budget and fits_now and self.pressure and self.pressure.under_pressure('memory', 'io'):
+            result['decision'] = 'queue'
+            result['message'] = f"{self.pressure.describe('memory', 'io')} 압박이 풀릴 때까지 시작 보류"
+            return result
+
+        if fits_budget and fits_now:
+            result['decision'] = 'admit'
+            result['message'] = (
+                f"메모리 승인: 예약 {needed['total']:.0f}MB "
+                f"(사용 중 {committed:.0f}MB / 예산 {budget:.0f}MB)"
+            )
+            return result
+
+        stopping = getattr(self.server_manager, 'stopping_servers', set())
+        frees = sum(amount for sid, amount in servers if sid in stopping)
+        if stopping and committed - frees + needed['total'] <= budget:
+            result['decision'] = 'queue'
+            result['message'] = f"종료 중인 서버({', '.join(stopping)})가 메모리를 반환할 때까지 대기"
+            return result
+
+        result['decision'] = 'reject'
+        result['idle'] = self.idle_candidates(exclude=server_id)
+
+        lines = ["❌ 메모리 예산 초과로 시작할 수 없습니다."]
+        lines.append(
+            f"필요: {needed['total']:.0f}MB (힙 {needed['heap']}MB + 힙 외 {needed['off_heap']:.0f}MB, {needed['source']})"
+        )
+        lines.append(f"예약 중: {committed:.0f}MB / 예산 {budget:.0f}MB")
+        for sid, amount in servers:
+            lines.append(f"  • {sid}: {amount:.0f}MB")
+        if not fits_now:
+            lines.append(f"현재 가용 메모리: {available:.0f}MB")
+        if result['idle']:
+            idle = result['idle'][0]
+            lines.append(
+                f"💡 유휴 서버 `{idle['server_id']}` (접속자 0명 {idle['idle_minutes']:.0f}분)를 중지하면 "
+                f"{idle['frees_mb']:.0f}MB 확보 - `/서버시작 유휴서버중지:True`"
+            )
+        else:
+            lines.append("💡 다른 서버를 중지하거나 bot_config.json의 memory.max를 낮춰주세요.")
+        result['message'] = "\n".join(lines)
+        return result
+
+    async def admit(self, server_id: str) -> dict:
+        """
+        승인 요청 (보류면 종료 중인 서버를 기다렸다가 다시 판단)
+
+        승인되면 프로세스가 뜰 때까지 예약량을 잡아두므로 시작 시도 후 release()를 호출해야 합니다.
+        """
+        deadline = time.monotonic() + self.QUEUE_TIMEOUT
+
+        while True:
+            async with self._lock:
+                result = await asyncio.to_thread(self.check, server_id)
+                if result['decision'] == 'admit':
+                    self.reserved[server_id] = result['needed']['total']
+                    return result
+
+            if result['decision'] != 'queue' or time.monotonic() > deadline:
+                if result['decision'] == 'queue':
+                    result['decision'] = 'reject'
+                    result['message'] = f"❌ {result['message']} - 시간 초과"
+                return result
+
+            print(f"⏳ [{server_id}] {result['message']}")
+            await asyncio.sleep(3)
+
+    def release(self, server_id: str):
+        """예약 해제 (시작 완료 후에는 실행 중 서버로 계산, 실패 시에는 반환)"""
+        self.reserved.pop(server_id, None)
@@ -0,0 +1,202 @@
+"""
+구동기/플러그인 메타데이터(버전 목록, 매니페스트) 캐시
+경로: modules/minecraft/MetadataCache.py
+
+- 응답을 ETag / Last-Modified 와 함께 저장
+- 재검증은 If-None-Match / If-Modified-Since 조건부 요청 (304 → 본문 전송 없음)
+- stale-while-revalidate: 만료된 캐시는 즉시 반환하고 백그라운드에서 재검증
+- 파일 저장은 모아서 한 번에 (SAVE_DELAY초), 직렬화/쓰기는 스레드에서
+"""
+
+import aiohttp
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from .HttpClient import HttpClient
+
+
+class MetadataCache:
+    """조건부 요청 기반 JSON 메타데이터 캐시"""
+
+    DEFAULT_MAX_AGE = 6 * 3600  # 초 (이 시간 안에는 네트워크 요청 없이 캐시 사용)
+    SAVE_DELAY = 2.0  # 갱신 후 저장까지 대기 (초, 그 사이의 갱신은 한 번에 기록)
+
+    def __init__(self, cache_file: Path, http: HttpClient, max_age: int = DEFAULT_MAX_AGE):
+        """
+        Args:
+            cache_file: 캐시 파일 경로
+            http: 공유 HTTP 클라이언트 (세션은 소유자가 닫음)
+            max_age: 캐시 유효 시간 (초)
+        """
+        self.cache_file = cache_file
+        self.http = http
+        self.max_age = max_age
+
+        self.entries: Dict[str, dict] = self._load()  # {url: {etag, last_modified, fetched_at, data}}
+
+        self._revalidating: Dict[str, asyncio.Task] = {}  # {url: Task}
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False
+
+        # 통계
+        self.stats = {'hit': 0, 'stale': 0, 'not_modified': 0, 'fetched': 0, 'error': 0}
+
+    # ========================================
+    # 영속화
+    # ========================================
+
+    def _load(self) -> Dict[str, dict]:
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 메타데이터 캐시 로드 실패 (초기화): {e}")
+            return {}
+
+    def _save(self, entries: Dict[str, dict]):
+        """캐시 파일 저장 (임시 파일 → rename, 블로킹)"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"⚠️ 메타데이터 캐시 저장 실패: {e}")
+
+    def _schedule_save(self):
+        """저장 예약 (이미 예약돼 있으면 그 저장에 포함)"""
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        while self._dirty:
+            await asyncio.sleep(self.SAVE_DELAY)
+            self._dirty = False
+            # 항목 자체는 교체되거나 fetched_at만 바뀌므로 얕은 복사로 충분
+            snapshot = {url: dict(entry) for url, entry in self.entries.items()}
+            await asyncio.to_thread(self._save, snapshot)
+
+    # ========================================
+    # HTTP
+    # ========================================
+
+    async def close(self):
+        """진행 중인 재검증 취소 + 예약된 저장 완료 대기"""
+        for task in self._revalidating.values():
+            task.cancel()
+        self._revalidating.clear()
+
+        if self._save_task and not self._save_task.done():
+            await self._save_task
+
+    async def _fetch(self, url: str, headers: Optional[dict] = None) -> Any:
+        """조건부 요청으로 가져와 캐시 갱신 후 데이터 반환"""
+        request_headers = dict(headers or {})
+        entry = self.entries.get(url)
+
+        if entry:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        async with self.http.session.get(url, headers=request_headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            if resp.status == 304 and entry:
+                entry['fetched_at'] = time.time()
+                self.stats['not_modified'] += 1
+                self._schedule_save()
+                return entry['data']
+
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status}: {url}")
+
+            data = await resp.json(content_type=None)
+
+            self.entries[url] = {
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'fetched_at': time.time(),
+                'data': data
+            }
+            self.stats['fetched'] += 1
+            self._schedule_save()
+            return data
+
+    async def _revalidate_background(self, url: str, headers: Optional[dict]):
+        try:
+            await self._fetch(url, headers)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats['error'] += 1
+            print(f"⚠️ 메타데이터 재검증 실패 ({url}): {e}")
+        finally:
+            self._revalidating.pop(url, None)
+
+    # ========================================
+    # 공개 API
+    # ========================================
+
+    def is_fresh(self, url: str, max_age: Optional[int] = None) -> bool:
+        entry = self.entries.get(url)
+        if not entry:
+            return False
+        age = time.time() - entry.get('fetched_at', 0)
+        return age < (self.max_age if max_age is None else max_age)
+
+    async def get_json(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        max_age: Optional[int] = None,
+        revalidate: bool = False
+    ) -> Any:
+        """
+        JSON 메타데이터 조회
+
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더 (User-Agent 등)
+            max_age: 캐시 유효 시간 (초, 기본: self.max_age)
+            revalidate: True면 캐시가 신선해도 조건부 요청으로 즉시 재검증
+
+        Returns:
+            JSON 데이터 (캐시 또는 새 응답)
+        """
+        entry = self.entries.get(url)
+
+        if entry is None or revalidate:
+            try:
+                return await self._fetch(url, headers)
+            except Exception:
+                if entry is None:
+                    raise
+                # 재검증 실패 시 기존 캐시 사용
+                self.stats['error'] += 1
+                return entry['data']
+
+        if self.is_fresh(url, max_age):
+            self.stats['hit'] += 1
+            return entry['data']
+
+        # 만료됨: 캐시 즉시 반환 + 백그라운드 재검증
+        self.stats['stale'] += 1
+        if url not in self._revalidating:
+            self._revalidating[url] = asyncio.create_task(self._revalidate_background(url, headers))
+        return entry['data']
+
+    def get_stats_text(self) -> str:
+        s = self.stats
+        return (
+            f"캐시 적중 {s['hit']} · 만료 후 재검증 {s['stale']} · "
+            f"304 {s['not_modified']} · 새로 받음 {s['fetched']} · 오류 {s['error']}"
+        )
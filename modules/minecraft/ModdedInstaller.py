@@ -0,0 +1,179 @@
+"""
+Forge/Fabric 서버 사전 설치 (AOT)
+경로: modules/minecraft/ModdedInstaller.py
+
+설치기를 버전당 한 번만 헤드리스로 실행해 실행 가능한 서버 트리(libraries, 실행 인자)를
+구동기 폴더에 만들어 두고, 서버 생성 시에는 이 트리를 배포만 합니다.
+
+- Forge: java -jar installer.jar --installServer <dir>
+- Fabric: java -jar fabric-installer.jar server -mcversion <v> -loader <l> -downloadMinecraft -dir <dir>
+"""
+
+import asyncio
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .CoreCatalog import required_java
+
+
+class ModdedServerInstaller:
+    """설치기 실행 + 실행 방식(launch) 감지"""
+
+    INSTALL_TIMEOUT = 20 * 60  # 초
+
+    def __init__(self, max_concurrent: int = 1):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Java 런타임 선택 (JavaRuntimeManager, None이면 PATH의 java)
+        self.java_runtimes = None
+
+    async def _java(self, core_type: str, version: str) -> str:
+        """설치기를 실행할 java (마인크래프트 버전의 최소 Java 이상)"""
+        if self.java_runtimes is None:
+            return 'java'
+        if not self.java_runtimes.runtimes:
+            await asyncio.to_thread(self.java_runtimes.scan)
+
+        min_java = required_java(version)
+        runtime = self.java_runtimes.select(min_java, core_type=core_type)
+        if not runtime:
+            print(f"[{core_type} {version}] ⚠️ Java {min_java} 이상 런타임 없음 - PATH의 java 사용")
+            return 'java'
+        return runtime['path']
+
+    @staticmethod
+    def _low_priority(command: list) -> list:
+        """게임 서버보다 낮은 우선순위로 실행"""
+        if platform.system() == "Linux":
+            if shutil.which('ionice'):
+                command = ['ionice', '-c', '3'] + command
+            if shutil.which('nice'):
+                command = ['nice', '-n', '19'] + command
+        return command
+
+    async def _run(self, command: list, cwd: Path, log_file: Path) -> int:
+        with open(log_file, 'wb') as log:
+            process = await asyncio.create_subprocess_exec(
+                *self._low_priority(command),
+                cwd=str(cwd),
+                stdout=log,
+                stderr=asyncio.subprocess.STDOUT
+            )
+            try:
+                return await asyncio.wait_for(process.wait(), timeout=self.INSTALL_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                process.kill()
+                await process.wait()
+                raise
+
+    async def install(
+        self,
+        core_type: str,
+        version: str,
+        installer_jar: Path,
+        target_dir: Path,
+        loader_version: Optional[str] = None
+    ) -> Tuple[bool, str, Optional[dict]]:
+        """
+        설치기 실행 후 target_dir에 서버 트리 생성 (임시 폴더에서 설치 → rename)
+
+        Args:
+            core_type: 'forge' | 'fabric'
+            version: 마인크래프트 버전
+            installer_jar: 설치기 jar
+            target_dir: 완성된 트리 위치
+            loader_version: Fabric 로더 버전
+
+        Returns:
+            (성공 여부, 메시지, launch 정보 {'jar': ...} 또는 {'args': [...]})
+        """
+        if core_type not in ('forge', 'fabric'):
+            return False, f"{core_type}는 사전 설치 대상이 아닙니다", None
+        if core_type == 'fabric' and not loader_version:
+            return False, "Fabric 로더 버전 없음", None
+
+        async with self._semaphore:
+            tmp_dir = target_dir.with_name(target_dir.name + '.tmp')
+            java = await self._java(core_type, version)
+
+            if core_type == 'forge':
+                command = [java, '-jar', str(installer_jar), '--installServer', str(tmp_dir)]
+            else:
+                command = [
+                    java, '-jar', str(installer_jar), 'server',
+                    '-mcversion', version, '-loader', loader_version,
+                    '-downloadMinecraft', '-dir', str(tmp_dir)
+                ]
+
+            if tmp_dir.exists():
+                await asyncio.to_thread(shutil.rmtree, tmp_dir)
+            tmp_dir.mkdir(parents=True)
+
+            try:
+                log_file = target_dir.with_name('install.log')
+                print(f"[{core_type} {version}] 서버 사전 설치 시작 (로그: {log_file})")
+                started = time.monotonic()
+
+                try:
+                    returncode = await self._run(command, tmp_dir, log_file)
+                except asyncio.TimeoutError:
+                    return False, f"설치 시간 초과 ({self.INSTALL_TIMEOUT // 60}분)", None
+
+                if returncode != 0:
+                    return False, f"설치기 종료 코드 {returncode}", None
+
+                launch = self.detect_launch(core_type, tmp_dir)
+                if not launch:
+                    return False, "설치 결과에서 실행 파일을 찾을 수 없습니다", None
+
+                # 설치기 부산물 정리
+                for leftover in tmp_dir.glob('*installer*.log'):
+                    leftover.unlink()
+                installer_copy = tmp_dir / installer_jar.name
+                if installer_copy.exists():
+                    installer_copy.unlink()
+
+                if target_dir.exists():
+                    await asyncio.to_thread(shutil.rmtree, target_dir)
+                os.replace(tmp_dir, target_dir)
+
+                elapsed = time.monotonic() - started
+                print(f"[{core_type} {version}] ✅ 사전 설치 완료 ({elapsed:.0f}초)")
+                return True, f"사전 설치 완료 ({elapsed:.0f}초)", launch
+            finally:
+                # 실패/취소 시 임시 폴더 정리 (설치 로그는 폴더 밖에 남음)
+                if tmp_dir.exists():
+                    await asyncio.to_thread(shutil.rmtree, tmp_dir, True)
+
+    @staticmethod
+    def detect_launch(core_type: str, server_dir: Path) -> Optional[dict]:
+        """
+        설치된 트리의 실행 방식
+
+        - Forge 1.17+: @libraries/.../unix_args.txt (win_args.txt)
+        - Forge 1.20.3+ shim / 1.16 이하: forge-*.jar
+        - Fabric: fabric-server-launch.jar
+        """
+        if core_type == 'fabric':
+            launcher = server_dir / 'fabric-server-launch.jar'
+            return {'jar': launcher.name} if launcher.exists() else None
+
+        args_name = 'win_args.txt' if platform.system() == "Windows" else 'unix_args.txt'
+        args_files = list(server_dir.glob(f'libraries/net/minecraftforge/forge/*/{args_name}'))
+        if args_files:
+            return {'args': ['@' + args_files[0].relative_to(server_dir).as_posix()]}
+
+        jars = [
+            j for j in server_dir.glob('forge-*.jar')
+            if 'installer' not in j.name
+        ]
+        if jars:
+            # shim jar가 있으면 우선
+            jars.sort(key=lambda j: 'shim' not in j.name)
+            return {'jar': jars[0].name}
+
+        return None
@@ -0,0 +1,249 @@
+"""
+PSI (Pressure Stall Information) 감시
+경로: modules/minecraft/PressureMonitor.py
+
+작은 VM에서는 여유 메모리 스냅숏보다 /proc/pressure/{cpu,memory,io}가
+"프로세스들이 실제로 자원을 기다리며 멈춰 있는 시간 비율"을 직접 보여줍니다.
+
+- 커널 PSI 트리거 등록 (some <정지 us> <구간 us>) 후 poll(POLLPRI)로 대기 → 평소에는 읽지 않음
+- 트리거가 울리면 평균값(avg10/avg60)을 읽고, 임계값을 넘는 동안만 2초마다 다시 읽어 해소 확인
+- 트리거 등록이 안 되는 커널/권한이면 해당 자원만 주기적으로 읽음
+- 임계값을 sustain초 이상 넘으면 "압박" → 서버 시작 보류, 백업/빌드 일시정지
+- 메모리 full 정지가 생기면 OOM killer 전에 관리자에게 경고
+"""
+
+import asyncio
+import os
+import re
+import select
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+
+PRESSURE_DIR = Path('/proc/pressure')
+RESOURCES = ('cpu', 'memory', 'io')
+LABELS = {'cpu': 'CPU', 'memory': '메모리', 'io': 'IO'}
+
+_LINE = re.compile(r'^(some|full) avg10=([\d.]+) avg60=([\d.]+) avg300=([\d.]+) total=(\d+)')
+
+
+class PressureMonitor:
+    """PSI 트리거 감시 + 압박 상태 제공"""
+
+    WINDOW_US = 2_000_000  # 트리거 구간 (비특권 트리거는 2초의 배수여야 함)
+    RECHECK_MS = 2000  # 임계값을 넘는 동안 다시 읽는 간격
+    FALLBACK_MS = 5000  # 트리거를 쓸 수 없을 때 읽는 간격
+
+    def __init__(self, thresholds: Optional[Dict[str, float]] = None, sustain: int = 30,
+                 memory_full_threshold: float = 5, warn_cooldown: int = 600):
+        """
+        Args:
+            thresholds: 자원별 some avg10 임계값 (%)
+            sustain: 이 시간(초) 이상 임계값을 넘으면 압박으로 판단
+            memory_full_threshold: 메모리 full avg10이 이 값(%) 이상이면 관리자 경고
+            warn_cooldown: 경고 최소 간격 (초)
+        """
+        self.thresholds = dict(thresholds or {'cpu': 80, 'memory': 10, 'io': 30})
+        self.sustain = sustain
+        self.memory_full_threshold = memory_full_threshold
+        self.warn_cooldown = warn_cooldown
+        self.enabled = True
+
+        # 메모리 압박 경고 (warning dict → 디스코드 전송)
+        self.notify: Optional[Callable[[dict], Awaitable]] = None
+
+        # {자원: {'some10', 'some60', 'full10', 'at'}}
+        self.readings: Dict[str, dict] = {}
+        self.above_since: Dict[str, float] = {}  # 임계값을 넘기 시작한 시각
+        self.triggers: Dict[str, bool] = {}  # 자원별 커널 트리거 사용 여부
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_fds: Optional[tuple] = None
+        self._last_warning = 0.0
+
+    @property
+    def available(self) -> bool:
+        return PRESSURE_DIR.is_dir()
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    @staticmethod
+    def read(resource: str) -> Optional[dict]:
+        """/proc/pressure/<자원> 현재 값"""
+        try:
+            text = (PRESSURE_DIR / resource).read_text()
+        except OSError:
+            return None
+        values = {'some10': 0.0, 'some60': 0.0, 'full10': 0.0, 'at': time.time()}
+        for line in text.splitlines():
+            match = _LINE.match(line)
+            if match:
+                values[f'{match.group(1)}10'] = float(match.group(2))
+                if match.group(1) == 'some':
+                    values['some60'] = float(match.group(3))
+        return values
+
+    def under_pressure(self, *resources: str) -> bool:
+        """지정한 자원 중 하나라도 sustain초 이상 임계값을 넘는 중인지 (기본: 메모리, IO)"""
+        if not self.enabled:
+            return False
+        now = time.time()
+        # 작업 스레드에서도 호출되므로 조회 한 번으로 판단 (그 사이 이벤트 루프가 pop할 수 있음)
+        return any(
+            (since := self.above_since.get(resource)) is not None and now - since >= self.sustain
+            for resource in (resources or ('memory', 'io'))
+        )
+
+    def describe(self, *resources: str) -> str:
+        """압박 중인 자원 설명 (예: "메모리 some 23% / IO some 41%")"""
+        parts = []
+        for resource in (resources or ('memory', 'io')):
+            reading = self.readings.get(resource)
+            if reading and resource in self.above_since:
+                parts.append(f"{LABELS[resource]} some {reading['some10']:.0f}%")
+        return " / ".join(parts) or "압박 없음"
+
+    def level(self, resource: str) -> str:
+        """'ok' | 'elevated' (임계값 초과) | 'pressure' (sustain초 이상 초과)"""
+        if self.under_pressure(resource):
+            return 'pressure'
+        return 'elevated' if resource in self.above_since else 'ok'
+
+    # ========================================
+    # 감시 스레드
+    # ========================================
+
+    def _register(self, poller, resource: str) -> Optional[int]:
+        """커널 트리거 등록 (실패하면 None → 주기적으로 읽음)"""
+        threshold = self.thresholds.get(resource)
+        if not threshold:
+            return None
+        stall_us = int(self.WINDOW_US * threshold / 100)
+        try:
+            fd = os.open(PRESSURE_DIR / resource, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            return None
+        try:
+            os.write(fd, f"some {stall_us} {self.WINDOW_US}\0".encode())
+        except OSError as e:
+            print(f"⚠️ PSI {resource} 트리거 등록 실패 ({e.strerror}) - 주기적으로 확인합니다")
+            os.close(fd)
+            return None
+        poller.register(fd, select.POLLPRI)
+        return fd
+
+    def _watch(self):
+        """감시 스레드: 트리거가 울리거나 재확인 시간이 되면 읽어서 이벤트 루프에 전달"""
+        poller = select.poll()
+        read_fd, _ = self._wake_fds
+        poller.register(read_fd, select.POLLIN)
+
+        fds = {}
+        for resource in RESOURCES:
+            fd = self._register(poller, resource)
+            self.triggers[resource] = fd is not None
+            if fd is not None:
+                fds[fd] = resource
+        print(f"📉 PSI 감시 시작 (트리거: {', '.join(fds.values()) or '없음 - 주기적으로 확인'})")
+
+        elevated = True  # 시작 직후 한 번은 다시 읽음
+        try:
+            while True:
+                if not all(self.triggers.values()):
+                    timeout = self.FALLBACK_MS
+                elif elevated:
+                    timeout = self.RECHECK_MS
+                else:
+                    timeout = None  # 트리거가 울릴 때까지 대기
+
+                events = poller.poll(timeout)
+                if any(fd == read_fd for fd, _ in events):
+                    break
+                if any(mask & (select.POLLERR | select.POLLHUP) for fd, mask in events if fd in fds):
+                    print("⚠️ PSI 트리거 오류 - 감시 중단")
+                    break
+
+                readings = {resource: self.read(resource) for resource in RESOURCES}
+                elevated = any(
+                    reading and self.thresholds.get(resource) and reading['some10'] >= self.thresholds[resource]
+                    for resource, reading in readings.items()
+                )
+                self._loop.call_soon_threadsafe(self._publish, readings)
+        finally:
+            for fd in fds:
+                os.close(fd)
+            # 감시가 멈추면 갱신이 끊기므로 마지막 압박 상태가 남지 않게 초기화
+            try:
+                self._loop.call_soon_threadsafe(self.above_since.clear)
+            except RuntimeError:
+                pass  # 이벤트 루프 종료됨
+
+    def start(self):
+        """감시 시작 (이벤트 루프 안에서 호출)"""
+        if not self.enabled or not self.available or self._thread:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake_fds = os.pipe()
+        self._thread = threading.Thread(target=self._watch, name='psi-monitor', daemon=True)
+        self._thread.start()
+
+        # 시작 시점 값 (트리거는 이후 정지부터 울림)
+        self._publish({resource: self.read(resource) for resource in RESOURCES})
+
+    def close(self):
+        if self._wake_fds:
+            os.write(self._wake_fds[1], b'x')
+            if self._thread:
+                self._thread.join(timeout=2)
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
+        self._thread = None
+        self.above_since.clear()
+
+    # ========================================
+    # 상태 갱신 (이벤트 루프)
+    # ========================================
+
+    def _publish(self, readings: Dict[str, Optional[dict]]):
+        now = time.time()
+        for resource, reading in readings.items():
+            if reading is None:
+                continue
+            was_pressure = self.under_pressure(resource)
+            self.readings[resource] = reading
+
+            threshold = self.thresholds.get(resource)
+            if threshold and reading['some10'] >= threshold:
+                self.above_since.setdefault(resource, now)
+            else:
+                self.above_since.pop(resource, None)
+
+            if self.under_pressure(resource) != was_pressure:
+                if was_pressure:
+                    print(f"📉 {LABELS[resource]} 압박 해소 (some {reading['some10']:.0f}%)")
+                else:
+                    print(f"📈 {LABELS[resource]} 압박 지속 (some {reading['some10']:.0f}%, {self.sustain}초 이상)")
+
+        memory = self.readings.get('memory')
+        if not memory or not self.notify or now - self._last_warning < self.warn_cooldown:
+            return
+        if memory['full10'] >= self.memory_full_threshold or self.under_pressure('memory'):
+            self._last_warning = now
+            warning = {
+                'at': now,
+                'memory': dict(memory),
+                'io': dict(self.readings.get('io') or {}),
+                'full': memory['full10'] >= self.memory_full_threshold
+            }
+            self._loop.create_task(self._send_warning(warning))
+
+    async def _send_warning(self, warning: dict):
+        try:
+            await self.notify(warning)
+        except Exception as e:
+            print(f"⚠️ 메모리 압박 경고 전송 실패: {e}")
@@ -0,0 +1,91 @@
+"""
+서버 리소스 주기 수집 + 기록
+경로: modules/minecraft/ResourceSampler.py
+
+실행 중인 서버마다 JVM 프로세스의 CPU/RSS, hsperfdata 카운터(힙, GC), 서버 cgroup 사용량을 수집해
+최근 기록을 메모리에 보관합니다. (/서버상태, 메모리 판단 등에서 조회)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import psutil
+
+from .HsperfReader import HsperfReader
+
+
+class ResourceSampler:
+    """서버별 리소스 기록 (고정 길이 링 버퍼)"""
+
+    def __init__(self, server_manager, history_size: int = 720):
+        """
+        Args:
+            server_manager: ServerManager (find_java_process 사용)
+            history_size: 서버당 보관할 샘플 수 (30초 간격이면 6시간)
+        """
+        self.server_manager = server_manager
+        self.history_size = history_size
+        self.hsperf = HsperfReader()
+
+        self.history: Dict[str, deque] = {}
+        self._lock = threading.Lock()  # 수집(작업 스레드)과 조회(다른 스레드) 동시 접근
+
+    def sample_server(self, server_id: str) -> Optional[dict]:
+        """서버 하나 수집 (블로킹)"""
+        process = self.server_manager.find_java_process(server_id)
+        if not process:
+            return None
+
+        try:
+            with process.oneshot():
+                sample = {
+                    'time': time.time(),
+                    'pid': process.pid,
+                    'cpu_percent': process.cpu_percent(interval=None),
+                    'rss_mb': process.memory_info().rss / 1024 / 1024,
+                    'threads': process.num_threads()
+                }
+                user = process.username()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+        sample['jvm'] = self.hsperf.sample(process.pid, user)
+        sample['cgroup'] = self.server_manager.cgroups.stats(process.pid)
+
+        with self._lock:
+            self.history.setdefault(server_id, deque(maxlen=self.history_size)).append(sample)
+        return sample
+
+    def sample_all(self) -> Dict[str, dict]:
+        """실행 중인 모든 서버 수집 (블로킹 - asyncio.to_thread로 호출)"""
+        samples = {}
+        for server_id in self.server_manager.get_all_server_ids():
+            if not self.server_manager.is_process_running(server_id):
+                continue
+            sample = self.sample_server(server_id)
+            if sample:
+                samples[server_id] = sample
+
+        # 종료된 JVM의 mmap 해제
+        self.hsperf.release_missing({s['pid'] for s in samples.values()})
+        self.server_manager.cgroups.forget_missing([s['pid'] for s in samples.values()])
+        return samples
+
+    def latest(self, server_id: str) -> Optional[dict]:
+        with self._lock:
+            history = self.history.get(server_id)
+            return history[-1] if history else None
+
+    def get_history(self, server_id: str, seconds: Optional[int] = None) -> List[dict]:
+        """최근 기록 (seconds 지정 시 그 기간만)"""
+        with self._lock:
+            history = list(self.history.get(server_id, []))
+        if seconds is None:
+            return history
+        cutoff = time.time() - seconds
+        return [s for s in history if s['time'] >= cutoff]
+
+    def close(self):
+        self.hsperf.close()
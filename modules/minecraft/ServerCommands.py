@@ -45,9 +45,12 @@ def setup_commands(bot):
     # ========================================
     
     @bot.tree.command(name="서버시작", description="마인크래프트 서버를 시작합니다")
-    @app_commands.describe(서버="시작할 서버 (기본: 메인 서버)")
+    @app_commands.describe(
+        서버="시작할 서버 (기본: 메인 서버)",
+        유휴서버중지="메모리가 부족하면 접속자 없는 서버를 중지하고 시작"
+    )
     @app_commands.autocomplete(서버=server_autocomplete)
-    async def start_server(interaction: discord.Interaction, 서버: Optional[str] = None):
+    async def start_server(interaction: discord.Interaction, 서버: Optional[str] = None, 유휴서버중지: bool = False):
         """서버 시작"""
         if not bot.is_authorized(interaction.user, "manage_guild"):
             await interaction.response.send_message(
@@ -68,13 +71,58 @@ def setup_commands(bot):
         
         await interaction.response.defer(ephemeral=True)
         
-        success, message = await bot.mc.start_server(server_id)
+        # 수동 시작은 crash loop 차단 상태 초기화
+        bot.mc.supervisor.reset(server_id)
+        success, message = await bot.mc.start_server(server_id, stop_idle=유휴서버중지)
         
         if success:
             await interaction.followup.send(f"✅ {message}")
         else:
             await interaction.followup.send(f"❌ {message}")
     
+    @bot.tree.command(name="전체시작", description="꺼져 있는 서버를 우선순위 순서로 차례대로 시작합니다")
+    @app_commands.describe(자동시작만="bot_config.json에 autostart가 켜진 서버만 시작")
+    async def start_all_servers(interaction: discord.Interaction, 자동시작만: bool = False):
+        """전체 서버 시작 (시작 큐)"""
+        if not bot.is_authorized(interaction.user, "manage_guild"):
+            await interaction.response.send_message(
+                "❌ 이 명령어는 **서버 관리** 권한이 필요합니다.",
+                ephemeral=True
+            )
+            return
+        
+        server_ids = [
+            server_id for server_id in bot.mc.get_all_server_ids()
+            if not 자동시작만 or bot.mc.get_server_config(server_id).get('autostart')
+        ]
+        if not server_ids:
+            await interaction.response.send_message("❌ 시작할 서버가 없습니다.", ephemeral=True)
+            return
+        
+        await interaction.response.defer(ephemeral=True)
+        
+        queue = bot.mc.start_queue
+        job = queue.submit(server_ids, reason="전체 시작")
+        await interaction.followup.send(
+            f"🚦 서버 {len(server_ids)}개를 시작 큐에 등록했습니다. (동시 {queue.max_concurrent}개)\n"
+            + queue.format_report(job)
+        )
+        
+        await queue.wait(job)
+        
+        embed = discord.Embed(
+            title="🚦 전체 시작 완료",
+            description=queue.format_report(job),
+            color=discord.Color.green() if all(
+                e['state'] in ('ready', 'skipped') for e in job['servers'].values()
+            ) else discord.Color.orange()
+        )
+        try:
+            await interaction.followup.send(embed=embed)
+        except discord.HTTPException:
+            # 상호작용 토큰 만료 (15분) - 콘솔 로그로만 남음
+            pass
+    
     @bot.tree.command(name="서버중지", description="마인크래프트 서버를 중지합니다")
     @app_commands.describe(
         서버="중지할 서버 (기본: 메인 서버)",
@@ -243,10 +291,260 @@ def setup_commands(bot):
                 inline=True
             )
         
+        # JVM 힙/GC (hsperfdata)
+        sample = bot.mc.sampler.latest(server_id) if is_running else None
+        jvm = sample.get('jvm') if sample else None
+        if jvm:
+            jvm_text = (
+                f"힙: {jvm['heap_used_mb']:.0f} / {jvm['heap_committed_mb']:.0f}MB\n"
+                f"GC: 영 {jvm['young_gc_count']}회 / 올드 {jvm['old_gc_count']}회"
+            )
+            if jvm['young_gc_per_min'] is not None:
+                jvm_text += f"\n(분당 {jvm['young_gc_per_min']:.1f} / {jvm['old_gc_per_min']:.2f})"
+            jvm_text += f"\n누적 정지: {jvm['gc_pause_seconds']:.1f}초"
+            if jvm['gc_pause_percent'] is not None:
+                jvm_text += f" ({jvm['gc_pause_percent']:.1f}%)"
+            
+            embed.add_field(
+                name="🗑️ JVM 메모리/GC",
+                value=jvm_text,
+                inline=True
+            )
+        
+        # cgroup 사용량 (서버 전용 cgroup에서 실행 중일 때)
+        cgroup = sample.get('cgroup') if sample else None
+        if cgroup:
+            cgroup_text = f"메모리: {cgroup['memory_mb']:.0f}MB"
+            if cgroup['memory_max_mb']:
+                cgroup_text += f" / 최대 {cgroup['memory_max_mb']:.0f}MB"
+            elif cgroup['memory_high_mb']:
+                cgroup_text += f" / 상한 {cgroup['memory_high_mb']:.0f}MB"
+            if cgroup['cpu_percent'] is not None:
+                cgroup_text += f"\nCPU: {cgroup['cpu_percent']:.0f}% (제한으로 대기 {cgroup['throttled_percent']:.0f}%)"
+                cgroup_text += f"\nIO: 읽기 {cgroup['io_read_mb_s']:.1f} / 쓰기 {cgroup['io_write_mb_s']:.1f} MB/s"
+            if cgroup['memory_high_events'] or cgroup['oom_kills']:
+                cgroup_text += f"\n상한 초과 {cgroup['memory_high_events']}회 / OOM {cgroup['oom_kills']}회"
+            
+            embed.add_field(
+                name="📦 cgroup",
+                value=cgroup_text,
+                inline=True
+            )
+        
+        # Java 런타임
+        runtime = config.get('java_runtime')
+        if runtime:
+            embed.add_field(
+                name="☕ Java",
+                value=f"{runtime['version']} ({runtime['vendor']})",
+                inline=True
+            )
+        
+        # 시작 시간 (예열/CDS 효과)
+        startup = bot.mc.get_startup_summary(server_id)
+        if startup['last']:
+            last = startup['last']
+            startup_text = f"최근: {last['seconds']:.1f}초"
+            if last.get('cds') == 'use':
+                startup_text += " (CDS)"
+            if last.get('done_seconds'):
+                startup_text += f"\nDone까지 {last['done_seconds']:.1f}초"
+                slowest = sorted(
+                    (last.get('components') or {}).items(), key=lambda item: item[1], reverse=True
+                )[:3]
+                if slowest:
+                    startup_text += " · " + ", ".join(
+                        f"{bot.mc.startup_analyzer.component_label(name)} {seconds:.0f}초" for name, seconds in slowest
+                    )
+            if startup['with_prewarm'] and startup['without_prewarm']:
+                startup_text += (
+                    f"\n예열 사용 평균 {startup['with_prewarm']['avg']:.1f}초 / "
+                    f"미사용 {startup['without_prewarm']['avg']:.1f}초"
+                )
+            cds = bot.mc.get_cds_summary().get(last.get('cds_key'))
+            if cds and cds['with'] and cds['without']:
+                startup_text += f"\nCDS 사용 평균 {cds['with']['avg']:.1f}초 / 미사용 {cds['without']['avg']:.1f}초"
+            
+            embed.add_field(
+                name="🚀 시작 시간",
+                value=startup_text,
+                inline=False
+            )
+        
+        # 실행 명령어 (JVM 프로필)
+        if config.get('start_command'):
+            command_text = config['start_command']
+            if len(command_text) > 900:
+                command_text = command_text[:900] + " …"
+            embed.add_field(
+                name=f"☕ 실행 명령어 ({config.get('jvm_profile') or '기본'})",
+                value=f"```{command_text}```",
+                inline=False
+            )
+        
         embed.set_footer(text=f"서버 ID: {server_id}")
         
         await interaction.followup.send(embed=embed)
     
+    @bot.tree.command(name="메모리분석", description="GC 로그를 분석해 서버 힙 크기를 추천합니다")
+    @app_commands.describe(서버="분석할 서버 (기본: 메인 서버)", 적용="추천값을 bot_config.json에 저장 (다음 시작부터 적용)")
+    @app_commands.autocomplete(서버=server_autocomplete)
+    async def analyze_memory(interaction: discord.Interaction, 서버: Optional[str] = None, 적용: bool = False):
+        """GC 로그 분석 + 힙 크기 추천"""
+        if 적용 and not bot.is_authorized(interaction.user, "manage_guild"):
+            await interaction.response.send_message(
+                "❌ 설정 적용은 **서버 관리** 권한이 필요합니다.",
+                ephemeral=True
+            )
+            return
+        
+        server_id = 서버 or bot.mc.default_server
+        config = bot.mc.get_server_config(server_id)
+        if not config:
+            await interaction.response.send_message(f"❌ 서버를 찾을 수 없습니다: {server_id}", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        stats, recommendation = await bot.mc.analyze_memory(server_id)
+        if not stats:
+            await interaction.followup.send(
+                f"❌ {config['name']}: 분석할 GC 로그가 없습니다.\n"
+                f"💡 Java 9 이상에서 서버를 한 번 실행하면 `logs/gc.log`가 생성됩니다."
+            )
+            return
+        
+        memory = config.get('memory', {})
+        embed = discord.Embed(
+            title=f"🧠 메모리 분석: {config['name']}",
+            description=f"GC {stats['events']}회, {stats['span_seconds'] / 60:.0f}분 구간",
+            color=discord.Color.orange() if recommendation['changed'] else discord.Color.green()
+        )
+        
+        embed.add_field(
+            name="📦 라이브 셋",
+            value=f"{stats['live_set_mb']:.0f}MB\n({stats['live_set_source']})",
+            inline=False
+        )
+        
+        if stats['pause_p50_ms'] is not None:
+            embed.add_field(
+                name="⏸️ GC 정지",
+                value=(
+                    f"p50 {stats['pause_p50_ms']:.1f}ms / p95 {stats['pause_p95_ms']:.1f}ms\n"
+                    f"p99 {stats['pause_p99_ms']:.1f}ms / 최대 {stats['pause_max_ms']:.1f}ms\n"
+                    f"Full GC {stats['full_gcs']}회"
+                    + (f", GC 시간 {stats['gc_time_percent']:.1f}%" if stats['gc_time_percent'] is not None else "")
+                ),
+                inline=True
+            )
+        
+        if stats['alloc_rate_mb_s'] is not None:
+            embed.add_field(name="📈 할당 속도", value=f"{stats['alloc_rate_mb_s']:.0f}MB/s", inline=True)
+        
+        embed.add_field(
+            name="💡 추천",
+            value=(
+                f"현재: {memory.get('min')}MB ~ {memory.get('max')}MB\n"
+                f"추천: **{recommendation['min']}MB ~ {recommendation['max']}MB**\n"
+                + "\n".join(f"• {reason}" for reason in recommendation['reasons'])
+            ),
+            inline=False
+        )
+        
+        if 적용 and recommendation['changed']:
+            success, message = bot.mc.apply_memory_settings(server_id, recommendation['min'], recommendation['max'])
+            embed.add_field(name="✅ 적용" if success else "❌ 적용 실패", value=message, inline=False)
+        elif recommendation['changed']:
+            embed.set_footer(text=f"적용하려면 /메모리분석 서버:{server_id} 적용:True")
+        
+        await interaction.followup.send(embed=embed)
+    
+    @bot.tree.command(name="프로파일", description="JFR로 서버를 프로파일링해 CPU/할당/GC 요약을 보여줍니다")
+    @app_commands.describe(서버="프로파일링할 서버 (기본: 메인 서버)", 초="기록 시간 (10~300초, 기본 60초)")
+    @app_commands.autocomplete(서버=server_autocomplete)
+    async def profile_server(interaction: discord.Interaction, 서버: Optional[str] = None, 초: int = 60):
+        """JFR 프로파일링"""
+        if not bot.is_authorized(interaction.user, "manage_guild"):
+            await interaction.response.send_message(
+                "❌ 이 명령어는 **서버 관리** 권한이 필요합니다.",
+                ephemeral=True
+            )
+            return
+        
+        server_id = 서버 or bot.mc.default_server
+        config = bot.mc.get_server_config(server_id)
+        if not config:
+            await interaction.response.send_message(f"❌ 서버를 찾을 수 없습니다: {server_id}", ephemeral=True)
+            return
+        if not bot.mc.is_process_running(server_id):
+            await interaction.response.send_message(f"❌ {config['name']} 서버가 실행 중이 아닙니다.", ephemeral=True)
+            return
+        
+        seconds = max(bot.mc.jfr.MIN_SECONDS, min(bot.mc.jfr.MAX_SECONDS, 초))
+        await interaction.response.send_message(f"🎥 {config['name']}: {seconds}초 동안 JFR 기록 중...")
+        
+        success, message, summary, recording = await bot.mc.jfr.profile(server_id, seconds)
+        if not success:
+            await interaction.followup.send(f"❌ {message}")
+            return
+        
+        def short(name: str) -> str:
+            # 패키지 앞부분 생략 (클래스.메서드만)
+            parts = name.split('.')
+            return '.'.join(parts[-2:]) if len(parts) > 2 else name
+        
+        embed = discord.Embed(
+            title=f"🎥 프로파일: {config['name']}",
+            description=f"{summary['seconds']}초 기록, 실행 샘플 {summary['samples']}개",
+            color=discord.Color.purple()
+        )
+        
+        if summary['hot_methods']:
+            embed.add_field(
+                name="🔥 핫 메서드",
+                value="\n".join(f"`{percent:5.1f}%` {short(name)}" for name, percent in summary['hot_methods'][:8])[:1024],
+                inline=False
+            )
+        if summary['alloc_frames']:
+            embed.add_field(
+                name=f"📦 할당 위치 ({summary['alloc_source']})",
+                value="\n".join(f"`{size:7.0f}MB` {short(name)}" for name, size in summary['alloc_frames'][:6])[:1024],
+                inline=False
+            )
+        if summary['hot_threads']:
+            embed.add_field(
+                name="🧵 스레드",
+                value="\n".join(f"`{percent:5.1f}%` {name}" for name, percent in summary['hot_threads'])[:1024],
+                inline=False
+            )
+        
+        gc = summary['gc']
+        safepoint = summary['safepoint']
+        embed.add_field(
+            name="⏸️ GC 정지",
+            value=f"{gc['count']}회, 합계 {gc['total_ms']:.0f}ms\np99 {gc['p99_ms']:.1f}ms / 최대 {gc['max_ms']:.1f}ms",
+            inline=True
+        )
+        embed.add_field(
+            name="🛑 Safepoint",
+            value=f"{safepoint['count']}회, 합계 {safepoint['total_ms']:.0f}ms\n최대 {safepoint['max_ms']:.1f}ms",
+            inline=True
+        )
+        
+        # 원본 기록 첨부 (디스코드 업로드 제한 이하일 때)
+        file = None
+        if recording.stat().st_size <= 8 * 1024 * 1024:
+            file = discord.File(str(recording), filename=recording.name)
+            embed.set_footer(text="JDK Mission Control로 원본 기록을 열 수 있습니다")
+        else:
+            embed.set_footer(text=f"원본 기록: {recording}")
+        
+        if file:
+            await interaction.followup.send(embed=embed, file=file)
+        else:
+            await interaction.followup.send(embed=embed)
+    
     @bot.tree.command(name="서버목록", description="관리 중인 모든 서버 목록을 확인합니다")
     async def server_list(interaction: discord.Interaction):
         """서버 목록"""
@@ -37,24 +37,32 @@ class ServerConfigurator:
         if not server_path.is_dir():
             return False, "폴더가 아닙니다.", None
         
+        # 사전 설치된 Forge/Fabric 트리는 bot_config.json의 launch로 실행 방식 지정
+        launch = self.read_launch(server_path)
+        
         # server.jar 찾기
         jar_files = list(server_path.glob("*.jar"))
         
-        if not jar_files:
+        if not jar_files and not (launch and launch.get('args')):
             return False, "서버 jar 파일을 찾을 수 없습니다.", None
         
-        # 서버 jar 파일 선택 (server.jar 우선, 없으면 첫 번째)
+        # 서버 jar 파일 선택 (launch 지정 > server.jar > 첫 번째)
         server_jar = None
+        if launch and launch.get('jar') and (server_path / launch['jar']).exists():
+            server_jar = server_path / launch['jar']
+        
         for jar in jar_files:
+            if server_jar:
+                break
             if jar.name.lower() == "server.jar":
                 server_jar = jar
-                break
         
-        if not server_jar:
+        if not server_jar and jar_files:
             server_jar = jar_files[0]
         
         info = {
-            "jar_file": server_jar.name,
+            "jar_file": server_jar.name if server_jar else None,
+            "launch_args": launch.get('args') if launch else None,
             "has_world": (server_path / "world").exists(),
             "has_eula": (server_path / "eula.txt").exists(),
             "has_properties": (server_path / "server.properties").exists(),
@@ -63,6 +71,17 @@ class ServerConfigurator:
         
         return True, "서버 폴더가 유효합니다.", info
     
+    def read_launch(self, server_path: Path) -> Optional[dict]:
+        """bot_config.json의 실행 방식 ({'jar': ...} 또는 {'args': [...]})"""
+        config_file = server_path / self.BOT_CONFIG_FILE
+        if not config_file.exists():
+            return None
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('launch')
+        except Exception:
+            return None
+    
     def load_bot_config(self, server_path: Path) -> dict:
         """
         bot_config.json 로드 (없으면 기본값 생성)
@@ -345,6 +364,7 @@ class ServerConfigurator:
             "name": server_path.name.replace('_', ' ').title(),
             "path": str(server_path),
             "jar_file": info['jar_file'],
+            "launch_args": info['launch_args'],
             "memory": {
                 "min": bot_config['memory']['min'],
                 "max": bot_config['memory']['max']
@@ -357,9 +377,31 @@ class ServerConfigurator:
                 "password": rcon_password
             },
             "description": bot_config.get('description', ''),
+            "core_type": bot_config.get('core_type'),
+            "version": bot_config.get('version'),
+            "min_java": bot_config.get('min_java'),
+            "java_override": bot_config.get('java'),
+            "jvm_profile": bot_config.get('jvm_profile'),
             "is_new": not info['has_world']
         }
         
+        # 시작 전 예열 (서버별 설정, 없으면 봇 기본값)
+        if 'prewarm' in bot_config:
+            server_config['prewarm'] = dict(bot_config['prewarm'])
+        if 'cds' in bot_config:
+            server_config['cds'] = bool(bot_config['cds'])
+        
+        # 봇 시작 시 자동 시작 + 시작 큐 우선순위 (낮을수록 먼저)
+        server_config['autostart'] = bool(bot_config.get('autostart', False))
+        if 'start_priority' in bot_config:
+            server_config['start_priority'] = int(bot_config['start_priority'])
+        if 'auto_restart' in bot_config:
+            server_config['auto_restart'] = bool(bot_config['auto_restart'])
+        
+        # cgroup 제한 (cpu_weight, cpu_max_percent, memory_high_mb, memory_max_mb, io_weight, cpus)
+        if 'cgroup' in bot_config:
+            server_config['cgroup'] = dict(bot_config['cgroup'])
+        
         print(f"✅ 서버 설정 완료: {server_path.name}")
         print(f"   - 메모리: {server_config['memory']['min']}MB ~ {server_config['memory']['max']}MB")
         print(f"   - 포트: {server_config['port']} (임시, 자동 할당 예정)")
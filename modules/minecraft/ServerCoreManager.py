@@ -5,13 +5,82 @@
 
 import aiohttp
 import asyncio
-import subprocess
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
-import json
-import shutil
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable
+import hashlib
 from datetime import datetime
 
+from .MetadataCache import MetadataCache
+from .JarDownloader import JarDownloader
+from .HttpClient import HttpClient
+from .DownloadQueue import DownloadQueue
+from .BlobStore import BlobStore
+from .SpigotBuildScheduler import SpigotBuildScheduler
+from .CoreCatalog import CoreCatalog
+from .ModdedInstaller import ModdedServerInstaller
+from .CoreBundle import CoreBundle
+
+
+class CoreUpdateJob:
+    """구동기 업데이트 백그라운드 작업 (진행 상황 추적)"""
+
+    STATE_ICONS = {'pending': '⏳', 'running': '🔄', 'done': '✅', 'failed': '❌'}
+
+    def __init__(self, job_id: int, steps: List[str], revalidate: bool):
+        self.job_id = job_id
+        self.revalidate = revalidate
+        self.steps: Dict[str, str] = {name: 'pending' for name in steps}
+        self.errors: Dict[str, str] = {}
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[['CoreUpdateJob'], Awaitable]] = []
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def add_listener(self, callback: Callable[['CoreUpdateJob'], Awaitable]):
+        """진행 상황 변경 시 호출할 콜백 등록 (async def callback(job))"""
+        self._listeners.append(callback)
+
+    async def set_step(self, name: str, state: str, error: Optional[str] = None):
+        self.steps[name] = state
+        if error:
+            self.errors[name] = error
+        await self._notify()
+
+    async def finish(self):
+        self.finished_at = datetime.now()
+        await self._notify()
+
+    async def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                await callback(self)
+            except Exception as e:
+                # 만료된 interaction 등 - 작업 자체는 계속 진행
+                print(f"⚠️ 업데이트 진행 알림 실패: {e}")
+                self._listeners.remove(callback)
+
+    def summary(self) -> str:
+        """진행 상황 텍스트"""
+        finished = sum(1 for state in self.steps.values() if state in ('done', 'failed'))
+        header = f"구동기 업데이트 #{self.job_id} ({finished}/{len(self.steps)})"
+
+        if self.done:
+            elapsed = (self.finished_at - self.started_at).total_seconds()
+            header += f" - 완료 ({elapsed:.0f}초)"
+
+        lines = [header]
+        for name, state in self.steps.items():
+            line = f"{self.STATE_ICONS.get(state, '')} {name}"
+            if name in self.errors:
+                line += f": {self.errors[name]}"
+            lines.append(line)
+
+        return "\n".join(lines)
+
 
 class ServerCoreManager:
     """서버 구동기 자동 다운로드 및 관리"""
@@ -36,27 +105,126 @@ class ServerCoreManager:
         
         # Spigot 빌드 상태
         self.building_spigot = {}  # {version: asyncio.Task}
-        self.spigot_build_lock = asyncio.Lock()
+        
+        # 공유 HTTP 세션 (커넥션 풀, 호스트별 연결 제한 + 통계)
+        self.http = HttpClient(limit=16, limit_per_host=4)
+        
+        # 버전 목록/매니페스트 캐시 (ETag/Last-Modified 재검증)
+        self.metadata = MetadataCache(self.cores_dir / '.metadata_cache.json', self.http)
+        
+        # 스트리밍/검증/이어받기 다운로더 (모든 업데이터 공용)
+        self.downloader = JarDownloader()
+        
+        # 제한된 병렬 다운로드 큐 (전체 4개, 호스트당 2개)
+        self.download_queue = DownloadQueue(self.http, self.downloader, workers=4, per_host=2)
+        
+        # Spigot BuildTools 스케줄러 (공용 캐시, 낮은 우선순위)
+        self.spigot_builder = SpigotBuildScheduler(self.cores_dir / 'spigot', self.download_queue)
+        
+        # 구동기/플러그인 카탈로그 (버전/빌드/해시/Java 요구사항)
+        self._migrate_forge_installers()
+        self.catalog = CoreCatalog(self.cores_dir / 'catalog.json', base_path)
+        self.catalog.sync_with_disk(self.cores_dir, self.core_types.keys(), self.plugins_dir)
+        
+        # Forge/Fabric 사전 설치 {(core_type, version): asyncio.Task}
+        self.modded_installer = ModdedServerInstaller()
+        self.installing_modded = {}
+        
+        # 내용 주소(SHA-256) jar 저장소 - 서버 폴더에는 reflink/하드링크로 배포
+        self.blobs = BlobStore(self.cores_dir / '.blobs')
+        
+        # 오프라인 번들 (다른 노드와 구동기/플러그인 공유)
+        self.bundles_dir = base_path / 'bundles'
+        self.bundle = CoreBundle(self.catalog, self.blobs, self.cores_dir, self.plugins_dir)
+        
+        # 업데이트 작업 추적
+        self.update_job: Optional[CoreUpdateJob] = None
+        self._update_job_counter = 0
     
-    async def update_all_cores(self):
-        """모든 구동기 업데이트"""
+    async def close(self):
+        """봇 종료 시 정리"""
+        if self.update_job and not self.update_job.done and self.update_job.task:
+            self.update_job.task.cancel()
+        for task in list(self.installing_modded.values()):
+            task.cancel()
+        await self.metadata.close()
+        await self.download_queue.close()
+        await self.http.close()
+    
+    def start_update_job(self, revalidate: bool = False) -> Tuple[CoreUpdateJob, bool]:
+        """
+        구동기 업데이트를 백그라운드 작업으로 시작
+        
+        Args:
+            revalidate: 메타데이터 캐시를 즉시 재검증할지 (수동 업데이트)
+        
+        Returns:
+            (작업, 새로 시작했는지) - 이미 진행 중이면 기존 작업 반환
+        """
+        if self.update_job and not self.update_job.done:
+            return self.update_job, False
+        
+        self._update_job_counter += 1
+        job = CoreUpdateJob(
+            job_id=self._update_job_counter,
+            steps=['paper', 'vanilla', 'fabric', 'forge', 'plugins', 'spigot', 'prebuild'],
+            revalidate=revalidate
+        )
+        job.task = asyncio.create_task(self.update_all_cores(job=job, revalidate=revalidate))
+        self.update_job = job
+        
+        return job, True
+    
+    async def update_all_cores(self, job: Optional[CoreUpdateJob] = None, revalidate: bool = False):
+        """
+        모든 구동기 업데이트
+        
+        Args:
+            job: 진행 상황을 보고할 작업 (없으면 보고 생략)
+            revalidate: 메타데이터 캐시 즉시 재검증 여부
+        """
         print("\n구동기 업데이트 시작")
         
+        async def run_step(name: str, coro):
+            if job:
+                await job.set_step(name, 'running')
+            try:
+                await coro
+                if job:
+                    await job.set_step(name, 'done')
+            except Exception as e:
+                if job:
+                    await job.set_step(name, 'failed', str(e))
+                raise
+        
         tasks = [
-            self.update_paper(),
-            self.update_vanilla(),
-            self.update_fabric(),
-            self.update_forge(),
-            self.update_plugins()
+            run_step('paper', self.update_paper(revalidate)),
+            run_step('vanilla', self.update_vanilla(revalidate)),
+            run_step('fabric', self.update_fabric(revalidate)),
+            run_step('forge', self.update_forge(revalidate)),
+            run_step('plugins', self.update_plugins(revalidate))
         ]
         
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Spigot 백그라운드 빌드
-        await self.start_spigot_background_builds()
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Spigot 백그라운드 빌드 / Forge·Fabric 사전 설치 (서로 독립, 한쪽이 실패해도 다른 쪽은 진행)
+            background = {
+                'Spigot 빌드 예약': run_step('spigot', self.start_spigot_background_builds()),
+                '사전 설치 예약': run_step('prebuild', self.start_modded_prebuilds())
+            }
+            results = await asyncio.gather(*background.values(), return_exceptions=True)
+            for name, result in zip(background, results):
+                if isinstance(result, Exception):
+                    print(f"{name} 실패: {result}")
+        finally:
+            print(f"메타데이터 캐시: {self.metadata.get_stats_text()}")
+            print(f"호스트별 다운로드:\n{self.http.get_stats_text()}")
+            if job:
+                await job.finish()
     
     async def start_spigot_background_builds(self):
-        """Spigot 주요 버전 백그라운드 빌드"""
+        """Spigot 주요 버전 백그라운드 빌드 (스케줄러가 동시 실행 수 제한)"""
         major_versions = ['1.21.1', '1.20.6', '1.20.4', '1.20.1', '1.19.4']
         
         print("\nSpigot 백그라운드 빌드 시작")
@@ -65,157 +233,128 @@ class ServerCoreManager:
             version_dir = self.cores_dir / 'spigot' / version
             jar_file = version_dir / 'server.jar'
             
-            if jar_file.exists():
+            if jar_file.exists() or version in self.building_spigot:
                 continue
             
-            task = asyncio.create_task(self._build_spigot_background(version))
+            task = asyncio.create_task(self.spigot_builder.build(version))
+            task.add_done_callback(lambda t, v=version: self._on_spigot_build_done(v, t))
             self.building_spigot[version] = task
             
             print(f"  Spigot {version} 빌드 대기열 추가")
     
-    async def _build_spigot_background(self, version: str):
-        """Spigot Screen 세션 빌드 (수정됨)"""
+    def _on_spigot_build_done(self, version: str, task: asyncio.Task):
+        """빌드 성공 시 카탈로그 등록"""
+        self.building_spigot.pop(version, None)
+        
+        if task.cancelled() or task.exception() or not task.result():
+            return
+        
+        # 해시 계산은 이벤트 루프 밖에서
+        asyncio.create_task(self._record_spigot_core(version))
+    
+    async def _record_spigot_core(self, version: str):
+        jar_file = self.cores_dir / 'spigot' / version / 'server.jar'
         try:
-            print(f"\n[Spigot {version}] 빌드 시작")
-            
-            version_dir = self.cores_dir / 'spigot' / version
-            version_dir.mkdir(parents=True, exist_ok=True)
-            
-            buildtools_path = version_dir / 'BuildTools.jar'
-            
-            # BuildTools 다운로드
-            async with aiohttp.ClientSession() as session:
-                url = 'https://hub.spigotmc.org/jenkins/job/BuildTools/lastSuccessfulBuild/artifact/target/BuildTools.jar'
-                async with session.get(url) as resp:
-                    with open(buildtools_path, 'wb') as f:
-                        f.write(await resp.read())
-            
-            print(f"[Spigot {version}] BuildTools 다운로드 완료")
-            
-            # 빌드 상태 파일
-            build_state_file = version_dir / '.building'
-            with open(build_state_file, 'w') as f:
-                json.dump({
-                    'version': version,
-                    'started_at': datetime.now().isoformat(),
-                    'status': 'building'
-                }, f)
-            
-            # Screen 세션으로 BuildTools 실행
-            import platform
-            if platform.system() == "Linux":
-                try:
-                    from modules.minecraft.ScreenManager import ScreenManager
-                    
-                    session_name = f"spigot_build_{version.replace('.', '_')}"
-                    build_command = f"java -jar {buildtools_path} --rev {version}"
-                    
-                    # 기존 세션 확인 및 종료
-                    if ScreenManager.screen_exists(session_name):
-                        print(f"[Spigot {version}] 기존 빌드 세션 종료 중...")
-                        await ScreenManager().kill_screen(session_name)
-                        await asyncio.sleep(2)
-                    
-                    # Screen 세션 생성
-                    print(f"[Spigot {version}] Screen 세션 생성: {session_name}")
-                    success, message, actual_session = await ScreenManager().create_screen(
-                        session_name=session_name,
-                        command=build_command,
-                        cwd=str(version_dir),
-                        reuse_existing=True
-                    )
-                    
-                    if success and actual_session:
-                        print(f"[Spigot {version}] 빌드 진행 중 - Screen 세션: {actual_session}")
-                        print(f"💡 빌드 과정을 보려면: screen -r {actual_session}")
-                        
-                        # 세션이 종료될 때까지 대기
-                        while True:
-                            await asyncio.sleep(10)
-                            if not ScreenManager.screen_exists(session_name):
-                                print(f"[Spigot {version}] Screen 세션 종료됨")
-                                break
-                        
-                        print(f"[Spigot {version}] Screen 세션 종료 - 빌드 결과 확인 중...")
-                    else:
-                        print(f"[Spigot {version}] Screen 생성 실패, 백그라운드로 빌드")
-                        raise ImportError  # 폴백
-                    
-                except ImportError:
-                    # Screen 사용 불가 시 백그라운드 빌드
-                    print(f"[Spigot {version}] 백그라운드 빌드")
-                    process = await asyncio.create_subprocess_exec(
-                        'java', '-jar', str(buildtools_path), '--rev', version,
-                        cwd=str(version_dir),
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    await process.wait()
-            else:
-                # Windows/macOS - 백그라운드 빌드
-                print(f"[Spigot {version}] 백그라운드 빌드 (비 Linux 환경)")
-                process = await asyncio.create_subprocess_exec(
-                    'java', '-jar', str(buildtools_path), '--rev', version,
-                    cwd=str(version_dir),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await process.wait()
-            
-            # ✅ 수정: 빌드 결과 확인 (spigot-*.jar 패턴 검색)
-            spigot_jars = list(version_dir.glob(f'spigot-*.jar'))
-            
-            if spigot_jars:
-                # 가장 최근 파일 선택
-                latest_jar = max(spigot_jars, key=lambda p: p.stat().st_mtime)
-                target_path = version_dir / 'server.jar'
-                
-                # 기존 server.jar 제거
-                if target_path.exists():
-                    target_path.unlink()
-                
-                # 이름 변경
-                shutil.move(str(latest_jar), str(target_path))
-                
-                print(f"[Spigot {version}] ✅ 빌드 완료: {latest_jar.name} -> server.jar")
-                
-                with open(build_state_file, 'w') as f:
-                    json.dump({
-                        'version': version,
-                        'completed_at': datetime.now().isoformat(),
-                        'status': 'success',
-                        'jar_file': latest_jar.name
-                    }, f)
+            sha256 = await asyncio.to_thread(self.blobs.digest_of, jar_file)
+        except OSError as e:
+            print(f"⚠️ Spigot {version} 카탈로그 등록 실패: {e}")
+            return
+        self.catalog.record_core(
+            'spigot', version, jar_file,
+            sha256=sha256,
+            url=self.spigot_builder.BUILDTOOLS_URL
+        )
+    
+    # ========================================
+    # Forge/Fabric 사전 설치
+    # ========================================
+    
+    def _migrate_forge_installers(self):
+        """이전 방식(설치기를 server.jar로 저장)의 Forge 폴더를 installer.jar로 변경"""
+        forge_dir = self.cores_dir / 'forge'
+        if not forge_dir.exists():
+            return
+        
+        for jar in forge_dir.glob('*/server.jar'):
+            installer = jar.with_name('installer.jar')
+            if not installer.exists():
+                jar.rename(installer)
+    
+    async def start_modded_prebuilds(self):
+        """사전 설치가 없는 Forge/Fabric 버전 설치 예약 (설치기는 한 번에 하나씩 실행)"""
+        for core_type in ('forge', 'fabric'):
+            for version in self.catalog.versions(core_type):
+                if self.catalog.get_prebuilt(core_type, version):
+                    continue
+                self._schedule_prebuild(core_type, version)
+    
+    def _schedule_prebuild(self, core_type: str, version: str) -> asyncio.Task:
+        key = (core_type, version)
+        task = self.installing_modded.get(key)
+        if task is None:
+            task = asyncio.create_task(self._prebuild(core_type, version))
+            task.add_done_callback(lambda _: self.installing_modded.pop(key, None))
+            self.installing_modded[key] = task
+        return task
+    
+    async def ensure_prebuilt(self, core_type: str, version: str) -> Tuple[bool, str, Optional[dict]]:
+        """
+        사전 설치 트리 확보 (없으면 설치 후 대기)
+        
+        Returns:
+            (성공 여부, 메시지, {'path', 'launch', 'built_at'})
+        """
+        prebuilt = self.catalog.get_prebuilt(core_type, version)
+        if prebuilt:
+            return True, "사전 설치됨", prebuilt
+        
+        success, message = await self._schedule_prebuild(core_type, version)
+        return success, message, self.catalog.get_prebuilt(core_type, version)
+    
+    async def _prebuild(self, core_type: str, version: str) -> Tuple[bool, str]:
+        entry = self.catalog.get_core(core_type, version)
+        if not entry:
+            return False, f"{core_type} {version}이 카탈로그에 없습니다"
+        
+        version_dir = self.cores_dir / core_type / version
+        
+        try:
+            if core_type == 'forge':
+                installer_jar = self.catalog.path_of(entry)
+                loader_version = None
             else:
-                print(f"[Spigot {version}] ❌ 빌드 실패: jar 파일 없음")
-                print(f"   디렉토리 내용: {list(version_dir.glob('*'))}")
-                
-                with open(build_state_file, 'w') as f:
-                    json.dump({
-                        'version': version,
-                        'completed_at': datetime.now().isoformat(),
-                        'status': 'failed',
-                        'error': 'jar not found'
-                    }, f)
+                # Fabric: 공식 설치기로 라이브러리 + 바닐라 서버까지 미리 받음
+                installers = await self.metadata.get_json('https://meta.fabricmc.net/v2/versions/installer')
+                installer = installers[0]
+                installer_jar = self.cores_dir / 'fabric' / '.installer' / f"fabric-installer-{installer['version']}.jar"
+                if not installer_jar.exists():
+                    await self.download_queue.submit(installer['url'], installer_jar, label="Fabric 설치기")
+                loader_version = entry.get('build')
+                if not loader_version:
+                    loaders = await self.metadata.get_json('https://meta.fabricmc.net/v2/versions/loader')
+                    loader_version = loaders[0]['version']
             
+            success, message, launch = await self.modded_installer.install(
+                core_type, version, installer_jar, version_dir / 'prebuilt',
+                loader_version=loader_version
+            )
         except Exception as e:
-            print(f"[Spigot {version}] ❌ 빌드 오류: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            if version in self.building_spigot:
-                del self.building_spigot[version]
+            success, message, launch = False, str(e), None
+        
+        if success:
+            self.catalog.set_prebuilt(core_type, version, version_dir / 'prebuilt', launch)
+        else:
+            print(f"[{core_type} {version}] ❌ 사전 설치 실패: {message}")
+        
+        return success, message
     
     def is_spigot_building(self, version: str) -> bool:
         """Spigot 빌드 중인지 확인"""
         return version in self.building_spigot
     
-    def get_spigot_build_status(self) -> Dict[str, str]:
-        """빌드 중인 Spigot 버전"""
-        status = {}
-        for version, task in self.building_spigot.items():
-            status[version] = 'completed' if task.done() else 'building'
-        return status
+    def get_spigot_build_status(self) -> Dict[str, dict]:
+        """진행 중인 Spigot 빌드 {버전: 상태 정보}"""
+        return self.spigot_builder.get_status()
     
     async def wait_for_builds_completion(self):
         """모든 Spigot 빌드 완료 대기"""
@@ -223,283 +362,522 @@ class ServerCoreManager:
             return
         
         print("\nSpigot 빌드 완료 대기")
+        self.spigot_builder.release_pause()
         tasks = list(self.building_spigot.values())
         await asyncio.gather(*tasks, return_exceptions=True)
         print("모든 Spigot 빌드 완료")
     
-    async def update_paper(self):
+    async def _collect_downloads(self, name: str, core_type: str, pending: Dict[str, Tuple[asyncio.Future, dict]]) -> int:
+        """
+        큐에 넣은 다운로드 완료 대기 후 카탈로그에 기록
+        
+        Args:
+            name: 로그 접두어 (예: "Paper")
+            core_type: 카탈로그 구동기 종류
+            pending: {버전: (Future, {'url', 'build', 'min_java'})}
+        
+        Returns:
+            실패 개수
+        """
+        if not pending:
+            return 0
+        
+        results = await asyncio.gather(*[future for future, _ in pending.values()], return_exceptions=True)
+        
+        failed = 0
+        for (version, (_, info)), result in zip(pending.items(), results):
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"{name} {version} 다운로드 실패: {result}")
+                continue
+            
+            self.catalog.record_core(
+                core_type, version, result['path'],
+                build=info.get('build'),
+                sha256=result['sha256'],
+                size=result['size'],
+                url=info.get('url'),
+                min_java=info.get('min_java')
+            )
+            build_text = f" (빌드 {info['build']})" if info.get('build') else ""
+            print(f"{name} {version}{build_text} 다운로드 완료")
+        
+        return failed
+    
+    async def update_paper(self, revalidate: bool = False):
         """Paper 다운로드 (수정: User-Agent 추가)"""
         try:
-            headers = {
-                'User-Agent': 'MinecraftBot/1.0 (Discord Server Manager)',
-                'Accept': 'application/json'
-            }
+            headers = {'Accept': 'application/json'}
             
-            async with aiohttp.ClientSession(headers=headers) as session:
-                # ✅ PaperMC API v2 엔드포인트
-                async with session.get('https://api.papermc.io/v2/projects/paper', timeout=10) as resp:
-                    if resp.status != 200:
-                        print(f"Paper 실패: HTTP {resp.status}")
-                        return
-                    
-                    data = await resp.json()
-                    versions = data.get('versions', [])
+            # ✅ PaperMC API v2 엔드포인트
+            data = await self.metadata.get_json(
+                'https://api.papermc.io/v2/projects/paper',
+                headers=headers, revalidate=revalidate
+            )
+            versions = data.get('versions', [])
+            
+            pending = {}
+            
+            # 최근 5개 버전만 다운로드
+            for version in versions[-5:]:
+                version_dir = self.cores_dir / 'paper' / version
+                jar_file = version_dir / 'server.jar'
+                if jar_file.exists():
+                    continue
                 
-                # 최근 5개 버전만 다운로드
-                for version in versions[-5:]:
-                    version_dir = self.cores_dir / 'paper' / version
-                    version_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    jar_file = version_dir / 'server.jar'
-                    if jar_file.exists():
-                        continue
-                    
-                    # 버전별 빌드 목록 조회
-                    async with session.get(f'https://api.papermc.io/v2/projects/paper/versions/{version}', timeout=10) as resp:
-                        if resp.status != 200:
-                            print(f"Paper {version} 빌드 조회 실패")
-                            continue
-                        
-                        version_data = await resp.json()
-                        builds = version_data.get('builds', [])
-                        
-                        if not builds:
-                            continue
-                        
-                        build = builds[-1]  # 최신 빌드
-                    
-                    # 다운로드 URL
-                    download_url = f'https://api.papermc.io/v2/projects/paper/versions/{version}/builds/{build}/downloads/paper-{version}-{build}.jar'
-                    
-                    # JAR 다운로드
-                    async with session.get(download_url, timeout=60) as resp:
-                        if resp.status != 200:
-                            print(f"Paper {version} 다운로드 실패")
-                            continue
-                        
-                        with open(jar_file, 'wb') as f:
-                            f.write(await resp.read())
-                    
-                    print(f"Paper {version} (빌드 {build}) 다운로드 완료")
+                # 버전별 빌드 목록 조회 (빌드마다 jar 이름과 SHA-256 포함)
+                try:
+                    builds_data = await self.metadata.get_json(
+                        f'https://api.papermc.io/v2/projects/paper/versions/{version}/builds',
+                        headers=headers, revalidate=revalidate
+                    )
+                except Exception as e:
+                    print(f"Paper {version} 빌드 조회 실패: {e}")
+                    continue
+                
+                builds = builds_data.get('builds', [])
+                
+                if not builds:
+                    continue
+                
+                latest = builds[-1]  # 최신 빌드
+                build = latest['build']
+                application = latest.get('downloads', {}).get('application', {})
+                jar_name = application.get('name', f'paper-{version}-{build}.jar')
+                
+                # 다운로드 URL
+                download_url = f'https://api.papermc.io/v2/projects/paper/versions/{version}/builds/{build}/downloads/{jar_name}'
+                
+                # JAR 다운로드 (SHA-256 검증)
+                future = self.download_queue.submit(
+                    download_url, jar_file,
+                    sha256=application.get('sha256'),
+                    label=f"Paper {version}"
+                )
+                pending[version] = (future, {'url': download_url, 'build': build})
+            
+            failed = await self._collect_downloads("Paper", 'paper', pending)
+            if failed:
+                raise RuntimeError(f"{failed}개 버전 다운로드 실패")
         
         except Exception as e:
             print(f"Paper 실패: {e}")
+            raise
     
-    async def update_vanilla(self):
+    async def update_vanilla(self, revalidate: bool = False):
         """Vanilla 다운로드"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://launchermeta.mojang.com/mc/game/version_manifest.json') as resp:
-                    manifest = await resp.json()
+            manifest = await self.metadata.get_json(
+                'https://launchermeta.mojang.com/mc/game/version_manifest.json',
+                revalidate=revalidate
+            )
+            
+            pending = {}
+            
+            for version_info in manifest['versions'][:10]:
+                if version_info['type'] != 'release':
+                    continue
                 
-                for version_info in manifest['versions'][:10]:
-                    if version_info['type'] != 'release':
-                        continue
-                    
-                    version = version_info['id']
-                    version_dir = self.cores_dir / 'vanilla' / version
-                    version_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    jar_file = version_dir / 'server.jar'
-                    if jar_file.exists():
-                        continue
-                    
-                    async with session.get(version_info['url']) as resp:
-                        version_data = await resp.json()
-                        download_url = version_data['downloads']['server']['url']
-                    
-                    async with session.get(download_url) as resp:
-                        with open(jar_file, 'wb') as f:
-                            f.write(await resp.read())
-                    
-                    print(f"Vanilla {version} 다운로드")
+                version = version_info['id']
+                jar_file = self.cores_dir / 'vanilla' / version / 'server.jar'
+                if jar_file.exists():
+                    continue
+                
+                # 버전별 매니페스트 URL은 내용이 바뀌지 않으므로 재검증 불필요
+                version_data = await self.metadata.get_json(version_info['url'], max_age=30 * 24 * 3600)
+                server_download = version_data['downloads']['server']
+                
+                # Mojang은 SHA-1을 게시
+                future = self.download_queue.submit(
+                    server_download['url'], jar_file,
+                    sha1=server_download.get('sha1'),
+                    label=f"Vanilla {version}"
+                )
+                pending[version] = (future, {
+                    'url': server_download['url'],
+                    # 버전 매니페스트에 필요한 Java 버전이 명시됨
+                    'min_java': version_data.get('javaVersion', {}).get('majorVersion')
+                })
+            
+            failed = await self._collect_downloads("Vanilla", 'vanilla', pending)
+            if failed:
+                raise RuntimeError(f"{failed}개 버전 다운로드 실패")
         
         except Exception as e:
             print(f"Vanilla 실패: {e}")
+            raise
     
-    async def update_fabric(self):
+    async def update_fabric(self, revalidate: bool = False):
         """Fabric 다운로드"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://meta.fabricmc.net/v2/versions/game') as resp:
-                    versions = await resp.json()
+            versions, loaders, installers = await asyncio.gather(
+                self.metadata.get_json('https://meta.fabricmc.net/v2/versions/game', revalidate=revalidate),
+                self.metadata.get_json('https://meta.fabricmc.net/v2/versions/loader', revalidate=revalidate),
+                self.metadata.get_json('https://meta.fabricmc.net/v2/versions/installer', revalidate=revalidate)
+            )
+            loader_version = loaders[0]['version']
+            installer_version = installers[0]['version']
+            
+            pending = {}
+            
+            for version_info in versions[:10]:
+                if not version_info['stable']:
+                    continue
                 
-                async with session.get('https://meta.fabricmc.net/v2/versions/loader') as resp:
-                    loaders = await resp.json()
-                    loader_version = loaders[0]['version']
+                version = version_info['version']
+                jar_file = self.cores_dir / 'fabric' / version / 'server.jar'
+                if jar_file.exists():
+                    continue
                 
-                async with session.get('https://meta.fabricmc.net/v2/versions/installer') as resp:
-                    installers = await resp.json()
-                    installer_version = installers[0]['version']
+                download_url = f'https://meta.fabricmc.net/v2/versions/loader/{version}/{loader_version}/{installer_version}/server/jar'
                 
-                for version_info in versions[:10]:
-                    if not version_info['stable']:
-                        continue
-                    
-                    version = version_info['version']
-                    version_dir = self.cores_dir / 'fabric' / version
-                    version_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    jar_file = version_dir / 'server.jar'
-                    if jar_file.exists():
-                        continue
-                    
-                    download_url = f'https://meta.fabricmc.net/v2/versions/loader/{version}/{loader_version}/{installer_version}/server/jar'
-                    
-                    async with session.get(download_url) as resp:
-                        with open(jar_file, 'wb') as f:
-                            f.write(await resp.read())
-                    
-                    print(f"Fabric {version} 다운로드")
+                # Fabric 메타 API는 해시를 게시하지 않음 (크기 검증 + 원자적 교체만)
+                future = self.download_queue.submit(download_url, jar_file, label=f"Fabric {version}")
+                pending[version] = (future, {'url': download_url, 'build': loader_version})
+            
+            failed = await self._collect_downloads("Fabric", 'fabric', pending)
+            if failed:
+                raise RuntimeError(f"{failed}개 버전 다운로드 실패")
         
         except Exception as e:
             print(f"Fabric 실패: {e}")
+            raise
     
-    async def update_forge(self):
+    async def update_forge(self, revalidate: bool = False):
         """Forge 다운로드"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json') as resp:
-                    data = await resp.json()
-                    promos = data['promos']
+            data = await self.metadata.get_json(
+                'https://files.minecraftforge.net/net/minecraftforge/forge/promotions_slim.json',
+                revalidate=revalidate
+            )
+            promos = data['promos']
+            
+            targets = []
+            for key, build in list(promos.items())[:20]:
+                if not key.endswith('-latest'):
+                    continue
                 
-                for key, build in list(promos.items())[:20]:
-                    if not key.endswith('-latest'):
-                        continue
-                    
-                    version = key.replace('-latest', '')
-                    version_dir = self.cores_dir / 'forge' / version
-                    version_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    jar_file = version_dir / 'server.jar'
-                    if jar_file.exists():
-                        continue
-                    
-                    download_url = f'https://maven.minecraftforge.net/net/minecraftforge/forge/{version}-{build}/forge-{version}-{build}-installer.jar'
-                    
-                    async with session.get(download_url) as resp:
-                        if resp.status == 200:
-                            with open(jar_file, 'wb') as f:
-                                f.write(await resp.read())
-                            print(f"Forge {version} 다운로드")
+                version = key.replace('-latest', '')
+                # 설치기는 server.jar가 아니라 installer.jar로 보관 (사전 설치 파이프라인이 실행)
+                jar_file = self.cores_dir / 'forge' / version / 'installer.jar'
+                if jar_file.exists():
+                    continue
+                
+                download_url = f'https://maven.minecraftforge.net/net/minecraftforge/forge/{version}-{build}/forge-{version}-{build}-installer.jar'
+                targets.append((version, build, download_url, jar_file))
+            
+            # Maven 저장소의 .sha1 체크섬 파일로 검증 (체크섬 조회도 풀링된 연결로 병렬 처리)
+            checksums = await asyncio.gather(*[
+                self._fetch_text_checksum(url + '.sha1') for _, _, url, _ in targets
+            ])
+            
+            pending = {}
+            for (version, build, download_url, jar_file), sha1 in zip(targets, checksums):
+                future = self.download_queue.submit(
+                    download_url, jar_file, sha1=sha1, label=f"Forge {version}"
+                )
+                pending[version] = (future, {'url': download_url, 'build': build})
+            
+            failed = await self._collect_downloads("Forge", 'forge', pending)
+            if failed:
+                raise RuntimeError(f"{failed}개 버전 다운로드 실패")
         
         except Exception as e:
             print(f"Forge 실패: {e}")
+            raise
     
-    async def update_plugins(self):
+    async def _fetch_text_checksum(self, url: str) -> Optional[str]:
+        """Maven 스타일 체크섬 파일 (.sha1 등) 조회 - 없으면 None"""
+        try:
+            async with self.http.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    return None
+                text = (await resp.text()).strip()
+                return text.split()[0] if text else None
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _github_asset_sha256(asset: dict) -> Optional[str]:
+        """GitHub 릴리스 asset의 digest ("sha256:...") 추출"""
+        digest = asset.get('digest') or ''
+        if digest.startswith('sha256:'):
+            return digest.split(':', 1)[1]
+        return None
+    
+    async def update_plugins(self, revalidate: bool = False):
         """플러그인 업데이트"""
         tasks = [
-            self._update_worldedit(),
-            self._update_essentialsx(),
-            self._update_geyser()
+            self._update_worldedit(revalidate),
+            self._update_essentialsx(revalidate),
+            self._update_geyser(revalidate)
         ]
         
-        await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        failed = [r for r in results if isinstance(r, Exception)]
+        if failed:
+            raise RuntimeError(f"{len(failed)}개 플러그인 실패")
     
-    async def _update_worldedit(self):
+    async def _update_worldedit(self, revalidate: bool = False):
         """WorldEdit 다운로드 (수정: 에러 핸들링 강화)"""
         try:
             plugin_dir = self.plugins_dir / 'worldedit'
             plugin_dir.mkdir(exist_ok=True)
             
-            headers = {
-                'User-Agent': 'MinecraftBot/1.0',
-                'Accept': 'application/vnd.github+json'
-            }
+            headers = {'Accept': 'application/vnd.github+json'}
             
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get('https://api.github.com/repos/EngineHub/WorldEdit/releases/latest', timeout=10) as resp:
-                    if resp.status != 200:
-                        print(f"WorldEdit 실패: HTTP {resp.status}")
-                        return
-                    
-                    data = await resp.json()
-                    assets = data.get('assets', [])
+            data = await self.metadata.get_json(
+                'https://api.github.com/repos/EngineHub/WorldEdit/releases/latest',
+                headers=headers, revalidate=revalidate
+            )
+            assets = data.get('assets', [])
+            
+            if not assets:
+                print(f"WorldEdit 실패: assets 목록 없음")
+                return
+            
+            # bukkit JAR 찾기
+            for asset in assets:
+                name = asset.get('name', '').lower()
+                if 'bukkit' in name and name.endswith('.jar'):
+                    jar_name = asset['name']
                     
-                    if not assets:
-                        print(f"WorldEdit 실패: assets 목록 없음")
+                    jar_file = plugin_dir / jar_name
+                    if jar_file.exists():
                         return
                     
-                    # bukkit JAR 찾기
-                    for asset in assets:
-                        name = asset.get('name', '').lower()
-                        if 'bukkit' in name and name.endswith('.jar'):
-                            download_url = asset['browser_download_url']
-                            jar_name = asset['name']
-                            
-                            async with session.get(download_url, timeout=60) as dl_resp:
-                                if dl_resp.status != 200:
-                                    continue
-                                
-                                jar_file = plugin_dir / jar_name
-                                with open(jar_file, 'wb') as f:
-                                    f.write(await dl_resp.read())
-                            
-                            print(f"WorldEdit 다운로드 완료: {jar_name}")
-                            return
+                    try:
+                        result = await self.download_queue.submit(
+                            asset['browser_download_url'], jar_file,
+                            sha256=self._github_asset_sha256(asset),
+                            label=f"WorldEdit {jar_name}"
+                        )
+                    except Exception as e:
+                        print(f"WorldEdit {jar_name} 다운로드 실패: {e}")
+                        continue
+                    
+                    self._record_plugin('worldedit', result, data.get('tag_name'), asset['browser_download_url'])
                     
-                    print(f"WorldEdit 실패: bukkit JAR 없음")
+                    print(f"WorldEdit 다운로드 완료: {jar_name}")
+                    return
+            
+            print(f"WorldEdit 실패: bukkit JAR 없음")
         
         except Exception as e:
             print(f"WorldEdit 실패: {e}")
+            raise
     
-    async def _update_essentialsx(self):
+    async def _update_essentialsx(self, revalidate: bool = False):
         """EssentialsX 다운로드"""
         try:
             plugin_dir = self.plugins_dir / 'essentialsx'
             plugin_dir.mkdir(exist_ok=True)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://api.github.com/repos/EssentialsX/Essentials/releases/latest') as resp:
-                    data = await resp.json()
+            data = await self.metadata.get_json(
+                'https://api.github.com/repos/EssentialsX/Essentials/releases/latest',
+                revalidate=revalidate
+            )
+            
+            for asset in data['assets']:
+                if 'EssentialsX-' in asset['name'] and asset['name'].endswith('.jar'):
+                    jar_file = plugin_dir / asset['name']
+                    if jar_file.exists():
+                        break
                     
-                    for asset in data['assets']:
-                        if 'EssentialsX-' in asset['name'] and asset['name'].endswith('.jar'):
-                            download_url = asset['browser_download_url']
-                            
-                            async with session.get(download_url) as dl_resp:
-                                jar_file = plugin_dir / asset['name']
-                                with open(jar_file, 'wb') as f:
-                                    f.write(await dl_resp.read())
-                            
-                            print(f"EssentialsX 다운로드")
-                            break
+                    result = await self.download_queue.submit(
+                        asset['browser_download_url'], jar_file,
+                        sha256=self._github_asset_sha256(asset),
+                        label=f"EssentialsX {asset['name']}"
+                    )
+                    self._record_plugin('essentialsx', result, data.get('tag_name'), asset['browser_download_url'])
+                    
+                    print(f"EssentialsX 다운로드")
+                    break
         except Exception as e:
             print(f"EssentialsX 실패: {e}")
+            raise
     
-    async def _update_geyser(self):
+    async def _update_geyser(self, revalidate: bool = False):
         """Geyser 다운로드"""
         try:
             plugin_dir = self.plugins_dir / 'geyser'
             plugin_dir.mkdir(exist_ok=True)
             
-            download_url = 'https://download.geysermc.org/v2/projects/geyser/versions/latest/builds/latest/downloads/spigot'
+            build_url = 'https://download.geysermc.org/v2/projects/geyser/versions/latest/builds/latest'
+            download_url = build_url + '/downloads/spigot'
+            jar_file = plugin_dir / 'Geyser-Spigot.jar'
+            
+            # 최신 빌드 정보 (SHA-256 포함)
+            sha256 = None
+            build_data = {}
+            try:
+                build_data = await self.metadata.get_json(build_url, revalidate=revalidate)
+                sha256 = build_data.get('downloads', {}).get('spigot', {}).get('sha256')
+            except Exception as e:
+                print(f"Geyser 빌드 정보 조회 실패 (검증 없이 진행): {e}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(download_url) as resp:
-                    jar_file = plugin_dir / 'Geyser-Spigot.jar'
-                    with open(jar_file, 'wb') as f:
-                        f.write(await resp.read())
+            # 이미 같은 빌드면 건너뛰기
+            if sha256 and jar_file.exists():
+                current = await asyncio.to_thread(self._file_sha256, jar_file)
+                if current == sha256.lower():
+                    return
+            
+            result = await self.download_queue.submit(download_url, jar_file, sha256=sha256, label="Geyser")
+            
+            version = build_data.get('version')
+            if version and build_data.get('build'):
+                version = f"{version} (빌드 {build_data['build']})"
+            self._record_plugin('geyser', result, version, download_url)
             
             print(f"Geyser 다운로드")
         except Exception as e:
             print(f"Geyser 실패: {e}")
+            raise
+    
+    # ========================================
+    # 오프라인 번들
+    # ========================================
+    
+    def list_bundles(self) -> List[str]:
+        """번들 폴더의 .tar 파일"""
+        if not self.bundles_dir.exists():
+            return []
+        return sorted(p.name for p in self.bundles_dir.glob('*.tar'))
+    
+    async def export_bundle(
+        self,
+        core_type: Optional[str] = None,
+        version: Optional[str] = None,
+        include_plugins: bool = True,
+        have_file: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        번들 내보내기 (bundles/ 폴더에 생성)
+        
+        Args:
+            have_file: 대상 노드의 보유 목록 파일 (bundles/ 안) - 지정 시 대상에 없는 blob만 포함
+        """
+        try:
+            exclude = set()
+            if have_file:
+                have_path = self.bundles_dir / have_file
+                if not have_path.exists():
+                    return False, f"보유 목록 파일을 찾을 수 없습니다: {have_file}"
+                exclude = CoreBundle.hashes_from([have_path])
+            
+            label = '-'.join(filter(None, [core_type, version])) or 'all'
+            dest = self.bundles_dir / f"cores_{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar"
+            
+            result = await asyncio.to_thread(
+                self.bundle.export, dest, core_type, version, include_plugins, exclude
+            )
+            
+            if result['entries'] == 0:
+                dest.unlink(missing_ok=True)
+                return False, "내보낼 항목이 없습니다"
+            
+            return True, (
+                f"번들 생성: {dest.name}\n"
+                f"항목 {result['entries']}개, blob {result['blobs']}개 ({result['bytes'] / 1048576:.1f}MB), "
+                f"대상 보유로 제외 {result['skipped']}개"
+            )
+        except Exception as e:
+            return False, f"번들 내보내기 오류: {e}"
+    
+    async def import_bundle(self, bundle_name: str) -> Tuple[bool, str]:
+        """bundles/ 폴더의 번들 가져오기"""
+        try:
+            bundle_path = self.bundles_dir / bundle_name
+            if not bundle_path.exists():
+                return False, f"번들을 찾을 수 없습니다: {bundle_name}"
+            
+            result = await asyncio.to_thread(self.bundle.import_bundle, bundle_path)
+            self.bundle.register(result)
+            
+            message = (
+                f"번들 가져오기 완료: {bundle_name}\n"
+                f"새 항목 {result['added']}개, 기존 {result['existing']}개, "
+                f"blob 추가 {result['blobs_imported']}개 ({result['bytes'] / 1048576:.1f}MB), 재사용 {result['blobs_reused']}개"
+            )
+            if result['missing']:
+                message += f"\n⚠️ 번들에 내용이 없어 건너뜀: {', '.join(result['missing'])}"
+            
+            return True, message
+        except Exception as e:
+            return False, f"번들 가져오기 오류: {e}"
+    
+    async def write_have_list(self) -> Tuple[bool, str]:
+        """이 노드의 보유 blob 목록 파일 생성 (원본 노드에서 차등 번들을 만들 때 사용)"""
+        try:
+            import platform
+            
+            self.bundles_dir.mkdir(parents=True, exist_ok=True)
+            digests = await asyncio.to_thread(self.bundle.local_hashes)
+            have_file = self.bundles_dir / f"have_{platform.node()}.txt"
+            
+            with open(have_file, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(sorted(digests)) + '\n')
+            
+            return True, f"보유 목록 생성: {have_file.name} (blob {len(digests)}개)"
+        except Exception as e:
+            return False, f"보유 목록 생성 오류: {e}"
+    
+    def _record_plugin(self, name: str, result: dict, version: Optional[str], url: str):
+        """다운로드 결과를 카탈로그에 기록"""
+        self.catalog.record_plugin(
+            name, result['path'],
+            version=version,
+            sha256=result['sha256'],
+            size=result['size'],
+            url=url
+        )
+    
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """파일 SHA-256 (청크 단위)"""
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        return h.hexdigest()
     
     def get_available_cores(self) -> Dict[str, List[str]]:
-        """사용 가능한 구동기 목록"""
+        """사용 가능한 구동기 목록 {구동기: [버전 (최신순)]}"""
         cores = {}
         
         for core_type in self.core_types.keys():
-            core_dir = self.cores_dir / core_type
-            if core_dir.exists():
-                versions = [v.name for v in core_dir.iterdir() if v.is_dir() and (v / 'server.jar').exists()]
-                cores[core_type] = sorted(versions, reverse=True)
+            versions = self.catalog.versions(core_type)
+            if versions:
+                cores[core_type] = versions
         
         return cores
     
+    def resolve_version(self, core_type: str, version: str) -> Optional[str]:
+        """
+        버전 지정 해석
+        
+        "1.21.x" / "1.21" (정확히 일치하는 버전이 없을 때) → 1.21 계열 최신
+        "latest" → 전체 최신
+        """
+        if self.catalog.get_core(core_type, version):
+            return version
+        
+        series = None if version == 'latest' else version
+        entry = self.catalog.latest(core_type, series)
+        return entry['version'] if entry else None
+    
+    def get_core_info(self, core_type: str, version: str) -> Optional[dict]:
+        """카탈로그 항목 (build, sha256, size, url, fetched_at, min_java)"""
+        resolved = self.resolve_version(core_type, version)
+        return self.catalog.get_core(core_type, resolved) if resolved else None
+    
     def get_core_path(self, core_type: str, version: str) -> Optional[Path]:
         """구동기 JAR 경로"""
-        jar_file = self.cores_dir / core_type / version / 'server.jar'
+        entry = self.get_core_info(core_type, version)
+        if not entry:
+            return None
+        jar_file = self.catalog.path_of(entry)
         return jar_file if jar_file.exists() else None
     
     def supports_plugins(self, core_type: str) -> bool:
@@ -512,21 +890,24 @@ class ServerCoreManager:
     
     def get_available_plugins(self) -> List[str]:
         """사용 가능한 플러그인"""
-        plugins = []
+        return self.catalog.plugin_names()
+    
+    def iter_catalog_jars(self):
+        """구동기/플러그인 목록에 있는 모든 jar (blob 정리 시 참조로 취급)"""
+        for core_type in self.core_types.keys():
+            core_dir = self.cores_dir / core_type
+            if core_dir.exists():
+                yield from core_dir.glob('*/server.jar')
+                yield from core_dir.glob('*/installer.jar')
+                yield from core_dir.glob('*/prebuilt/**/*.jar')
         
         if self.plugins_dir.exists():
-            for plugin_dir in self.plugins_dir.iterdir():
-                if plugin_dir.is_dir():
-                    jar_files = list(plugin_dir.glob('*.jar'))
-                    if jar_files:
-                        plugins.append(plugin_dir.name)
-        
-        return plugins
+            yield from self.plugins_dir.glob('*/*.jar')
     
     def get_plugin_jar(self, plugin_name: str) -> Optional[Path]:
         """플러그인 JAR 경로"""
-        plugin_dir = self.plugins_dir / plugin_name
-        if plugin_dir.exists():
-            jar_files = list(plugin_dir.glob('*.jar'))
-            return jar_files[0] if jar_files else None
-        return None
\ No newline at end of file
+        entry = self.catalog.get_plugin(plugin_name)
+        if not entry:
+            return None
+        jar_file = self.catalog.path_of(entry)
+        return jar_file if jar_file.exists() else None
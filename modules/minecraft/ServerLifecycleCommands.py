@@ -9,6 +9,7 @@ from typing import Optional
 import tempfile
 import time
 from pathlib import Path
+from datetime import datetime
 import asyncio
 
 def setup_lifecycle_commands(bot):
@@ -137,6 +138,9 @@ def setup_lifecycle_commands(bot):
         success, message = await bot.lifecycle_manager.upgrade_server(서버, 새버전, 새구동기)
         
         if success:
+            if bot.mc:
+                bot.mc.startup_analyzer.record_change(서버, 'upgrade', f"{새구동기 or ''} {새버전}".strip())
+            
             embed = discord.Embed(title="업그레이드 완료", color=discord.Color.green())
             embed.add_field(name="서버", value=서버, inline=False)
             embed.add_field(name="결과", value=message, inline=False)
@@ -172,12 +176,17 @@ def setup_lifecycle_commands(bot):
             await interaction.response.send_message("권한 없음", ephemeral=True)
             return
         
-        success, message = bot.lifecycle_manager.add_plugin_to_server(서버, 플러그인)
+        await interaction.response.defer()
+        
+        success, message = await bot.lifecycle_manager.add_plugin_to_server(서버, 플러그인)
         
         if success:
-            await interaction.response.send_message(f"{message}\n재시작 필요")
+            if bot.mc:
+                bot.mc.startup_analyzer.record_change(서버, 'plugin', 플러그인)
+            
+            await interaction.followup.send(f"{message}\n재시작 필요")
         else:
-            await interaction.response.send_message(f"실패: {message}", ephemeral=True)
+            await interaction.followup.send(f"실패: {message}")
     
     @bot.tree.command(name="구동기목록", description="사용 가능한 구동기 확인")
     async def list_cores(interaction: discord.Interaction):
@@ -202,6 +211,12 @@ def setup_lifecycle_commands(bot):
             if len(versions) > 10:
                 versions_text += f" 외 {len(versions) - 10}개"
             
+            latest = bot.core_manager.get_core_info(core_type, versions[0])
+            if latest:
+                build_text = f" 빌드 {latest['build']}" if latest.get('build') else ""
+                fetched = datetime.fromtimestamp(latest['fetched_at']).strftime('%Y-%m-%d')
+                versions_text += f"\n최신: {versions[0]}{build_text} · Java {latest['min_java']}+ · {fetched}"
+            
             embed.add_field(name=f"{core_type.upper()} {feature_text}", value=versions_text, inline=False)
         
         await interaction.response.send_message(embed=embed)
@@ -227,11 +242,20 @@ def setup_lifecycle_commands(bot):
         
         await interaction.response.defer()
         
-        await interaction.followup.send("업데이트 시작 (시간 소요)")
+        # 백그라운드 작업으로 실행 (캐시된 메타데이터는 조건부 요청으로 재검증)
+        job, created = bot.core_manager.start_update_job(revalidate=True)
+        
+        prefix = "" if created else "이미 진행 중인 업데이트에 연결합니다\n"
+        progress_message = await interaction.followup.send(f"{prefix}```\n{job.summary()}\n```", wait=True)
+        
+        async def on_progress(updated_job):
+            await progress_message.edit(content=f"```\n{updated_job.summary()}\n```")
         
-        await bot.core_manager.update_all_cores()
+        job.add_listener(on_progress)
         
-        await interaction.followup.send("업데이트 완료")
+        # 메시지 전송 전에 이미 끝난 경우
+        if job.done:
+            await on_progress(job)
     
     @bot.tree.command(name="백업정리", description="오래된 백업 삭제")
     async def cleanup_backups(interaction: discord.Interaction):
@@ -245,6 +269,83 @@ def setup_lifecycle_commands(bot):
         
         await interaction.followup.send(message)
     
+    @bot.tree.command(name="저장소정리", description="사용하지 않는 구동기/플러그인 jar 정리")
+    async def cleanup_blob_store(interaction: discord.Interaction):
+        if not bot.is_authorized(interaction.user, "administrator"):
+            await interaction.response.send_message("권한 없음", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        success, message = await bot.lifecycle_manager.cleanup_blob_store()
+        
+        await interaction.followup.send(message)
+    
+    async def bundle_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        try:
+            bundles = bot.core_manager.list_bundles()
+            return [app_commands.Choice(name=b, value=b) for b in bundles if current.lower() in b.lower()][:25]
+        except:
+            return []
+    
+    async def have_file_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        try:
+            files = sorted(p.name for p in bot.core_manager.bundles_dir.glob('have_*.txt'))
+            return [app_commands.Choice(name=f, value=f) for f in files if current.lower() in f.lower()][:25]
+        except:
+            return []
+    
+    @bot.tree.command(name="번들내보내기", description="구동기/플러그인을 오프라인 번들(tar)로 내보내기")
+    @app_commands.describe(
+        구동기="특정 구동기만 (비우면 전체)",
+        버전="특정 버전만",
+        플러그인포함="플러그인 포함 여부",
+        보유목록="대상 노드의 보유 목록 파일 (대상에 없는 파일만 포함)"
+    )
+    @app_commands.autocomplete(구동기=core_type_autocomplete, 버전=version_autocomplete, 보유목록=have_file_autocomplete)
+    async def export_bundle(
+        interaction: discord.Interaction,
+        구동기: Optional[str] = None,
+        버전: Optional[str] = None,
+        플러그인포함: bool = True,
+        보유목록: Optional[str] = None
+    ):
+        if not bot.is_authorized(interaction.user, "administrator"):
+            await interaction.response.send_message("권한 없음", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        success, message = await bot.core_manager.export_bundle(구동기, 버전, 플러그인포함, 보유목록)
+        
+        await interaction.followup.send(message if success else f"실패: {message}")
+    
+    @bot.tree.command(name="번들가져오기", description="bundles 폴더의 오프라인 번들 가져오기")
+    @app_commands.describe(번들="가져올 번들 파일")
+    @app_commands.autocomplete(번들=bundle_autocomplete)
+    async def import_bundle(interaction: discord.Interaction, 번들: str):
+        if not bot.is_authorized(interaction.user, "administrator"):
+            await interaction.response.send_message("권한 없음", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        success, message = await bot.core_manager.import_bundle(번들)
+        
+        await interaction.followup.send(message if success else f"실패: {message}")
+    
+    @bot.tree.command(name="보유목록", description="이 노드가 가진 구동기/플러그인 해시 목록 생성 (차등 번들용)")
+    async def write_have_list(interaction: discord.Interaction):
+        if not bot.is_authorized(interaction.user, "administrator"):
+            await interaction.response.send_message("권한 없음", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        success, message = await bot.core_manager.write_have_list()
+        
+        await interaction.followup.send(message if success else f"실패: {message}")
+    
     @bot.tree.command(name="모드추가", description="모드 jar 파일을 서버에 추가")
     @app_commands.describe(서버="대상 서버")
     @app_commands.autocomplete(서버=server_autocomplete)
@@ -318,8 +419,15 @@ def setup_lifecycle_commands(bot):
         
         embed = discord.Embed(title="Spigot 빌드 상태", color=discord.Color.blue())
         
-        for version, state in status.items():
-            status_text = "빌드 중" if state == 'building' else "완료"
+        state_texts = {'queued': "⏳ 대기 중", 'running': "🔨 빌드 중", 'paused': "⏸️ 일시정지"}
+        
+        for version, info in status.items():
+            status_text = state_texts.get(info['state'], info['state'])
+            if info['state'] == 'paused' and info.get('pause_reason'):
+                status_text += f" ({info['pause_reason']})"
+            if info.get('started_at'):
+                elapsed = (datetime.now() - datetime.fromisoformat(info['started_at'])).total_seconds()
+                status_text += f"\n경과 {elapsed / 60:.0f}분 · 최대 RSS {info['peak_rss'] / 1048576:.0f}MB"
             embed.add_field(name=f"Spigot {version}", value=status_text, inline=True)
         
         embed.set_footer(text="빌드는 백그라운드에서 진행됩니다")
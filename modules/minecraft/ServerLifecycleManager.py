@@ -3,12 +3,15 @@
 경로: modules/minecraft/ServerLifecycleManager.py
 """
 
+import asyncio
 import shutil
 from pathlib import Path
 from typing import Tuple, Optional, Dict
 from datetime import datetime, timedelta
 import json
 
+from .MaintenanceExecutor import MaintenanceExecutor
+
 
 class ServerLifecycleManager:
     """서버 생성/삭제/업그레이드 관리"""
@@ -18,6 +21,9 @@ class ServerLifecycleManager:
         self.core_manager = core_manager
         self.backups_dir = servers_dir.parent / 'backups'
         self.backups_dir.mkdir(exist_ok=True)
+        
+        # 백업 복사/삭제는 저우선순위 작업 스레드에서 (main.py에서 ServerManager와 공유)
+        self.maintenance = MaintenanceExecutor()
     
     async def create_server(
         self,
@@ -36,16 +42,34 @@ class ServerLifecycleManager:
             if server_path.exists():
                 return False, f"서버가 이미 존재합니다: {server_id}", None
             
-            # 구동기 확인
-            core_jar = self.core_manager.get_core_path(core_type, version)
+            # 구동기 확인 ("1.21.x" 같은 계열 지정은 카탈로그의 최신 버전으로 해석)
+            resolved = self.core_manager.resolve_version(core_type, version)
+            core_jar = self.core_manager.get_core_path(core_type, resolved) if resolved else None
             if not core_jar:
                 return False, f"{core_type} {version}을 찾을 수 없습니다", None
+            version = resolved
             
             # 폴더 생성
             server_path.mkdir(parents=True)
             
-            # 구동기 복사
-            shutil.copy(core_jar, server_path / 'server.jar')
+            blobs = self.core_manager.blobs
+            launch = None
+            
+            if self.core_manager.is_modded(core_type):
+                # Forge/Fabric: 사전 설치된 트리 배포 (없으면 지금 설치)
+                success, message, prebuilt = await self.core_manager.ensure_prebuilt(core_type, version)
+                if success:
+                    await asyncio.to_thread(blobs.clone_tree, self.core_manager.catalog.path_of(prebuilt), server_path)
+                    launch = prebuilt['launch']
+                elif core_type == 'forge':
+                    shutil.rmtree(server_path)
+                    return False, f"Forge {version} 서버 설치 실패: {message}", None
+                else:
+                    # Fabric 런처는 첫 실행 시 라이브러리를 받으므로 그대로 사용 가능
+                    await asyncio.to_thread(blobs.deploy, core_jar, server_path / 'server.jar')
+            else:
+                # 구동기 배포 (blob 저장소에서 reflink/하드링크)
+                await asyncio.to_thread(blobs.deploy, core_jar, server_path / 'server.jar')
             
             # 플러그인 설치
             if plugins and self.core_manager.supports_plugins(core_type):
@@ -55,7 +79,7 @@ class ServerLifecycleManager:
                 for plugin_name in plugins:
                     plugin_jar = self.core_manager.get_plugin_jar(plugin_name)
                     if plugin_jar:
-                        shutil.copy(plugin_jar, plugins_dir / plugin_jar.name)
+                        await asyncio.to_thread(blobs.deploy, plugin_jar, plugins_dir / plugin_jar.name)
             
             # 모드 서버인 경우 mods 폴더 생성
             if self.core_manager.is_modded(core_type):
@@ -68,6 +92,7 @@ class ServerLifecycleManager:
                 "name": server_id.replace('_', ' ').title(),
                 "core_type": core_type,
                 "version": version,
+                "min_java": (self.core_manager.get_core_info(core_type, version) or {}).get('min_java'),
                 "description": description,
                 "memory": {
                     "min": min_memory or DEFAULT_MIN_MEMORY,
@@ -81,6 +106,9 @@ class ServerLifecycleManager:
                 "plugins": plugins or []
             }
             
+            if launch:
+                config["launch"] = launch
+            
             with open(server_path / 'bot_config.json', 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
             
@@ -106,7 +134,7 @@ class ServerLifecycleManager:
                 backup_name = f"{server_id}_deleted_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 backup_path = self.backups_dir / backup_name
                 
-                shutil.copytree(server_path, backup_path)
+                await self.maintenance.run(f"{server_id} 삭제 백업", self.maintenance.copytree, server_path, backup_path)
                 
                 # 백업 메타데이터
                 meta = {
@@ -119,7 +147,7 @@ class ServerLifecycleManager:
                     json.dump(meta, f, indent=2)
             
             # 서버 삭제
-            shutil.rmtree(server_path)
+            await self.maintenance.run(f"{server_id} 삭제", self.maintenance.rmtree, server_path)
             
             return True, f"서버 삭제 완료: {server_id}"
         
@@ -149,15 +177,17 @@ class ServerLifecycleManager:
             core_type = new_core_type or old_core_type
             
             # 새 구동기 확인
-            new_core_jar = self.core_manager.get_core_path(core_type, new_version)
+            resolved = self.core_manager.resolve_version(core_type, new_version)
+            new_core_jar = self.core_manager.get_core_path(core_type, resolved) if resolved else None
             if not new_core_jar:
                 return False, f"{core_type} {new_version}을 찾을 수 없습니다"
+            new_version = resolved
             
             # 백업 생성
             backup_name = f"{server_id}_before_{new_version}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             backup_path = self.backups_dir / backup_name
             
-            shutil.copytree(server_path, backup_path)
+            await self.maintenance.run(f"{server_id} 업그레이드 백업", self.maintenance.copytree, server_path, backup_path)
             
             # 백업 메타데이터
             meta = {
@@ -171,16 +201,25 @@ class ServerLifecycleManager:
             with open(backup_path / 'backup_meta.json', 'w') as f:
                 json.dump(meta, f, indent=2)
             
-            # 구동기 교체
-            old_jar = server_path / 'server.jar'
-            if old_jar.exists():
-                old_jar.unlink()
-            
-            shutil.copy(new_core_jar, old_jar)
+            if self.core_manager.is_modded(core_type):
+                # Forge/Fabric: 새 버전의 사전 설치 트리를 덮어쓰기
+                success, message, prebuilt = await self.core_manager.ensure_prebuilt(core_type, new_version)
+                if not success:
+                    return False, f"{core_type} {new_version} 서버 설치 실패: {message}"
+                await asyncio.to_thread(
+                    self.core_manager.blobs.clone_tree,
+                    self.core_manager.catalog.path_of(prebuilt), server_path, True
+                )
+                config['launch'] = prebuilt['launch']
+            else:
+                # 구동기 교체 (원자적 교체, blob 저장소에서 배포)
+                await asyncio.to_thread(self.core_manager.blobs.deploy, new_core_jar, server_path / 'server.jar')
+                config.pop('launch', None)
             
             # 설정 업데이트
             config['core_type'] = core_type
             config['version'] = new_version
+            config['min_java'] = (self.core_manager.get_core_info(core_type, new_version) or {}).get('min_java')
             config['upgraded_at'] = datetime.now().isoformat()
             config['previous_version'] = f"{old_core_type} {old_version}"
             
@@ -220,10 +259,10 @@ class ServerLifecycleManager:
             
             # 현재 서버 삭제
             if server_path.exists():
-                shutil.rmtree(server_path)
+                await self.maintenance.run(f"{server_id} 롤백 삭제", self.maintenance.rmtree, server_path)
             
             # 백업 복원
-            shutil.copytree(backup_path, server_path)
+            await self.maintenance.run(f"{server_id} 롤백 복원", self.maintenance.copytree, backup_path, server_path)
             
             # 백업 메타데이터 제거
             meta_file = server_path / 'backup_meta.json'
@@ -255,7 +294,7 @@ class ServerLifecycleManager:
                 expire_at = datetime.fromisoformat(meta.get('expire_at', ''))
                 
                 if now > expire_at:
-                    shutil.rmtree(backup_dir)
+                    await self.maintenance.run(f"백업 삭제 {backup_dir.name}", self.maintenance.rmtree, backup_dir)
                     deleted += 1
             
             return True, f"오래된 백업 {deleted}개 삭제 완료"
@@ -263,6 +302,47 @@ class ServerLifecycleManager:
         except Exception as e:
             return False, f"백업 정리 오류: {e}"
     
+    def _iter_server_jars(self):
+        """서버 폴더 안의 jar (server.jar 등 최상위 jar, plugins, mods, libraries)"""
+        if not self.servers_dir.exists():
+            return
+        
+        for server_path in self.servers_dir.iterdir():
+            if not server_path.is_dir():
+                continue
+            
+            yield from server_path.glob('*.jar')
+            
+            for sub in ('plugins', 'mods'):
+                sub_dir = server_path / sub
+                if sub_dir.exists():
+                    yield from sub_dir.glob('*.jar')
+            
+            # 사전 설치 트리에서 배포된 라이브러리
+            libraries_dir = server_path / 'libraries'
+            if libraries_dir.exists():
+                yield from libraries_dir.rglob('*.jar')
+    
+    async def cleanup_blob_store(self) -> Tuple[bool, str]:
+        """서버/구동기 목록에서 참조하지 않는 blob 삭제"""
+        try:
+            blobs = self.core_manager.blobs
+            
+            def collect():
+                referenced = list(self._iter_server_jars()) + list(self.core_manager.iter_catalog_jars())
+                return blobs.collect_garbage(referenced)
+            
+            result = await asyncio.to_thread(collect)
+            usage = await asyncio.to_thread(blobs.get_usage)
+            
+            return True, (
+                f"저장소 정리 완료: blob {result['removed']}개 삭제 ({result['freed'] / 1048576:.1f}MB 확보)\n"
+                f"남은 blob {usage['blobs']}개, {usage['bytes'] / 1048576:.1f}MB"
+            )
+        
+        except Exception as e:
+            return False, f"저장소 정리 오류: {e}"
+    
     def add_mod_to_server(self, server_id: str, mod_file: Path) -> Tuple[bool, str]:
         """모드 파일 추가"""
         try:
@@ -293,7 +373,7 @@ class ServerLifecycleManager:
         except Exception as e:
             return False, f"모드 추가 오류: {e}"
     
-    def add_plugin_to_server(self, server_id: str, plugin_name: str) -> Tuple[bool, str]:
+    async def add_plugin_to_server(self, server_id: str, plugin_name: str) -> Tuple[bool, str]:
         """플러그인 추가"""
         try:
             server_path = self.servers_dir / server_id
@@ -321,7 +401,7 @@ class ServerLifecycleManager:
             plugins_dir = server_path / 'plugins'
             plugins_dir.mkdir(exist_ok=True)
             
-            shutil.copy(plugin_jar, plugins_dir / plugin_jar.name)
+            await asyncio.to_thread(self.core_manager.blobs.deploy, plugin_jar, plugins_dir / plugin_jar.name)
             
             # 설정 업데이트
             if 'plugins' not in config:
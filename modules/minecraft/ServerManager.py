@@ -4,7 +4,11 @@
 """
 
 import asyncio
+import json
+import re
+import socket
 import subprocess
+import time
 import psutil
 from pathlib import Path
 from datetime import datetime
@@ -28,6 +32,21 @@ except ImportError:
     SCREEN_AVAILABLE = False
     print("⚠️ ScreenManager를 불러올 수 없습니다.")
 
+from .ServerPrewarmer import ServerPrewarmer
+from .CdsArchive import CdsArchiveManager
+from .JvmProfiles import detect_java_version, pins_heap
+from .ResourceSampler import ResourceSampler
+from .GcLogAnalyzer import GcLogAnalyzer
+from .MemoryAdmission import MemoryAdmissionController
+from .StartQueue import ServerStartQueue
+from .CrashSupervisor import CrashSupervisor
+from .HangWatchdog import HangWatchdog
+from .JfrProfiler import JfrProfiler
+from .LagDetector import LagDetector
+from .StartupAnalyzer import StartupAnalyzer
+from .CgroupManager import CgroupManager
+from .MaintenanceExecutor import MaintenanceExecutor
+
 
 class ServerManager:
     """마인크래프트 서버 관리 (Screen 지원)"""
@@ -50,12 +69,46 @@ class ServerManager:
         
         # 서버 상태 캐시
         self.server_status = {}
+
+        # 시작 전 페이지 캐시 예열
+        self.prewarmer = ServerPrewarmer()
+        self.startup_tasks = {}  # {server_id: asyncio.Task}
         
         # 디렉토리
         self.servers_dir = self.base_path / 'servers'
         self.logs_dir = self.base_path / 'logs'
         self.servers_dir.mkdir(parents=True, exist_ok=True)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.startup_stats_file = self.logs_dir / 'startup_stats.json'
+        
+        # 시작 로그 분석 (Done 시간, 플러그인별 시간) + 회귀 감지
+        self.startup_analyzer = StartupAnalyzer(self.logs_dir / 'startup_changes.json')
+        
+        # 구동기 + Java 버전별 CDS 아카이브
+        self.cds = CdsArchiveManager(self.base_path / 'server_cores' / '.cds')
+        
+        # JVM 프로세스 캐시 {server_id: psutil.Process} + 리소스 기록
+        self.java_processes = {}
+        self.sampler = ResourceSampler(self)
+        
+        # 서버별 cgroup v2 격리 (main.py에서 모드 설정)
+        self.cgroups = CgroupManager()
+        
+        # 백업 등 유지보수 작업 (main.py에서 생명주기 관리자와 같은 실행기로 교체)
+        self.maintenance = MaintenanceExecutor()
+        
+        # GC 로그 분석 (/메모리분석)
+        self.gc_analyzer = GcLogAnalyzer()
+        
+        # 메모리 예산 승인 (예산/여유분은 main.py에서 설정)
+        self.admission = MemoryAdmissionController(self)
+        self.stopping_servers = set()
+        
+        # 자동 시작 / 전체 시작 큐 (동시 시작 수는 main.py에서 설정)
+        self.start_queue = ServerStartQueue(self)
+        
+        # 서버 시작 시각 {server_id: time.time()} (크래시 시 실행 시간 계산)
+        self.started_at = {}
         
         # OS 타입
         self.os_type = platform.system()
@@ -76,6 +129,18 @@ class ServerManager:
         # ✅ 기존 실행 중인 서버 재연결 (RCON 초기화 전에!)
         self._reconnect_existing_servers()
         
+        # 비정상 종료 감지 + 자동 재시작 (재시작 정책/알림은 main.py에서 설정)
+        self.supervisor = CrashSupervisor(self)
+        
+        # 응답 없음(행) 감지 + 스레드 덤프
+        self.watchdog = HangWatchdog(self)
+        
+        # JFR 프로파일링 (/프로파일, 보관 제한은 main.py에서 설정)
+        self.jfr = JfrProfiler(self, self.logs_dir / 'profiles')
+        
+        # 랙 스파이크 감지 (로그의 "Can't keep up!")
+        self.lag_detector = LagDetector(self)
+        
         # RCON 초기화
         self._init_rcon_clients()
     
@@ -97,14 +162,21 @@ class ServerManager:
             return
         
         reconnected_count = 0
-        
+
+        # "PID.name" → name 매핑 (서버마다 screen -ls 를 다시 실행하지 않도록 한 번만 구성)
+        sessions_by_name = {
+            screen.split('.', 1)[1]: screen
+            for screen in all_screens
+            if '.' in screen
+        }
+
         for server_id, config in self.servers_config.items():
             session_name = f"minecraft_{server_id}"
-            
+
             print(f"   🔍 [{server_id}] 찾는 세션명: '{session_name}'")  # ✅ 디버깅
-            
+
             # 해당 서버의 Screen 세션 찾기
-            actual_session = ScreenManager.find_screen_by_name(session_name)
+            actual_session = sessions_by_name.get(session_name)
             
             print(f"      → 찾은 결과: {actual_session if actual_session else 'None'}")  # ✅ 디버깅
             
@@ -113,6 +185,13 @@ class ServerManager:
                 self.running_servers[server_id] = actual_session
                 self.server_screen_sessions[server_id] = actual_session
                 reconnected_count += 1
+                
+                process = self.find_java_process(server_id)
+                if process:
+                    try:
+                        self.started_at[server_id] = process.create_time()
+                    except psutil.Error:
+                        pass
         
         if reconnected_count > 0:
             print(f"✅ {reconnected_count}개 서버 재연결 완료")
@@ -197,12 +276,41 @@ class ServerManager:
         
         return False
     
+    def find_java_process(self, server_id: str) -> Optional[psutil.Process]:
+        """
+        서버의 JVM 프로세스 (Screen/셸 아래에서 실행되므로 작업 폴더로 찾음)
+        """
+        cached = self.java_processes.get(server_id)
+        if cached and cached.is_running():
+            return cached
+        
+        config = self.get_server_config(server_id)
+        if not config:
+            return None
+        server_path = str(Path(config['path']).resolve())
+        
+        for proc in psutil.process_iter(['name', 'cwd']):
+            try:
+                if 'java' in (proc.info['name'] or '').lower() and proc.info['cwd'] == server_path:
+                    self.java_processes[server_id] = proc
+                    return proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        self.java_processes.pop(server_id, None)
+        return None
+    
     def has_rcon(self, server_id: str) -> bool:
         """서버가 RCON을 지원하는지 확인"""
         return server_id in self.rcon_clients
     
-    async def start_server(self, server_id: str) -> Tuple[bool, str]:
-        """서버 시작 (Lock으로 동시 실행 방지)"""
+    async def start_server(self, server_id: str, stop_idle: bool = False) -> Tuple[bool, str]:
+        """
+        서버 시작 (Lock으로 동시 실행 방지)
+        
+        Args:
+            stop_idle: 메모리 예산이 부족하면 접속자 없는 서버를 중지해서 자리 확보
+        """
         try:
             # Lock 생성 (없으면)
             if server_id not in self.server_locks:
@@ -227,12 +335,27 @@ class ServerManager:
                 if not server_path.exists():
                     return False, f"서버 경로가 존재하지 않습니다: {server_path}"
                 
-                # 메모리 체크 추가
-                memory_check_result = self._check_system_memory(config)
-                if not memory_check_result[0]:
-                    return False, memory_check_result[1]
+                # 메모리 예산 승인 (실행/시작 중인 서버 예약량 합산)
+                admission = await self.admission.admit(server_id)
+                if admission['decision'] != 'admit' and stop_idle and admission['idle']:
+                    admission = await self._make_room(server_id, admission)
+                if admission['decision'] != 'admit':
+                    return False, admission['message']
+                print(f"   🧮 {admission['message']}")
+                
+                # 시작 시간 측정 (예열 포함)
+                started = time.monotonic()
+                launch_info = {'prewarm': await self._prewarm(server_id, config)}
                 
                 start_command = config['start_command']
+                if config.get('cds', False):
+                    start_command, launch_info['cds'], launch_info['cds_key'] = await asyncio.to_thread(
+                        self._apply_cds, server_id, config, start_command
+                    )
+                
+                # 서버 전용 cgroup (systemd scope) + CPU 고정
+                start_command = await asyncio.to_thread(self.cgroups.wrap_command, server_id, config, start_command)
+                
                 terminal_mode = config.get('terminal_mode', 'auto')
                 
                 print(f"🚀 서버 시작: {config['name']}")
@@ -268,10 +391,13 @@ class ServerManager:
                         # ✅ running_servers에 등록
                         self.running_servers[server_id] = screen_session
                         self.server_screen_sessions[server_id] = screen_session
+                        self.started_at[server_id] = time.time()
                         
                         print(f"   ✅ running_servers에 등록: {server_id} → {screen_session}")
                         print(f"   📋 현재 등록된 서버: {list(self.running_servers.keys())}")
                         
+                        self._track_startup(server_id, config, started, launch_info)
+                        
                         # 서버 시작 대기
                         await asyncio.sleep(3)
                         
@@ -285,13 +411,34 @@ class ServerManager:
                 
                 # 폴백: 기본 백그라운드 실행
                 else:
-                    return await self._start_background(server_id, start_command, server_path)
+                    success, message = await self._start_background(server_id, start_command, server_path)
+                    if success:
+                        self.started_at[server_id] = time.time()
+                        self._track_startup(server_id, config, started, launch_info)
+                    return success, message
                     
         except Exception as e:
             print(f"❌ 서버 시작 오류: {e}")
             import traceback
             traceback.print_exc()
             return False, f"오류 발생: {e}"
+        finally:
+            # 시작 후에는 실행 중인 서버로 계산되므로 예약 해제 (실패 시 반환)
+            self.admission.release(server_id)
+    
+    async def _make_room(self, server_id: str, admission: dict) -> dict:
+        """유휴 서버를 오래 비어 있던 순으로 중지해서 메모리 확보 후 다시 승인 요청"""
+        shortfall = admission['committed'] + admission['needed']['total'] - admission['budget']
+        
+        for idle in admission['idle']:
+            if shortfall <= 0:
+                break
+            print(f"   💤 유휴 서버 중지: {idle['server_id']} ({idle['idle_minutes']:.0f}분, {idle['frees_mb']:.0f}MB 확보)")
+            success, _ = await self.stop_server(idle['server_id'])
+            if success:
+                shortfall -= idle['frees_mb']
+        
+        return await self.admission.admit(server_id)
     
     async def _start_background(self, server_id: str, command: str, cwd: Path) -> Tuple[bool, str]:
         """백그라운드 모드로 서버 시작"""
@@ -328,6 +475,8 @@ class ServerManager:
             
             # Lock 획득
             async with self.server_locks[server_id]:
+                # 종료 중인 서버의 메모리를 기다리는 시작 요청이 있을 수 있음
+                self.stopping_servers.add(server_id)
                 print(f"\n🛑 서버 중지 시도: {server_id}")
                 print(f"   running_servers: {list(self.running_servers.keys())}")
                 print(f"   is_process_running: {self.is_process_running(server_id)}")
@@ -416,6 +565,10 @@ class ServerManager:
             import traceback
             traceback.print_exc()
             return False, f"오류 발생: {e}"
+        finally:
+            self.stopping_servers.discard(server_id)
+            if server_id not in self.running_servers:
+                self.started_at.pop(server_id, None)
     
     async def restart_server(self, server_id: str) -> Tuple[bool, str]:
         """서버 재시작"""
@@ -521,17 +674,38 @@ class ServerManager:
             return {"online": False, "error": str(e)}
     
     async def get_server_performance(self, server_id: str) -> Optional[dict]:
-        """서버 성능 정보"""
+        """서버 성능 정보 (최근 ResourceSampler 기록, 없으면 스레드에서 직접 측정)"""
         try:
-            if not self.is_server_running(server_id):
+            if not await asyncio.to_thread(self.is_server_running, server_id):
                 return None
             
-            obj = self.running_servers[server_id]
+            sample = self.sampler.latest(server_id)
+            if sample and time.time() - sample['time'] < 90:
+                started_at = self.started_at.get(server_id) or sample['time']
+                return {
+                    "cpu_percent": sample['cpu_percent'],
+                    "memory_mb": sample['rss_mb'],
+                    "memory_percent": sample['rss_mb'] * 1024 * 1024 / psutil.virtual_memory().total * 100,
+                    "threads": sample['threads'],
+                    "uptime_seconds": time.time() - started_at
+                }
             
-            # Popen 프로세스만 성능 측정 가능
-            if isinstance(obj, subprocess.Popen):
+            return await asyncio.to_thread(self._measure_performance, server_id)
+        except Exception as e:
+            print(f"⚠️ 성능 정보 조회 실패: {e}")
+            return None
+    
+    def _measure_performance(self, server_id: str) -> Optional[dict]:
+        """JVM 프로세스 직접 측정 (블로킹 - CPU 측정에 1초)"""
+        try:
+            obj = self.running_servers.get(server_id)
+            
+            # Screen/셸 아래의 JVM 프로세스 (못 찾으면 Popen 프로세스)
+            ps_process = self.find_java_process(server_id)
+            if ps_process is None and isinstance(obj, subprocess.Popen):
                 ps_process = psutil.Process(obj.pid)
-                
+            
+            if ps_process:
                 return {
                     "cpu_percent": ps_process.cpu_percent(interval=1),
                     "memory_mb": ps_process.memory_info().rss / 1024 / 1024,
@@ -571,17 +745,14 @@ class ServerManager:
                 await rcon.save_all()
                 await asyncio.sleep(2)  # 저장 완료 대기
             
-            # 월드 폴더 압축
-            import shutil
-            await asyncio.to_thread(
-                shutil.make_archive,
+            # 월드 폴더 압축 (저우선순위 + 속도 제한, 접속자가 있으면 감속)
+            backup_file = await self.maintenance.run(
+                f"{server_id} 월드 백업",
+                self.maintenance.make_archive,
                 str(backup_path),
-                'zip',
-                str(world_path)
+                world_path
             )
-            
-            backup_file = f"{backup_path}.zip"
-            backup_size = Path(backup_file).stat().st_size / (1024 * 1024)  # MB
+            backup_size = backup_file.stat().st_size / (1024 * 1024)  # MB
             
             return True, (
                 f"{config['name']} 월드 백업 완료!\n"
@@ -597,46 +768,310 @@ class ServerManager:
         """봇 종료 시 정리"""
         print("\n🧹 서버 정리 중...")
         
+        await self.start_queue.close()
+        self.supervisor.close()
+        self.jfr.close()
+        self.lag_detector.close()
+        self.maintenance.close()
+        
         for server_id in list(self.running_servers.keys()):
             config = self.get_server_config(server_id)
             print(f"   - {config['name']} 중지 중...")
             await self.stop_server(server_id, force=False)
         
+        self.sampler.close()
         print("✅ 서버 정리 완료")
     
-    def _check_system_memory(self, config: dict) -> Tuple[bool, str]:
+    # ========================================
+    # 시작 전 예열 / 시작 시간 측정
+    # ========================================
+
+    async def _prewarm(self, server_id: str, config: dict) -> Optional[dict]:
         """
-        시스템 메모리가 충분한지 확인
-        
+        서버 jar/라이브러리/스폰 주변 region 파일을 페이지 캐시에 미리 올림
+
+        bot_config.json의 "prewarm": {"enabled": bool, "budget_mb": int}로 서버별 설정
+        """
+        prewarm = config.get('prewarm') or {}
+        if not prewarm.get('enabled', False):
+            return None
+
+        budget_bytes = int(prewarm.get('budget_mb', 512)) * 1024 * 1024
+        try:
+            result = await asyncio.to_thread(
+                self.prewarmer.run,
+                Path(config['path']),
+                config.get('jar_file'),
+                budget_bytes
+            )
+        except Exception as e:
+            print(f"⚠️ [{server_id}] 예열 실패 (무시하고 시작): {e}")
+            return None
+
+        print(
+            f"   🔥 예열: 파일 {result['files']}개 (region {result['regions']}개), "
+            f"{result['bytes'] / 1024 / 1024:.0f}MB, {result['seconds']:.1f}초 ({result['method']})"
+        )
+        return result
+
+    def _apply_cds(self, server_id: str, config: dict, start_command: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        CDS 아카이브 옵션을 시작 명령어에 추가 (블로킹)
+
         Returns:
-            (충분한지, 메시지)
+            (시작 명령어, CDS 모드 'use' | 'train' | None, 아카이브 키)
         """
+        if start_command.startswith('"'):
+            # 공백이 있는 java 경로
+            end = start_command.index('"', 1) + 1
+            java, rest = start_command[:end], start_command[end:].lstrip()
+        else:
+            java, _, rest = start_command.partition(' ')
+        
+        runtime = config.get('java_runtime')
+        java_version = runtime['version'] if runtime else detect_java_version(java.strip('"'))
         try:
-            import psutil
-            
-            memory_config = config.get('memory', {})
-            required_mb = memory_config.get('max', 4096)
-            
-            # 시스템 가용 메모리 확인
-            mem = psutil.virtual_memory()
-            available_mb = mem.available / (1024 * 1024)
-            
-            # 필요한 메모리 + 1GB 여유분
-            required_with_buffer = required_mb + 1024
-            
-            if available_mb < required_with_buffer:
-                return False, (
-                    f"❌ 시스템 메모리 부족!\n"
-                    f"필요: {required_with_buffer:.0f}MB\n"
-                    f"사용 가능: {available_mb:.0f}MB\n"
-                    f"💡 다른 프로그램을 종료하거나 서버 메모리 설정을 낮춰주세요."
+            mode, option, key = self.cds.prepare(server_id, config, java_version)
+        except Exception as e:
+            print(f"⚠️ [{server_id}] CDS 준비 실패 (무시하고 시작): {e}")
+            return start_command, None, None
+
+        if not option:
+            return start_command, None, key
+
+        print(f"   📦 CDS: {'아카이브 사용' if mode == 'use' else '학습 실행 (종료 시 아카이브 생성)'}")
+        return f"{java} {option} {rest}", mode, key
+
+    @staticmethod
+    def _port_open(port: int) -> bool:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(0.3)
+        try:
+            return sock.connect_ex(('localhost', port)) == 0
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+    def _track_startup(self, server_id: str, config: dict, started: float, launch_info: dict):
+        """
+        포트가 열릴 때까지의 시간을 백그라운드에서 측정
+
+        Args:
+            launch_info: {'prewarm': 예열 결과, 'cds': CDS 모드, 'cds_key': 아카이브 키}
+        """
+        previous = self.startup_tasks.get(server_id)
+        if previous and not previous.done():
+            previous.cancel()
+        self.startup_tasks[server_id] = asyncio.create_task(
+            self._wait_startup(server_id, config, started, launch_info)
+        )
+
+    async def _wait_startup(self, server_id: str, config: dict, started: float, launch_info: dict):
+        # cgroupfs 모드는 JVM이 뜬 뒤 서버 cgroup으로 이동
+        attached, message = await self.cgroups.attach(server_id, config, self.find_java_process)
+        if not attached:
+            print(f"⚠️ [{server_id}] cgroup 적용 실패: {message}")
+        
+        timeout = 300
+        while time.monotonic() - started < timeout:
+            if not self.is_process_running(server_id):
+                return
+            if await asyncio.to_thread(self._port_open, config['port']):
+                break
+            await asyncio.sleep(1)
+        else:
+            print(f"⚠️ [{server_id}] 시작 시간 측정 중단 ({timeout}초 초과)")
+            return
+
+        elapsed = time.monotonic() - started
+        prewarm_result = launch_info.get('prewarm')
+        record = {
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(elapsed, 2),
+            'prewarm': prewarm_result is not None,
+            'prewarm_seconds': round(prewarm_result['seconds'], 2) if prewarm_result else 0,
+            'prewarm_bytes': prewarm_result['bytes'] if prewarm_result else 0,
+            'cds': launch_info.get('cds'),
+            'cds_key': launch_info.get('cds_key')
+        }
+
+        # 포트는 월드 로딩 전에 열리므로 Done 줄까지 더 기다림
+        log_file = Path(config['path']) / 'logs' / 'latest.log'
+        launched_at = time.time() - elapsed
+        analyzer = self.startup_analyzer
+        while time.monotonic() - started < timeout * 2 and self.is_process_running(server_id):
+            if await asyncio.to_thread(analyzer.find_done, log_file, launched_at):
+                record['done_seconds'] = round(time.monotonic() - started, 2)
+                parsed = await asyncio.to_thread(
+                    analyzer.parse, log_file, config.get('core_type') in ('forge', 'fabric')
                 )
-            
-            return True, "OK"
-            
-        except ImportError:
-            # psutil 없으면 체크 건너뛰기
-            return True, "OK"
+                record['jvm_done_seconds'] = parsed['jvm_done_seconds']
+                record['components'] = parsed['components']
+                break
+            await asyncio.sleep(2)
+
+        record['changes'] = await asyncio.to_thread(analyzer.take_changes, server_id)
+        history = (await asyncio.to_thread(self._load_startup_stats)).get(server_id, [])
+        regression = analyzer.find_regression(history, record)
+        await asyncio.to_thread(self._save_startup_record, server_id, record)
+
+        if record.get('done_seconds'):
+            print(
+                f"🏁 [{config['name']}] Done까지 {record['done_seconds']:.1f}초 "
+                f"(서버 보고 {record['jvm_done_seconds']:.1f}초)"
+            )
+        if regression:
+            grown = ", ".join(
+                f"{analyzer.component_label(name)} +{seconds:.0f}초" for name, seconds in regression['grown'][:3]
+            )
+            print(
+                f"🐢 [{config['name']}] 시작 시간 회귀: {regression['baseline']:.1f}초 → {regression['seconds']:.1f}초 "
+                f"(+{regression['increase_percent']:.0f}%) {grown}"
+            )
+            if analyzer.notify:
+                try:
+                    await analyzer.notify(server_id, regression)
+                except Exception as e:
+                    print(f"⚠️ 시작 시간 회귀 알림 실패: {e}")
+
+        summary = self.get_startup_summary(server_id)
+        print(f"⏱️ [{config['name']}] 접속 가능까지 {elapsed:.1f}초 (예열 {'사용' if record['prewarm'] else '미사용'})")
+        if summary['with_prewarm'] and summary['without_prewarm']:
+            print(
+                f"   평균: 예열 사용 {summary['with_prewarm']['avg']:.1f}초 ({summary['with_prewarm']['count']}회) / "
+                f"미사용 {summary['without_prewarm']['avg']:.1f}초 ({summary['without_prewarm']['count']}회)"
+            )
+        cds = self.get_cds_summary().get(record['cds_key']) if record['cds_key'] else None
+        if cds and cds['with'] and cds['without']:
+            print(
+                f"   CDS: 사용 {cds['with']['avg']:.1f}초 ({cds['with']['count']}회) / "
+                f"미사용 {cds['without']['avg']:.1f}초 ({cds['without']['count']}회)"
+            )
+
+    def _load_startup_stats(self) -> dict:
+        if not self.startup_stats_file.exists():
+            return {}
+        try:
+            with open(self.startup_stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_startup_record(self, server_id: str, record: dict, keep: int = 50):
+        stats = self._load_startup_stats()
+        history = stats.setdefault(server_id, [])
+        history.append(record)
+        stats[server_id] = history[-keep:]
+        try:
+            with open(self.startup_stats_file, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            print(f"⚠️ 메모리 체크 오류: {e}")
-            return True, "OK"  # 오류 시에는 통과
\ No newline at end of file
+            print(f"⚠️ 시작 시간 기록 저장 실패: {e}")
+
+    @staticmethod
+    def _summarize_startups(records: list) -> Optional[dict]:
+        if not records:
+            return None
+        return {'count': len(records), 'avg': sum(r['seconds'] for r in records) / len(records)}
+
+    def get_startup_summary(self, server_id: str) -> dict:
+        """
+        예열 사용/미사용 시작 시간 비교
+
+        Returns:
+            {'with_prewarm': {'count', 'avg'} | None, 'without_prewarm': {...} | None, 'last': dict | None}
+        """
+        history = self._load_startup_stats().get(server_id, [])
+        summarize = self._summarize_startups
+
+        return {
+            'with_prewarm': summarize([r for r in history if r.get('prewarm')]),
+            'without_prewarm': summarize([r for r in history if not r.get('prewarm')]),
+            'last': history[-1] if history else None
+        }
+
+    def get_cds_summary(self) -> dict:
+        """
+        구동기(아카이브 키)별 CDS 사용/미사용 시작 시간 비교 (모든 서버 합산)
+
+        학습 실행은 아카이브 없이 시작하므로 미사용으로 집계합니다.
+
+        Returns:
+            {cds_key: {'with': {'count', 'avg'} | None, 'without': {...} | None}}
+        """
+        by_key = {}
+        for history in self._load_startup_stats().values():
+            for record in history:
+                if record.get('cds_key'):
+                    by_key.setdefault(record['cds_key'], []).append(record)
+
+        return {
+            key: {
+                'with': self._summarize_startups([r for r in records if r.get('cds') == 'use']),
+                'without': self._summarize_startups([r for r in records if r.get('cds') != 'use'])
+            }
+            for key, records in by_key.items()
+        }
+
+    # ========================================
+    # 메모리 분석 (GC 로그)
+    # ========================================
+
+    async def analyze_memory(self, server_id: str) -> Tuple[Optional[dict], Optional[dict]]:
+        """
+        GC 로그 분석 + 힙 크기 추천
+
+        Returns:
+            (분석 결과, 추천 {'min', 'max', 'reasons', 'changed'}) - 로그가 없으면 (None, None)
+        """
+        config = self.get_server_config(server_id)
+        if not config:
+            return None, None
+
+        stats = await asyncio.to_thread(self.gc_analyzer.analyze, server_id, Path(config['path']))
+        if not stats:
+            return None, None
+
+        recommendation = GcLogAnalyzer.recommend(
+            stats,
+            config.get('memory', {}),
+            jvm_profile=config.get('jvm_profile'),
+            host_total_mb=psutil.virtual_memory().total / 1024 / 1024
+        )
+        return stats, recommendation
+
+    def apply_memory_settings(self, server_id: str, min_mb: int, max_mb: int) -> Tuple[bool, str]:
+        """
+        bot_config.json의 memory 변경 + 시작 명령어 갱신 (다음 시작부터 적용)
+        """
+        config = self.get_server_config(server_id)
+        if not config:
+            return False, f"서버 설정을 찾을 수 없습니다: {server_id}"
+
+        config_file = Path(config['path']) / 'bot_config.json'
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                bot_config = json.load(f)
+            bot_config.setdefault('memory', {})
+            bot_config['memory']['min'] = min_mb
+            bot_config['memory']['max'] = max_mb
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(bot_config, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            return False, f"bot_config.json 저장 실패: {e}"
+
+        config['memory'] = {'min': min_mb, 'max': max_mb}
+
+        # 힙 고정 프로필(aikar-g1/zgc 등)은 -Xms == -Xmx
+        xms = max_mb if pins_heap(config.get('jvm_profile')) else min_mb
+        if config.get('start_command'):
+            command = re.sub(r'-Xms\d+[MmGg]', f'-Xms{xms}M', config['start_command'])
+            config['start_command'] = re.sub(r'-Xmx\d+[MmGg]', f'-Xmx{max_mb}M', command)
+        if config.get('jvm_args'):
+            config['jvm_args'] = [
+                f'-Xms{xms}M' if arg.startswith('-Xms') else f'-Xmx{max_mb}M' if arg.startswith('-Xmx') else arg
+                for arg in config['jvm_args']
+            ]
+
+        return True, f"메모리 설정 변경: {min_mb}MB ~ {max_mb}MB (다음 시작부터 적용)"
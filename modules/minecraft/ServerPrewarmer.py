@@ -0,0 +1,244 @@
+"""
+서버 시작 전 페이지 캐시 예열 (pre-warm)
+경로: modules/minecraft/ServerPrewarmer.py
+
+GCP 인스턴스 부팅 직후나 오랜 유휴 후에는 영구 디스크가 차가워서
+jar/라이브러리/월드 region 파일 읽기가 시작 시간과 첫 접속 청크 로딩을 늦춥니다.
+시작 직전에 아래 순서로 바이트 예산 안에서 미리 읽어 둡니다.
+
+1. 서버 jar, libraries/ (Paper/Forge), plugins/, mods/
+2. 스폰 지점과 최근 접속 플레이어 위치에 가까운 region 파일 (world/region/r.X.Z.mca)
+
+읽기는 posix_fadvise(WILLNEED)로 커널에 미리 읽기를 요청하고,
+지원하지 않는 환경에서는 워커 스레드에서 직접 읽습니다.
+"""
+
+import gzip
+import os
+import re
+import struct
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+def _read_nbt(path: Path) -> Optional[dict]:
+    """gzip NBT 파일(level.dat, playerdata/*.dat) 읽기 - 필요한 값만 쓰는 최소 구현"""
+    try:
+        with gzip.open(path, 'rb') as f:
+            data = f.read()
+    except Exception:
+        return None
+
+    pos = 0
+
+    def read(fmt):
+        nonlocal pos
+        value = struct.unpack_from('>' + fmt, data, pos)
+        pos += struct.calcsize('>' + fmt)
+        return value[0]
+
+    def read_string():
+        nonlocal pos
+        length = read('H')
+        value = data[pos:pos + length].decode('utf-8', errors='replace')
+        pos += length
+        return value
+
+    def read_payload(tag):
+        nonlocal pos
+        if tag == 1:
+            return read('b')
+        if tag == 2:
+            return read('h')
+        if tag == 3:
+            return read('i')
+        if tag == 4:
+            return read('q')
+        if tag == 5:
+            return read('f')
+        if tag == 6:
+            return read('d')
+        if tag == 7:
+            length = read('i')
+            pos += length
+            return None
+        if tag == 8:
+            return read_string()
+        if tag == 9:
+            item_tag = read('b')
+            length = read('i')
+            return [read_payload(item_tag) for _ in range(length)]
+        if tag == 10:
+            compound = {}
+            while True:
+                child = read('b')
+                if child == 0:
+                    return compound
+                name = read_string()
+                compound[name] = read_payload(child)
+        if tag == 11:
+            length = read('i')
+            pos += 4 * length
+            return None
+        if tag == 12:
+            length = read('i')
+            pos += 8 * length
+            return None
+        raise ValueError(f"알 수 없는 NBT 태그: {tag}")
+
+    try:
+        if read('b') != 10:
+            return None
+        read_string()
+        return read_payload(10)
+    except Exception:
+        return None
+
+
+class ServerPrewarmer:
+    """시작 전 예열 대상 선정 + 읽기"""
+
+    REGION_RADIUS = 2  # 관심 지점에서 region 단위 반경 (1 region = 512블록)
+    RECENT_PLAYERS = 10  # 위치를 참고할 최근 접속 플레이어 수
+    READ_CHUNK = 1024 * 1024
+
+    @staticmethod
+    def _level_name(server_path: Path) -> str:
+        properties = server_path / 'server.properties'
+        if properties.exists():
+            try:
+                with open(properties, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.startswith('level-name='):
+                            return line.split('=', 1)[1].strip() or 'world'
+            except Exception:
+                pass
+        return 'world'
+
+    def _points_of_interest(self, world: Path) -> List[Tuple[int, int]]:
+        """스폰 + 최근 플레이어 위치 (region 좌표)"""
+        points = []
+
+        level = _read_nbt(world / 'level.dat')
+        if level and isinstance(level.get('Data'), dict):
+            data = level['Data']
+            points.append((data.get('SpawnX', 0) // 512, data.get('SpawnZ', 0) // 512))
+        else:
+            points.append((0, 0))
+
+        playerdata = world / 'playerdata'
+        if playerdata.exists():
+            recent = sorted(playerdata.glob('*.dat'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for player_file in recent[:self.RECENT_PLAYERS]:
+                player = _read_nbt(player_file)
+                if not player:
+                    continue
+                dimension = player.get('Dimension', 'minecraft:overworld')
+                if dimension not in ('minecraft:overworld', 0):
+                    continue
+                position = player.get('Pos')
+                if isinstance(position, list) and len(position) == 3:
+                    points.append((int(position[0]) // 512, int(position[2]) // 512))
+
+        return points
+
+    def _region_files(self, world: Path) -> List[Path]:
+        """관심 지점에서 가까운 순서의 region 파일"""
+        region_dir = world / 'region'
+        if not region_dir.exists():
+            return []
+
+        points = self._points_of_interest(world)
+        candidates = []
+
+        for region in region_dir.glob('r.*.*.mca'):
+            match = re.match(r'r\.(-?\d+)\.(-?\d+)\.mca$', region.name)
+            if not match:
+                continue
+            rx, rz = int(match.group(1)), int(match.group(2))
+            distance = min(max(abs(rx - px), abs(rz - pz)) for px, pz in points)
+            if distance <= self.REGION_RADIUS:
+                candidates.append((distance, region))
+
+        candidates.sort(key=lambda c: c[0])
+        return [region for _, region in candidates]
+
+    def plan(self, server_path: Path, jar_file: Optional[str]) -> List[Path]:
+        """예열 대상 (우선순위 순)"""
+        files = []
+
+        if jar_file and (server_path / jar_file).exists():
+            files.append(server_path / jar_file)
+
+        for sub in ('libraries', 'cache', 'versions'):
+            sub_dir = server_path / sub
+            if sub_dir.exists():
+                files.extend(sorted(sub_dir.rglob('*.jar')))
+
+        for sub in ('plugins', 'mods'):
+            sub_dir = server_path / sub
+            if sub_dir.exists():
+                files.extend(sorted(sub_dir.glob('*.jar')))
+
+        world = server_path / self._level_name(server_path)
+        if (world / 'level.dat').exists():
+            files.append(world / 'level.dat')
+        files.extend(self._region_files(world))
+
+        return files
+
+    def _warm_file(self, path: Path, limit: int) -> int:
+        """파일 앞부분 limit 바이트 예열, 처리한 바이트 반환"""
+        size = min(path.stat().st_size, limit)
+        if size <= 0:
+            return 0
+
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            else:
+                remaining = size
+                while remaining > 0:
+                    chunk = os.read(fd, min(self.READ_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+        finally:
+            os.close(fd)
+
+        return size
+
+    def run(self, server_path: Path, jar_file: Optional[str], budget_bytes: int) -> dict:
+        """
+        예열 실행 (블로킹 - asyncio.to_thread로 호출)
+
+        Returns:
+            {'files', 'bytes', 'regions', 'seconds', 'method'}
+        """
+        started = time.monotonic()
+        files = self.plan(server_path, jar_file)
+
+        warmed = 0
+        count = 0
+        regions = 0
+        for path in files:
+            remaining = budget_bytes - warmed
+            if remaining <= 0:
+                break
+            try:
+                warmed += self._warm_file(path, remaining)
+            except OSError:
+                continue
+            count += 1
+            if path.suffix == '.mca':
+                regions += 1
+
+        return {
+            'files': count,
+            'bytes': warmed,
+            'regions': regions,
+            'seconds': time.monotonic() - started,
+            'method': 'fadvise' if hasattr(os, 'posix_fadvise') else 'read'
+        }
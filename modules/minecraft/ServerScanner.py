@@ -4,19 +4,30 @@ servers/ 폴더에서 마인크래프트 서버 자동 스캔
 """
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from .ServerConfigurator import ServerConfigurator
 from .PortManager import PortManager
+from .JvmProfiles import render_jvm_args, detect_java_version
+from .JavaRuntimeManager import JavaRuntimeManager
+from .CoreCatalog import required_java
 
 
 class ServerScanner:
     """서버 폴더 자동 스캔 및 설정"""
     
-    def __init__(self, servers_dir: Path, configurator: ServerConfigurator):
+    def __init__(self, servers_dir: Path, configurator: ServerConfigurator,
+                 java_runtimes: Optional[JavaRuntimeManager] = None):
         self.servers_dir = servers_dir
         self.configurator = configurator
         self.servers_dir.mkdir(parents=True, exist_ok=True)
         
+        # Java 런타임 (없으면 PATH의 java 사용)
+        self.java_runtimes = java_runtimes
+        if self.java_runtimes:
+            self.java_runtimes.scan()
+            print(f"☕ Java 런타임 {len(self.java_runtimes.runtimes)}개 발견")
+            print(self.java_runtimes.get_summary_text())
+        
         # 포트 관리자 초기화
         self.port_manager = PortManager()
         
@@ -42,6 +53,72 @@ class ServerScanner:
         
         return "\n".join(lines)
     
+    def build_start_command(self, server_path: Path, server_config: dict) -> str:
+        """
+        시작 명령어 생성 (bot_config.json의 jvm_profile 적용)
+        
+        렌더링된 JVM 인자는 server_config['jvm_args']에 저장 (/서버상태 표시용)
+        """
+        java = 'java'
+        java_version = None
+        
+        runtime = self.select_runtime(server_config)
+        if runtime:
+            java = runtime['path']
+            java_version = runtime['version']
+            server_config['java_runtime'] = runtime
+        
+        profile = server_config.get('jvm_profile')
+        if java_version is None:
+            java_version = detect_java_version(java)
+        
+        jvm_args = render_jvm_args(
+            profile,
+            server_config['memory']['min'],
+            server_config['memory']['max'],
+            core_type=server_config.get('core_type'),
+            java_version=java_version
+        )
+        server_config['jvm_args'] = jvm_args
+        
+        # GC 로그 폴더 (JVM은 없는 폴더에 로그 파일을 만들지 못함)
+        (server_path / 'logs').mkdir(exist_ok=True)
+        
+        if server_config.get('launch_args'):
+            # Forge 1.17+: @libraries/.../unix_args.txt
+            launch = ' '.join(server_config['launch_args'])
+        else:
+            launch = f"-jar {server_config['jar_file']}"
+        
+        if ' ' in java:
+            java = f'"{java}"'
+        
+        return f"{java} {' '.join(jvm_args)} {launch} nogui"
+    
+    def select_runtime(self, server_config: dict) -> Optional[dict]:
+        """
+        서버에 맞는 Java 런타임 (bot_config.json의 "java" 지정 > 구동기 최소 버전)
+        
+        버전 정보가 없는 서버는 None (PATH의 java 사용)
+        """
+        if not self.java_runtimes:
+            return None
+        
+        override = server_config.get('java_override')
+        min_java = server_config.get('min_java')
+        if not min_java and server_config.get('version'):
+            min_java = required_java(server_config['version'])
+        
+        if override is None and not min_java:
+            return None
+        
+        runtime = self.java_runtimes.select(min_java or 8, override, server_config.get('core_type'))
+        if runtime:
+            print(f"   ☕ Java {runtime['version']} ({runtime['vendor']}): {runtime['path']}")
+        else:
+            print(f"   ⚠️ Java {min_java} 이상 런타임 없음 - PATH의 java 사용")
+        return runtime
+    
     def scan_all_servers(self) -> Dict[str, dict]:
         """
         servers/ 폴더의 모든 하위 폴더를 스캔하여 서버 목록 생성
@@ -129,14 +206,7 @@ class ServerScanner:
             server_config['id'] = server_id
             
             # 시작 명령어 생성
-            jar_file = server_config['jar_file']
-            min_mem = server_config['memory']['min']
-            max_mem = server_config['memory']['max']
-            
-            server_config['start_command'] = (
-                f"java -Xms{min_mem}M -Xmx{max_mem}M "
-                f"-jar {jar_file} nogui"
-            )
+            server_config['start_command'] = self.build_start_command(folder, server_config)
             
             servers[server_id] = server_config
             
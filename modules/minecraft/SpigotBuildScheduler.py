@@ -0,0 +1,362 @@
+"""
+Spigot BuildTools 빌드 스케줄러
+경로: modules/minecraft/SpigotBuildScheduler.py
+
+- 동시 빌드 수 제한 (슬롯별 작업 폴더를 버전 간에 재사용 → git/BuildData 캐시 공유)
+- 하나의 BuildTools.jar + 공용 Maven 저장소
+- 낮은 CPU/IO 우선순위 (nice 19, ionice idle)
+- 완료 판정은 프로세스 종료 코드로 (screen 폴링 없음)
+- 빌드별 소요 시간 / 최대 RSS 기록
+- 플레이어 접속 중이거나 메모리/IO 압박(PSI)이 계속되면 빌드 일시정지 (SIGSTOP/SIGCONT)
+"""
+
+import asyncio
+import json
+import os
+import platform
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Callable, Awaitable
+
+import psutil
+
+from .CoreCatalog import required_java
+from .DownloadQueue import DownloadQueue
+
+
+class SpigotBuildScheduler:
+    """BuildTools 실행 관리"""
+
+    BUILDTOOLS_URL = 'https://hub.spigotmc.org/jenkins/job/BuildTools/lastSuccessfulBuild/artifact/target/BuildTools.jar'
+    BUILDTOOLS_MAX_AGE = 24 * 3600  # BuildTools.jar 재다운로드 주기 (초)
+    SAMPLE_INTERVAL = 5  # RSS 측정 간격 (초)
+    PLAYER_CHECK_INTERVAL = 30  # 플레이어 접속 확인 간격 (초)
+
+    def __init__(self, spigot_dir: Path, download_queue: DownloadQueue, max_concurrent: int = 1):
+        """
+        Args:
+            spigot_dir: 구동기 폴더 (server_cores/spigot)
+            download_queue: BuildTools.jar 다운로드에 사용할 큐
+            max_concurrent: 동시 빌드 수
+        """
+        self.spigot_dir = spigot_dir
+        self.download_queue = download_queue
+        self.max_concurrent = max_concurrent
+
+        # 공용 캐시
+        self.cache_dir = spigot_dir / '.buildtools'
+        self.buildtools_jar = self.cache_dir / 'BuildTools.jar'
+        self.maven_repo = self.cache_dir / 'm2'
+
+        # 접속 중인 플레이어 수 조회 (None이면 일시정지 안 함)
+        self.players_online: Optional[Callable[[], Awaitable[int]]] = None
+
+        # PSI 감시 (PressureMonitor, None이면 확인 안 함)
+        self.pressure = None
+
+        # Java 런타임 선택 (JavaRuntimeManager, None이면 PATH의 java)
+        self.java_runtimes = None
+
+        # {version: {'state', 'queued_at', 'started_at', 'duration', 'peak_rss', 'paused_seconds', 'pause_reason', 'returncode'}}
+        self.builds: Dict[str, dict] = {}
+
+        self._slots: Optional[asyncio.Queue] = None
+        self._buildtools_lock = asyncio.Lock()
+        self._processes: Dict[str, psutil.Process] = {}
+        self._hold = False  # 플레이어 접속/자원 압박으로 일시정지 중
+        self._hold_reason = ''
+        self._pause_enabled = True
+
+    # ========================================
+    # 준비
+    # ========================================
+
+    def _get_slots(self) -> asyncio.Queue:
+        """작업 폴더 슬롯 (동시 빌드 수만큼)"""
+        if self._slots is None:
+            self._slots = asyncio.Queue()
+            for i in range(max(1, self.max_concurrent)):
+                self._slots.put_nowait(self.cache_dir / f'work-{i}')
+        return self._slots
+
+    async def _ensure_buildtools(self):
+        """공용 BuildTools.jar 준비 (하루 지난 경우 갱신)"""
+        async with self._buildtools_lock:
+            if self.buildtools_jar.exists():
+                age = time.time() - self.buildtools_jar.stat().st_mtime
+                if age < self.BUILDTOOLS_MAX_AGE:
+                    return
+
+            try:
+                await self.download_queue.submit(self.BUILDTOOLS_URL, self.buildtools_jar, label="BuildTools")
+            except Exception:
+                # 기존 jar가 있으면 그대로 사용
+                if not self.buildtools_jar.exists():
+                    raise
+
+    async def _java(self, version: str) -> str:
+        """BuildTools를 실행할 java (1.20.5+는 21, 1.18+는 17 ...)"""
+        if self.java_runtimes is None:
+            return 'java'
+        if not self.java_runtimes.runtimes:
+            await asyncio.to_thread(self.java_runtimes.scan)
+
+        min_java = required_java(version)
+        runtime = self.java_runtimes.select(min_java, core_type='spigot')
+        if not runtime:
+            print(f"[Spigot {version}] ⚠️ Java {min_java} 이상 런타임 없음 - PATH의 java 사용")
+            return 'java'
+        return runtime['path']
+
+    def _build_command(self, version: str, output_dir: Path, java: str = 'java') -> list:
+        command = [
+            java, '-jar', str(self.buildtools_jar),
+            '--rev', version,
+            '--output-dir', str(output_dir)
+        ]
+
+        # 게임 서버보다 낮은 우선순위
+        if platform.system() == "Linux":
+            if shutil.which('ionice'):
+                command = ['ionice', '-c', '3'] + command
+            if shutil.which('nice'):
+                command = ['nice', '-n', '19'] + command
+
+        return command
+
+    # ========================================
+    # 빌드
+    # ========================================
+
+    async def build(self, version: str) -> bool:
+        """
+        Spigot 빌드 (슬롯이 빌 때까지 대기)
+
+        Returns:
+            성공 여부 (server.jar 생성)
+        """
+        info = self.builds[version] = {
+            'state': 'queued',
+            'queued_at': datetime.now().isoformat(),
+            'started_at': None,
+            'duration': None,
+            'peak_rss': 0,
+            'paused_seconds': 0.0,
+            'pause_reason': None,
+            'returncode': None
+        }
+
+        version_dir = self.spigot_dir / version
+        version_dir.mkdir(parents=True, exist_ok=True)
+        build_state_file = version_dir / '.building'
+
+        slots = self._get_slots()
+        work_dir = await slots.get()
+
+        try:
+            await self._ensure_buildtools()
+
+            work_dir.mkdir(parents=True, exist_ok=True)
+            self.maven_repo.mkdir(parents=True, exist_ok=True)
+
+            env = os.environ.copy()
+            env['MAVEN_OPTS'] = (env.get('MAVEN_OPTS', '') + f' -Dmaven.repo.local={self.maven_repo}').strip()
+
+            info['state'] = 'running'
+            info['started_at'] = datetime.now().isoformat()
+            self._write_state(build_state_file, version, info)
+
+            log_file = version_dir / 'build.log'
+            print(f"[Spigot {version}] 빌드 시작 (작업 폴더: {work_dir.name}, 로그: {log_file})")
+
+            started = time.monotonic()
+            with open(log_file, 'wb') as log:
+                process = await asyncio.create_subprocess_exec(
+                    *self._build_command(version, version_dir, await self._java(version)),
+                    cwd=str(work_dir),
+                    env=env,
+                    stdout=log,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+                await self._supervise(version, process, info)
+
+            info['duration'] = time.monotonic() - started
+            info['returncode'] = process.returncode
+
+            success = process.returncode == 0 and self._install_jar(version, version_dir)
+            info['state'] = 'success' if success else 'failed'
+            self._write_state(build_state_file, version, info)
+
+            icon = '✅' if success else '❌'
+            print(
+                f"[Spigot {version}] {icon} 빌드 {'완료' if success else '실패'} "
+                f"(종료 코드 {process.returncode}, {info['duration'] / 60:.1f}분, "
+                f"최대 RSS {info['peak_rss'] / 1048576:.0f}MB, 일시정지 {info['paused_seconds'] / 60:.1f}분)"
+            )
+            return success
+
+        except asyncio.CancelledError:
+            info['state'] = 'failed'
+            raise
+        except Exception as e:
+            info['state'] = 'failed'
+            print(f"[Spigot {version}] ❌ 빌드 오류: {e}")
+            self._write_state(build_state_file, version, info, error=str(e))
+            return False
+        finally:
+            self._processes.pop(version, None)
+            slots.put_nowait(work_dir)
+
+    async def _supervise(self, version: str, process: asyncio.subprocess.Process, info: dict):
+        """프로세스 종료까지 RSS 측정 + 플레이어 접속 시 일시정지"""
+        try:
+            proc = psutil.Process(process.pid)
+        except psutil.Error:
+            proc = None
+        if proc:
+            self._processes[version] = proc
+
+        paused_since = None
+        last_player_check = 0.0
+
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=self.SAMPLE_INTERVAL)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+
+                if proc is None:
+                    continue
+
+                if paused_since is None:
+                    info['peak_rss'] = max(info['peak_rss'], self._tree_rss(proc))
+
+                now = time.monotonic()
+                if now - last_player_check >= self.PLAYER_CHECK_INTERVAL:
+                    last_player_check = now
+                    await self._update_hold()
+
+                if self._hold and paused_since is None:
+                    self._signal_tree(proc, suspend=True)
+                    paused_since = now
+                    info['state'] = 'paused'
+                    info['pause_reason'] = self._hold_reason
+                    print(f"[Spigot {version}] ⏸️ {self._hold_reason} - 빌드 일시정지")
+                elif not self._hold and paused_since is not None:
+                    self._signal_tree(proc, suspend=False)
+                    info['paused_seconds'] += now - paused_since
+                    paused_since = None
+                    info['state'] = 'running'
+                    info['pause_reason'] = None
+                    print(f"[Spigot {version}] ▶️ 빌드 재개")
+        except asyncio.CancelledError:
+            if proc:
+                self._signal_tree(proc, suspend=False)
+                self._terminate_tree(proc)
+            raise
+
+    async def _update_hold(self):
+        self._hold = False
+        if not self._pause_enabled:
+            return
+
+        if self.pressure is not None and self.pressure.under_pressure('memory', 'io'):
+            self._hold = True
+            self._hold_reason = f"{self.pressure.describe('memory', 'io')} 압박"
+            return
+
+        if self.players_online is None:
+            return
+        try:
+            self._hold = await self.players_online() > 0
+            self._hold_reason = "플레이어 접속 중"
+        except Exception:
+            self._hold = False
+
+    @staticmethod
+    def _tree_rss(proc: psutil.Process) -> int:
+        """프로세스 트리 전체 RSS (BuildTools가 띄운 git/maven 포함)"""
+        total = 0
+        try:
+            for p in [proc] + proc.children(recursive=True):
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            pass
+        return total
+
+    @staticmethod
+    def _signal_tree(proc: psutil.Process, suspend: bool):
+        try:
+            procs = [proc] + proc.children(recursive=True)
+        except psutil.Error:
+            return
+        for p in procs:
+            try:
+                p.suspend() if suspend else p.resume()
+            except psutil.Error:
+                pass
+
+    @staticmethod
+    def _terminate_tree(proc: psutil.Process):
+        """BuildTools와 그 자식(git/maven/javac) 모두 종료"""
+        try:
+            procs = proc.children(recursive=True) + [proc]
+        except psutil.Error:
+            procs = [proc]
+        for p in procs:
+            try:
+                p.terminate()
+            except psutil.Error:
+                pass
+
+    def release_pause(self):
+        """일시정지 해제 및 비활성화 (봇 종료 시 빌드 완료 대기용)"""
+        self._pause_enabled = False
+        self._hold = False
+        for proc in list(self._processes.values()):
+            self._signal_tree(proc, suspend=False)
+
+    # ========================================
+    # 결과 처리
+    # ========================================
+
+    @staticmethod
+    def _install_jar(version: str, version_dir: Path) -> bool:
+        """spigot-*.jar → server.jar"""
+        spigot_jars = list(version_dir.glob('spigot-*.jar'))
+        if not spigot_jars:
+            print(f"[Spigot {version}] ❌ 빌드 실패: jar 파일 없음")
+            return False
+
+        latest_jar = max(spigot_jars, key=lambda p: p.stat().st_mtime)
+        os.replace(latest_jar, version_dir / 'server.jar')
+        print(f"[Spigot {version}] {latest_jar.name} -> server.jar")
+        return True
+
+    @staticmethod
+    def _write_state(build_state_file: Path, version: str, info: dict, error: Optional[str] = None):
+        state = {'version': version, **info}
+        if info['state'] in ('success', 'failed'):
+            state['completed_at'] = datetime.now().isoformat()
+        if error:
+            state['error'] = error
+        try:
+            with open(build_state_file, 'w') as f:
+                json.dump(state, f, indent=2)
+        except Exception:
+            pass
+
+    def get_status(self) -> Dict[str, dict]:
+        """진행 중(대기/빌드/일시정지)인 빌드 정보"""
+        return {
+            version: dict(info)
+            for version, info in self.builds.items()
+            if info['state'] in ('queued', 'running', 'paused')
+        }
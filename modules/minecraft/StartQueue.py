@@ -0,0 +1,245 @@
+"""
+서버 시작 큐 (자동 시작 / 전체 시작)
+경로: modules/minecraft/StartQueue.py
+
+여러 서버를 한꺼번에 시작하면 모두 같은 순간에 월드/jar를 읽어 각각 더 느리게 부팅됩니다.
+- 우선순위 순서 (bot_config.json의 "start_priority", 낮을수록 먼저, 기본 100)
+- 동시 시작 수 제한
+- 앞 서버가 접속 가능해지거나 디스크 I/O가 잠잠해지면 다음 서버 시작
+- 작업마다 전체 서버가 접속 가능해질 때까지 걸린 시간 보고
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+
+class ServerStartQueue:
+    """우선순위 + 동시 실행 수 제한 시작 큐"""
+
+    DEFAULT_PRIORITY = 100
+    READY_TIMEOUT = 300  # 접속 가능 대기 최대 시간 (초)
+    IO_MIN_WAIT = 10  # 시작 직후 I/O 판단 전 최소 대기 (JVM이 아직 jar/월드를 읽기 전)
+    IO_QUIET_SECONDS = 5  # 이 시간 동안 연속으로 I/O가 낮으면 다음 서버 시작
+    IO_QUIET_MB_S = 5  # 낮은 I/O 기준 (읽기 + 쓰기, MB/s)
+
+    def __init__(self, server_manager, max_concurrent: int = 1):
+        """
+        Args:
+            server_manager: ServerManager
+            max_concurrent: 동시에 부팅할 서버 수
+        """
+        self.server_manager = server_manager
+        self.max_concurrent = max_concurrent
+
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._waiters: set = set()
+        self._order = itertools.count()
+
+        # 대기/시작 중인 서버 {server_id: 작업} (중복 등록 방지)
+        self.pending: Dict[str, dict] = {}
+
+    def priority(self, server_id: str) -> int:
+        config = self.server_manager.get_server_config(server_id) or {}
+        return config.get('start_priority', self.DEFAULT_PRIORITY)
+
+    def _ensure_workers(self):
+        """큐/작업자 준비 (이벤트 루프 안에서 최초 사용 시)"""
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+
+        self._workers = [w for w in self._workers if not w.done()]
+        for _ in range(max(1, self.max_concurrent) - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    # ========================================
+    # 작업 등록
+    # ========================================
+
+    def submit(self, server_ids: List[str], reason: str) -> dict:
+        """
+        서버 시작 작업 등록
+
+        Returns:
+            작업 {'reason', 'started', 'servers': {server_id: {'state', 'message', 'seconds'}},
+                  'fleet_seconds', 'done': asyncio.Event}
+            state: queued → starting → booting → ready | failed | timeout | skipped
+        """
+        self._ensure_workers()
+
+        job = {
+            'reason': reason,
+            'started': time.monotonic(),
+            'servers': {},
+            'fleet_seconds': None,
+            'done': asyncio.Event()
+        }
+
+        ordered = sorted(server_ids, key=lambda sid: (self.priority(sid), sid))
+        for server_id in ordered:
+            entry = job['servers'][server_id] = {'state': 'queued', 'message': '', 'seconds': None}
+
+            if server_id in self.pending:
+                entry.update(state='skipped', message="이미 시작 대기 중")
+            elif self.server_manager.is_process_running(server_id):
+                entry.update(state='skipped', message="이미 실행 중")
+            else:
+                self.pending[server_id] = job
+                self._queue.put_nowait((self.priority(server_id), next(self._order), server_id, job))
+
+        print(f"🚦 시작 큐 [{reason}]: {', '.join(ordered) or '없음'} (동시 {self.max_concurrent}개)")
+        self._check_done(job)
+        return job
+
+    async def wait(self, job: dict) -> dict:
+        await job['done'].wait()
+        return job
+
+    # ========================================
+    # 실행
+    # ========================================
+
+    async def _worker(self):
+        while True:
+            _, _, server_id, job = await self._queue.get()
+            try:
+                await self._start_one(server_id, job)
+            except Exception as e:
+                print(f"❌ [{server_id}] 시작 큐 오류: {e}")
+                self._finish(server_id, job, 'failed', str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _start_one(self, server_id: str, job: dict):
+        entry = job['servers'][server_id]
+        entry['state'] = 'starting'
+        started = time.monotonic()
+
+        success, message = await self.server_manager.start_server(server_id)
+        if not success:
+            self._finish(server_id, job, 'failed', message)
+            return
+
+        entry['state'] = 'booting'
+        result = await self._wait_ready(server_id, started, watch_io=True)
+
+        if result == 'io_quiet':
+            # 다음 서버에 자리를 넘기고 접속 가능 여부는 따로 확인
+            print(f"   💤 [{server_id}] 디스크 I/O 잠잠 - 다음 서버 시작")
+            waiter = asyncio.create_task(self._finish_when_ready(server_id, job, started))
+            self._waiters.add(waiter)
+            waiter.add_done_callback(self._waiters.discard)
+            return
+
+        self._finish(server_id, job, result, seconds=time.monotonic() - started)
+
+    async def _finish_when_ready(self, server_id: str, job: dict, started: float):
+        result = await self._wait_ready(server_id, started, watch_io=False)
+        self._finish(server_id, job, result, seconds=time.monotonic() - started)
+
+    async def _wait_ready(self, server_id: str, started: float, watch_io: bool) -> str:
+        """
+        접속 가능 또는 디스크 I/O가 잠잠해질 때까지 대기
+
+        Returns:
+            'ready' | 'io_quiet' | 'timeout' | 'failed' (프로세스 종료)
+        """
+        config = self.server_manager.get_server_config(server_id)
+        previous_io = await asyncio.to_thread(self._disk_bytes) if watch_io else None
+        quiet_since = None
+
+        while time.monotonic() - started < self.READY_TIMEOUT:
+            await asyncio.sleep(1)
+
+            if not self.server_manager.is_process_running(server_id):
+                return 'failed'
+            if await asyncio.to_thread(self.server_manager._port_open, config['port']):
+                return 'ready'
+
+            if previous_io is None:
+                continue
+            current_io = await asyncio.to_thread(self._disk_bytes)
+            if current_io is None:
+                previous_io = None
+                continue
+            rate_mb_s = (current_io - previous_io) / 1024 / 1024
+            previous_io = current_io
+
+            now = time.monotonic()
+            if now - started < self.IO_MIN_WAIT or rate_mb_s > self.IO_QUIET_MB_S:
+                quiet_since = None
+            elif quiet_since is None:
+                quiet_since = now
+            elif now - quiet_since >= self.IO_QUIET_SECONDS:
+                return 'io_quiet'
+
+        return 'timeout'
+
+    @staticmethod
+    def _disk_bytes() -> Optional[int]:
+        """전체 디스크 읽기 + 쓰기 누적 바이트 (컨테이너 등에서 지원하지 않으면 None)"""
+        try:
+            counters = psutil.disk_io_counters()
+        except Exception:
+            return None
+        return counters.read_bytes + counters.write_bytes if counters else None
+
+    # ========================================
+    # 완료 처리
+    # ========================================
+
+    def _finish(self, server_id: str, job: dict, state: str, message: str = '', seconds: Optional[float] = None):
+        entry = job['servers'][server_id]
+        entry.update(state=state, seconds=seconds)
+        if message:
+            entry['message'] = message
+        elif state == 'timeout':
+            entry['message'] = f"{self.READY_TIMEOUT}초 안에 포트가 열리지 않음"
+        elif state == 'failed':
+            entry['message'] = "서버 프로세스가 종료됨"
+
+        if self.pending.get(server_id) is job:
+            del self.pending[server_id]
+
+        icon = '✅' if state == 'ready' else '❌'
+        elapsed = f" ({seconds:.1f}초)" if seconds is not None else ""
+        print(f"   {icon} [{server_id}] {state}{elapsed} {entry['message']}".rstrip())
+
+        self._check_done(job)
+
+    def _check_done(self, job: dict):
+        final = ('ready', 'failed', 'timeout', 'skipped')
+        if job['done'].is_set() or any(e['state'] not in final for e in job['servers'].values()):
+            return
+
+        job['fleet_seconds'] = time.monotonic() - job['started']
+        print(f"🚦 시작 큐 [{job['reason']}] 완료 - 전체 준비까지 {job['fleet_seconds']:.1f}초")
+        job['done'].set()
+
+    def format_report(self, job: dict) -> str:
+        labels = {
+            'queued': '⏳ 대기', 'starting': '🚀 시작 중', 'booting': '🔄 부팅 중',
+            'ready': '✅ 준비', 'failed': '❌ 실패', 'timeout': '⏱️ 시간 초과', 'skipped': '⏭️ 건너뜀'
+        }
+        lines = []
+        for server_id, entry in job['servers'].items():
+            name = (self.server_manager.get_server_config(server_id) or {}).get('name', server_id)
+            line = f"{labels.get(entry['state'], entry['state'])} **{name}**"
+            if entry['seconds'] is not None:
+                line += f" - {entry['seconds']:.1f}초"
+            if entry['message'] and entry['state'] != 'ready':
+                line += f" ({entry['message'].splitlines()[0]})"
+            lines.append(line)
+
+        if job['fleet_seconds'] is not None:
+            lines.append(f"\n⏱️ 전체 준비까지 **{job['fleet_seconds']:.1f}초**")
+        return "\n".join(lines)
+
+    async def close(self):
+        for task in self._workers + list(self._waiters):
+            task.cancel()
+        self._workers = []
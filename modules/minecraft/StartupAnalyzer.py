@@ -0,0 +1,209 @@
+"""
+서버 시작 로그 분석 + 시작 시간 회귀 감지
+경로: modules/minecraft/StartupAnalyzer.py
+
+시작할 때마다 logs/latest.log에서
+- `Done (12.345s)!` (서버가 보고한 시작 시간)
+- 플러그인별 로딩/활성화 시간: `[이름] Loading ...` / `[이름] Enabling ...` 줄의 시각 차이
+- 단계별 시간: 부트스트랩(모드 로딩 포함) → 월드 준비(`Preparing level`) → Done
+을 구해 시작 기록에 저장합니다.
+
+업그레이드/플러그인 추가는 변경 기록으로 남겨 다음 시작 기록에 붙이고,
+이전 시작들의 중앙값보다 크게 느려지면 가장 많이 늘어난 구성 요소를 찾아 알립니다.
+"""
+
+import json
+import os
+import re
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+_TIMESTAMP = re.compile(r'^\[(\d{2}):(\d{2}):(\d{2})')
+_DONE = re.compile(r'Done \(([\d.]+)s\)!')
+_PLUGIN = re.compile(r'\]:? \[([^\]]+)\] (Loading|Enabling) ')
+_PREPARING = re.compile(r'Preparing (?:level|start region)')
+
+
+class StartupAnalyzer:
+    """시작 로그 분석 + 회귀 감지"""
+
+    BASELINE_RUNS = 5  # 비교할 이전 시작 수
+    MIN_REGRESSION_SECONDS = 3  # 이보다 작은 증가는 무시
+    MIN_COMPONENT_SECONDS = 1
+
+    def __init__(self, changes_file: Path, threshold: float = 0.25):
+        """
+        Args:
+            changes_file: 업그레이드/플러그인 추가 기록 (다음 시작 기록에 붙임)
+            threshold: 이전 중앙값 대비 이 비율 이상 느려지면 회귀
+        """
+        self.changes_file = changes_file
+        self.threshold = threshold
+
+        # 회귀 알림 (server_id, regression dict → 디스코드 전송)
+        self.notify: Optional[Callable[[str, dict], Awaitable]] = None
+
+    # ========================================
+    # 로그 분석
+    # ========================================
+
+    @staticmethod
+    def find_done(log_file: Path, since: float) -> Optional[float]:
+        """이번 실행의 latest.log에 Done 줄이 있으면 서버가 보고한 시작 시간 (블로킹)"""
+        try:
+            if log_file.stat().st_mtime < since:
+                return None
+            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    match = _DONE.search(line)
+                    if match:
+                        return float(match.group(1))
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def parse(log_file: Path, modded: bool = False) -> dict:
+        """
+        시작 로그 → 단계/플러그인별 시간 (블로킹, 로그 시각은 초 단위)
+
+        Returns:
+            {'jvm_done_seconds': float | None,
+             'components': {'phase:bootstrap': 초, 'phase:world': 초, 'plugin:이름': 초, ...}}
+        """
+        markers = []  # [(초, 종류, 이름)]
+        jvm_done = None
+        first = None
+        day_offset = 0
+        previous = None
+
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                stamp = _TIMESTAMP.match(line)
+                if not stamp:
+                    continue
+                seconds = int(stamp.group(1)) * 3600 + int(stamp.group(2)) * 60 + int(stamp.group(3))
+                if previous is not None and seconds + day_offset < previous:
+                    day_offset += 86400  # 자정 넘김
+                seconds += day_offset
+                previous = seconds
+                if first is None:
+                    first = seconds
+
+                done = _DONE.search(line)
+                if done:
+                    jvm_done = float(done.group(1))
+                    markers.append((seconds, 'done', None))
+                    break
+
+                plugin = _PLUGIN.search(line)
+                if plugin:
+                    markers.append((seconds, 'plugin', plugin.group(1)))
+                elif _PREPARING.search(line) and not any(kind == 'world' for _, kind, _ in markers):
+                    markers.append((seconds, 'world', None))
+
+        components: Dict[str, float] = {}
+        world = next((t for t, kind, _ in markers if kind == 'world'), None)
+        done_at = next((t for t, kind, _ in markers if kind == 'done'), None)
+
+        if first is not None and world is not None:
+            components['phase:mods' if modded else 'phase:bootstrap'] = world - first
+        if world is not None and done_at is not None:
+            components['phase:world'] = done_at - world
+
+        # 플러그인: 다음 표시 줄까지 걸린 시간 (Loading + Enabling 합산)
+        for index, (at, kind, name) in enumerate(markers[:-1]):
+            if kind == 'plugin':
+                key = f'plugin:{name}'
+                components[key] = components.get(key, 0) + (markers[index + 1][0] - at)
+
+        return {'jvm_done_seconds': jvm_done, 'components': components}
+
+    # ========================================
+    # 변경 기록 (업그레이드 / 플러그인 추가)
+    # ========================================
+
+    def _load_changes(self) -> dict:
+        if not self.changes_file.exists():
+            return {}
+        try:
+            with open(self.changes_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_changes(self, changes: dict):
+        try:
+            tmp_file = self.changes_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(changes, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.changes_file)
+        except Exception as e:
+            print(f"⚠️ 변경 기록 저장 실패: {e}")
+
+    def record_change(self, server_id: str, kind: str, detail: str):
+        """업그레이드/플러그인 추가 기록 (다음 시작 기록에 붙음)"""
+        changes = self._load_changes()
+        changes.setdefault(server_id, []).append({
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'kind': kind,
+            'detail': detail
+        })
+        self._save_changes(changes)
+
+    def take_changes(self, server_id: str) -> List[dict]:
+        """마지막 시작 이후 변경 (꺼내면 삭제)"""
+        changes = self._load_changes()
+        pending = changes.pop(server_id, [])
+        if pending:
+            self._save_changes(changes)
+        return pending
+
+    # ========================================
+    # 회귀 감지
+    # ========================================
+
+    def find_regression(self, history: List[dict], record: dict) -> Optional[dict]:
+        """
+        이전 시작들의 중앙값과 비교
+
+        Returns:
+            {'seconds', 'baseline', 'increase_percent', 'grown': [(구성 요소, 증가 초)], 'changes'}
+            (회귀가 아니면 None)
+        """
+        previous = [r for r in history if r.get('done_seconds')][-self.BASELINE_RUNS:]
+        current = record.get('done_seconds')
+        if not current or len(previous) < 2:
+            return None
+
+        baseline = statistics.median(r['done_seconds'] for r in previous)
+        if current < baseline * (1 + self.threshold) or current - baseline < self.MIN_REGRESSION_SECONDS:
+            return None
+
+        grown = []
+        for name, seconds in (record.get('components') or {}).items():
+            before = statistics.median((r.get('components') or {}).get(name, 0) for r in previous)
+            if seconds - before >= self.MIN_COMPONENT_SECONDS:
+                grown.append((name, seconds - before))
+        grown.sort(key=lambda item: item[1], reverse=True)
+
+        return {
+            'seconds': current,
+            'baseline': baseline,
+            'increase_percent': (current / baseline - 1) * 100,
+            'grown': grown[:5],
+            'changes': record.get('changes', [])
+        }
+
+    @staticmethod
+    def component_label(name: str) -> str:
+        labels = {
+            'phase:bootstrap': '부트스트랩 (플러그인 로딩 포함)',
+            'phase:mods': '모드 로딩',
+            'phase:world': '월드 준비'
+        }
+        if name in labels:
+            return labels[name]
+        return f"플러그인 {name.split(':', 1)[1]}" if name.startswith('plugin:') else name
@@ -10,7 +10,33 @@ from .ServerConfigurator import ServerConfigurator
 from .RconClient import RconClient
 from .ScreenManager import ScreenManager, TerminalLauncher
 from .PortManager import PortManager
-from .ServerCoreManager import ServerCoreManager
+from .ServerCoreManager import ServerCoreManager, CoreUpdateJob
+from .MetadataCache import MetadataCache
+from .JarDownloader import JarDownloader
+from .HttpClient import HttpClient
+from .DownloadQueue import DownloadQueue
+from .BlobStore import BlobStore
+from .SpigotBuildScheduler import SpigotBuildScheduler
+from .CoreCatalog import CoreCatalog, version_key, required_java
+from .ModdedInstaller import ModdedServerInstaller
+from .CoreBundle import CoreBundle
+from .ServerPrewarmer import ServerPrewarmer
+from .JvmProfiles import render_jvm_args, detect_java_version, pins_heap
+from .CdsArchive import CdsArchiveManager
+from .JavaRuntimeManager import JavaRuntimeManager
+from .HsperfReader import HsperfReader
+from .ResourceSampler import ResourceSampler
+from .GcLogAnalyzer import GcLogAnalyzer
+from .MemoryAdmission import MemoryAdmissionController
+from .StartQueue import ServerStartQueue
+from .CrashSupervisor import CrashSupervisor
+from .HangWatchdog import HangWatchdog
+from .JfrProfiler import JfrProfiler
+from .LagDetector import LagDetector
+from .StartupAnalyzer import StartupAnalyzer
+from .CgroupManager import CgroupManager
+from .MaintenanceExecutor import MaintenanceExecutor
+from .PressureMonitor import PressureMonitor
 from .ServerLifecycleManager import ServerLifecycleManager
 from .ServerLifecycleCommands import setup_lifecycle_commands
 
@@ -24,6 +50,37 @@ __all__ = [
     'TerminalLauncher',
     'PortManager',
     'ServerCoreManager',
+    'CoreUpdateJob',
+    'MetadataCache',
+    'JarDownloader',
+    'HttpClient',
+    'DownloadQueue',
+    'BlobStore',
+    'SpigotBuildScheduler',
+    'CoreCatalog',
+    'version_key',
+    'required_java',
+    'ModdedServerInstaller',
+    'CoreBundle',
+    'ServerPrewarmer',
+    'render_jvm_args',
+    'detect_java_version',
+    'pins_heap',
+    'CdsArchiveManager',
+    'JavaRuntimeManager',
+    'HsperfReader',
+    'ResourceSampler',
+    'GcLogAnalyzer',
+    'MemoryAdmissionController',
+    'ServerStartQueue',
+    'CrashSupervisor',
+    'HangWatchdog',
+    'JfrProfiler',
+    'LagDetector',
+    'StartupAnalyzer',
+    'CgroupManager',
+    'MaintenanceExecutor',
+    'PressureMonitor',
     'ServerLifecycleManager',
     'setup_lifecycle_commands'
 ]
\ No newline at end of file
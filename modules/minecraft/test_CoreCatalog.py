@@ -0,0 +1,38 @@
+"""
+CoreCatalog 버전 정렬 / 최소 Java 버전 테스트
+경로: modules/minecraft/test_CoreCatalog.py
+"""
+
+import pytest
+
+from modules.minecraft.CoreCatalog import required_java, version_key
+
+
+def test_version_key_numeric_order():
+    versions = ['1.9', '1.21', '1.20.6', '1.8.9', '1.20.10']
+    assert sorted(versions, key=version_key) == ['1.8.9', '1.9', '1.20.6', '1.20.10', '1.21']
+
+
+def test_version_key_prerelease_below_release():
+    assert version_key('1.21-pre1') < version_key('1.21')
+    assert version_key('1.21-rc1') < version_key('1.21')
+    assert version_key('1.21') < version_key('1.21.1-pre1')
+
+
+def test_version_key_suffix_number_is_numeric():
+    versions = ['1.21-pre10', '1.21-pre2', '1.21-rc1', '1.21-pre1']
+    assert sorted(versions, key=version_key) == ['1.21-pre1', '1.21-pre2', '1.21-pre10', '1.21-rc1']
+
+
+@pytest.mark.parametrize('version, java', [
+    ('1.12.2', 8),
+    ('1.16.5', 8),
+    ('1.17.1', 16),
+    ('1.18', 17),
+    ('1.20.4', 17),
+    ('1.20.5', 21),
+    ('1.21.1', 21),
+    ('1.21-pre1', 21),
+])
+def test_required_java(version, java):
+    assert required_java(version) == java
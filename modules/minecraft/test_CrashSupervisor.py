@@ -0,0 +1,52 @@
+"""
+크래시 시그니처 테스트
+경로: modules/minecraft/test_CrashSupervisor.py
+"""
+
+from modules.minecraft.CrashSupervisor import CrashSupervisor
+
+REPORT = """---- Minecraft Crash Report ----
+// Who set us up the TNT?
+
+Time: {time}
+Description: Ticking entity
+
+java.lang.NullPointerException: Cannot invoke "Entity.tick()" because "entity" is null
+\tat net.minecraft.world.level.Level.tickEntity(Level.java:512)
+\tat net.minecraft.server.level.ServerLevel.tick(ServerLevel.java:300)
+"""
+
+
+def test_signature_from_crash_report():
+    signature = CrashSupervisor._signature(REPORT.format(time='2024-05-01 12:00:00'), [])
+    assert signature == (
+        'Ticking entity | NullPointerException: Cannot invoke "Entity.tick()" because "entity" is null'
+        ' | at net.minecraft.world.level.Level.tickEntity(Level.java:512)'
+    )
+
+
+def test_signature_is_stable_across_reports():
+    first = CrashSupervisor._signature(REPORT.format(time='2024-05-01 12:00:00'), [])
+    second = CrashSupervisor._signature(REPORT.format(time='2024-05-02 08:30:00'), [])
+    assert first == second
+
+
+def test_signature_from_log_out_of_memory():
+    tail = [
+        '[12:00:00] [Server thread/INFO]: Saving chunks',
+        '[12:00:01] [Server thread/ERROR]: java.lang.OutOfMemoryError: Java heap space',
+    ]
+    assert CrashSupervisor._signature('', tail) == 'java.lang.OutOfMemoryError'
+
+
+def test_signature_from_last_log_exception():
+    tail = [
+        '[12:00:00] [Server thread/ERROR]: java.lang.IllegalStateException: Chunk not loaded',
+        '[12:00:01] [Server thread/INFO]: Stopping server',
+    ]
+    assert CrashSupervisor._signature('', tail) == 'java.lang.IllegalStateException: Chunk not loaded'
+
+
+def test_signature_without_traces():
+    tail = ['[12:00:00] [Server thread/INFO]: Done (12.3s)!']
+    assert CrashSupervisor._signature('', tail).startswith('로그 없이 종료')
@@ -0,0 +1,84 @@
+"""
+GC 로그 파싱 / 힙 크기 추천 테스트
+경로: modules/minecraft/test_GcLogAnalyzer.py
+"""
+
+import pytest
+
+from modules.minecraft.GcLogAnalyzer import GcLogAnalyzer
+
+
+def _stats(live_set_mb, full_gcs=0, gc_time_percent=None):
+    return {
+        'live_set_mb': live_set_mb,
+        'live_set_source': 'test',
+        'full_gcs': full_gcs,
+        'gc_time_percent': gc_time_percent,
+        'alloc_rate_mb_s': None
+    }
+
+
+def test_parse_line_g1_pause():
+    line = ('[2024-05-01T12:00:00.123+0900][12.345s][info][gc] GC(12) Pause Young (Normal) '
+            '(G1 Evacuation Pause) 512M->128M(4096M) 12.345ms')
+    event = GcLogAnalyzer.parse_line(line)
+    assert event['uptime'] == pytest.approx(12.345)
+    assert event['name'] == 'Pause Young (Normal) (G1 Evacuation Pause)'
+    assert event['before'] == 512
+    assert event['after'] == 128
+    assert event['capacity'] == 4096
+    assert event['pause_ms'] == pytest.approx(12.345)
+
+
+def test_parse_line_generational_zgc_is_not_a_pause():
+    line = '[88.100s][info][gc] GC(40) Major Collection (Allocation Rate) 1024M(25%)->256M(6%) 1.234s'
+    event = GcLogAnalyzer.parse_line(line)
+    assert event['name'] == 'Major Collection (Allocation Rate)'
+    assert event['before'] == 1024
+    assert event['after'] == 256
+    assert event['capacity'] is None
+    assert event['pause_ms'] is None
+
+
+def test_parse_line_units():
+    event = GcLogAnalyzer.parse_line('[1.000s][info][gc] GC(0) Pause Full (System.gc()) 2G->512K(4G) 1.5s')
+    assert event['before'] == 2048
+    assert event['after'] == pytest.approx(0.5)
+    assert event['pause_ms'] == pytest.approx(1500)
+
+
+def test_parse_line_ignores_other_lines():
+    assert GcLogAnalyzer.parse_line('[0.010s][info][gc] Using G1') is None
+    assert GcLogAnalyzer.parse_line('') is None
+
+
+def test_recommend_pins_heap_for_aikar():
+    result = GcLogAnalyzer.recommend(_stats(1024, gc_time_percent=1), {'min': 1024, 'max': 2048}, 'aikar-g1')
+    assert result['changed']
+    assert result['max'] == 3072
+    assert result['min'] == 3072
+
+
+def test_recommend_unknown_profile_pins_heap_like_render_jvm_args():
+    result = GcLogAnalyzer.recommend(_stats(1024), {'min': 1024, 'max': 2048}, 'custom')
+    assert result['min'] == result['max']
+
+
+def test_recommend_low_mem_keeps_smaller_min():
+    result = GcLogAnalyzer.recommend(_stats(1024), {'min': 1024, 'max': 2048}, 'low-mem')
+    assert result['max'] == 3072
+    assert result['min'] == 1536
+
+
+def test_recommend_full_gc_grows_and_respects_host_limit():
+    result = GcLogAnalyzer.recommend(_stats(512, full_gcs=2), {'min': 1024, 'max': 4096})
+    assert result['max'] == 5120
+
+    limited = GcLogAnalyzer.recommend(_stats(512, full_gcs=2), {'min': 1024, 'max': 4096}, host_total_mb=4096)
+    assert limited['max'] == 3072
+
+
+def test_recommend_small_change_keeps_current():
+    result = GcLogAnalyzer.recommend(_stats(1365), {'min': 1024, 'max': 4096}, 'aikar-g1')
+    assert not result['changed']
+    assert result == {'min': 1024, 'max': 4096, 'reasons': result['reasons'], 'changed': False}
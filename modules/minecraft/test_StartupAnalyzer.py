@@ -0,0 +1,76 @@
+"""
+시작 로그 분석 / 시작 시간 회귀 감지 테스트
+경로: modules/minecraft/test_StartupAnalyzer.py
+"""
+
+import pytest
+
+from modules.minecraft.StartupAnalyzer import StartupAnalyzer
+
+PAPER_LOG = """\
+[12:00:00] [ServerMain/INFO]: Environment: Environment[sessionHost=https://sessionserver.mojang.com]
+[12:00:02] [Server thread/INFO]: Starting minecraft server version 1.20.4
+[12:00:05] [Server thread/INFO]: [WorldEdit] Loading WorldEdit v7.3.0
+[12:00:07] [Server thread/INFO]: [Essentials] Loading Essentials v2.20.1
+[12:00:08] [Server thread/INFO]: Preparing level "world"
+[12:00:09] [Server thread/INFO]: [WorldEdit] Enabling WorldEdit v7.3.0
+[12:00:12] [Server thread/INFO]: [Essentials] Enabling Essentials v2.20.1
+[12:00:14] [Server thread/INFO]: Done (13.210s)! For help, type "help"
+[12:00:20] [Server thread/INFO]: [WorldEdit] Loading late message
+"""
+
+
+def _record(done, **components):
+    return {'done_seconds': done, 'components': {f'plugin:{k}': v for k, v in components.items()}}
+
+
+def test_parse_phases_and_plugins(tmp_path):
+    log_file = tmp_path / 'latest.log'
+    log_file.write_text(PAPER_LOG, encoding='utf-8')
+
+    result = StartupAnalyzer.parse(log_file)
+
+    assert result['jvm_done_seconds'] == pytest.approx(13.21)
+    assert result['components'] == {
+        'phase:bootstrap': 8,
+        'phase:world': 6,
+        'plugin:WorldEdit': 5,  # Loading 2초 + Enabling 3초
+        'plugin:Essentials': 3,  # Loading 1초 + Enabling 2초
+    }
+
+
+def test_parse_across_midnight_modded(tmp_path):
+    log_file = tmp_path / 'latest.log'
+    log_file.write_text(
+        "[23:59:58] [main/INFO]: ModLauncher running\n"
+        "[00:00:03] [Server thread/INFO]: Preparing level \"world\"\n"
+        "[00:00:05] [Server thread/INFO]: Done (7.000s)! For help, type \"help\"\n",
+        encoding='utf-8'
+    )
+
+    result = StartupAnalyzer.parse(log_file, modded=True)
+
+    assert result['components'] == {'phase:mods': 5, 'phase:world': 2}
+
+
+def test_find_regression_reports_grown_components(tmp_path):
+    analyzer = StartupAnalyzer(tmp_path / 'changes.json')
+    history = [_record(20, WorldEdit=5), _record(21, WorldEdit=5), _record(22, WorldEdit=6)]
+    record = dict(_record(30, WorldEdit=12), changes=[{'kind': 'plugin', 'detail': 'WorldEdit'}])
+
+    regression = analyzer.find_regression(history, record)
+
+    assert regression['baseline'] == 21
+    assert regression['increase_percent'] == pytest.approx(42.857, rel=1e-3)
+    assert regression['grown'] == [('plugin:WorldEdit', 7)]
+    assert regression['changes'] == record['changes']
+
+
+@pytest.mark.parametrize('history, done', [
+    ([_record(20), _record(21), _record(22)], 25),  # 25% 미만
+    ([_record(20)], 40),  # 비교할 기록 부족
+    ([_record(4), _record(4), _record(4)], 6),  # 비율은 크지만 3초 미만
+])
+def test_find_regression_ignores_small_or_unknown(tmp_path, history, done):
+    analyzer = StartupAnalyzer(tmp_path / 'changes.json')
+    assert analyzer.find_regression(history, _record(done)) is None